@@ -147,6 +147,11 @@ def get_arguments() -> argparse.Namespace:
         action="store_true",
         help="Skips validation of operating system",
     )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Print the import and setup times of the last startup and exit",
+    )
 
     return parser.parse_args()
 
@@ -183,6 +188,13 @@ def main() -> int:
         return scripts.run(args.script)
 
     config_dir = os.path.abspath(os.path.join(os.getcwd(), args.config))
+    if args.startup_report:
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.startup_profile import startup_report
+
+        print(startup_report(config_dir))
+        return 0
+
     if restore_backup(config_dir):
         return RESTART_EXIT_CODE
 
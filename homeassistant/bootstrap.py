@@ -85,6 +85,7 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_profile,
     template,
     translation,
 )
@@ -515,6 +516,11 @@ async def async_from_config_dict(
 
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
+    hass.async_create_background_task(
+        startup_profile.async_save_startup_profile(hass, stop - start),
+        "save startup profile",
+        eager_start=True,
+    )
 
     if (
         REQUIRED_NEXT_PYTHON_HA_RELEASE
@@ -879,6 +885,22 @@ async def _async_resolve_domains_to_setup(
         eager_start=True,
     )
 
+    # Import the integrations which were slow to import on the last start
+    # in the background so they are imported by the time they are set up.
+    hass.async_create_background_task(
+        startup_profile.async_pre_import_integrations(
+            hass,
+            {
+                domain: integration
+                for domain in domains_to_setup
+                if (integration := integration_cache.get(domain)) is not None
+            },
+            STAGE_1_INTEGRATIONS,
+        ),
+        "pre-import integrations",
+        eager_start=True,
+    )
+
     return domains_to_setup, integration_cache
 
 
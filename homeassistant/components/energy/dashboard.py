@@ -0,0 +1,322 @@
+"""Plan and cache the statistics shown on the energy dashboard."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Literal
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.statistics import StatisticsRow
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .data import EnergyPreferences
+
+type StatisticsPeriod = Literal["5minute", "hour", "day", "week", "month"]
+type StatisticsType = Literal[
+    "change", "last_reset", "max", "mean", "min", "state", "sum"
+]
+type _CacheKey = tuple[
+    str,
+    StatisticsPeriod,
+    frozenset[StatisticsType],
+    tuple[tuple[str, str], ...],
+]
+
+# The number of statistics kept in the cache, each for one period, set of
+# types and units; the oldest are dropped first
+MAX_CACHED_STATISTICS = 512
+
+_PERIOD_SECONDS: dict[StatisticsPeriod, int] = {"5minute": 300, "hour": 3600}
+_PERIOD_FACTORIES = {
+    "day": recorder.statistics.reduce_day_ts_factory,
+    "week": recorder.statistics.reduce_week_ts_factory,
+    "month": recorder.statistics.reduce_month_ts_factory,
+}
+
+
+def dashboard_statistic_ids(
+    prefs: EnergyPreferences, cost_sensors: dict[str, str]
+) -> set[str]:
+    """Return the ids of the statistics the energy dashboard shows.
+
+    Energy sources without a cost statistic use the cost sensor the
+    energy integration created for them, if any.
+    """
+    statistic_ids: set[str] = set()
+
+    def _add_with_cost(stat_energy: str, stat_cost: str | None) -> None:
+        statistic_ids.add(stat_energy)
+        if stat_cost := stat_cost or cost_sensors.get(stat_energy):
+            statistic_ids.add(stat_cost)
+
+    for source in prefs["energy_sources"]:
+        if source["type"] == "grid":
+            for flow_from in source["flow_from"]:
+                _add_with_cost(
+                    flow_from["stat_energy_from"], flow_from.get("stat_cost")
+                )
+            for flow_to in source["flow_to"]:
+                _add_with_cost(
+                    flow_to["stat_energy_to"], flow_to.get("stat_compensation")
+                )
+        elif source["type"] == "battery":
+            statistic_ids.add(source["stat_energy_from"])
+            statistic_ids.add(source["stat_energy_to"])
+        elif source["type"] == "solar":
+            statistic_ids.add(source["stat_energy_from"])
+        else:
+            _add_with_cost(source["stat_energy_from"], source.get("stat_cost"))
+
+    statistic_ids.update(
+        device["stat_consumption"] for device in prefs["device_consumption"]
+    )
+    return statistic_ids
+
+
+def grid_consumption_statistic_ids(prefs: EnergyPreferences) -> list[str]:
+    """Return the ids of the statistics of energy consumed from the grid."""
+    return [
+        flow_from["stat_energy_from"]
+        for source in prefs["energy_sources"]
+        if source["type"] == "grid"
+        for flow_from in source["flow_from"]
+    ]
+
+
+def _period_start(timestamp: float, period: StatisticsPeriod) -> float:
+    """Return the start of the period a timestamp is in."""
+    if seconds := _PERIOD_SECONDS.get(period):
+        return timestamp - timestamp % seconds
+    _, period_start_end = _PERIOD_FACTORIES[period]()
+    return period_start_end(timestamp)[0]
+
+
+@dataclass(slots=True)
+class _CachedStatistics:
+    """Statistics of completed periods covering start_ts to end_ts."""
+
+    start_ts: float
+    end_ts: float
+    rows: list[StatisticsRow]
+
+
+@dataclass(slots=True)
+class _PlannedStatistics:
+    """Statistics to fetch for a statistic id and what the cache has."""
+
+    key: _CacheKey
+    cached: _CachedStatistics | None
+    fetch_start_ts: float
+
+
+class EnergyStatisticsCache:
+    """Cache the statistics of completed periods.
+
+    Statistics of periods which have ended and have been compiled by the
+    recorder only change if they are imported or adjusted, in which case
+    the recorder bumps its statistics generation and the cache is cleared.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._statistics: dict[_CacheKey, _CachedStatistics] = {}
+        self._generation: int | None = None
+        self._time_zone: str | None = None
+
+    @callback
+    def async_validate(self, generation: int, time_zone: str) -> None:
+        """Clear the cache if the statistics or the time zone changed."""
+        if generation != self._generation or time_zone != self._time_zone:
+            self._statistics.clear()
+            self._generation = generation
+            self._time_zone = time_zone
+
+    @callback
+    def async_get(self, key: _CacheKey) -> _CachedStatistics | None:
+        """Return the cached statistics for a key."""
+        return self._statistics.get(key)
+
+    @callback
+    def async_set(self, key: _CacheKey, statistics: _CachedStatistics) -> None:
+        """Cache the statistics for a key."""
+        self._statistics.pop(key, None)
+        if len(self._statistics) >= MAX_CACHED_STATISTICS:
+            del self._statistics[next(iter(self._statistics))]
+        self._statistics[key] = statistics
+
+
+DATA_STATISTICS_CACHE: HassKey[EnergyStatisticsCache] = HassKey(
+    f"{DOMAIN}_statistics_cache"
+)
+
+
+@dataclass(slots=True, frozen=True)
+class StatisticsQuery:
+    """Statistics to get in a period, with units and types."""
+
+    statistic_ids: set[str]
+    period: StatisticsPeriod
+    units: dict[str, str] | None
+    types: set[StatisticsType]
+
+
+@dataclass(slots=True)
+class _PlannedQuery:
+    """A query with the statistics the cache has and the ranges to fetch."""
+
+    query: StatisticsQuery
+    planned: list[_PlannedStatistics]
+    fetches: dict[tuple[float, float], set[str]]
+    cacheable: bool
+    complete_end_ts: float
+
+
+def _fetch_statistics(
+    hass: HomeAssistant, planned_queries: list[_PlannedQuery]
+) -> list[dict[str, list[StatisticsRow]]]:
+    """Fetch the statistics of all queries for their time ranges."""
+    results: list[dict[str, list[StatisticsRow]]] = []
+    for planned_query in planned_queries:
+        query = planned_query.query
+        result: dict[str, list[StatisticsRow]] = {}
+        for (start_ts, end_ts), statistic_ids in planned_query.fetches.items():
+            result.update(
+                recorder.statistics.statistics_during_period(
+                    hass,
+                    dt_util.utc_from_timestamp(start_ts),
+                    dt_util.utc_from_timestamp(end_ts),
+                    statistic_ids,
+                    query.period,
+                    query.units,
+                    query.types,
+                )
+            )
+        results.append(result)
+    return results
+
+
+def _plan_query(
+    cache: EnergyStatisticsCache,
+    query: StatisticsQuery,
+    start_ts: float,
+    end_ts: float,
+    compiled_until_ts: float,
+) -> _PlannedQuery:
+    """Plan which statistics of a query are fetched and which are cached."""
+    period = query.period
+    cacheable = _period_start(start_ts, period) == start_ts
+    frozen_types = frozenset(query.types)
+    frozen_units = tuple(sorted(query.units.items())) if query.units else ()
+    planned: list[_PlannedStatistics] = []
+    fetches: dict[tuple[float, float], set[str]] = {}
+    for statistic_id in query.statistic_ids:
+        key = (statistic_id, period, frozen_types, frozen_units)
+        cached = cache.async_get(key) if cacheable else None
+        if cached is not None and not cached.start_ts <= start_ts <= cached.end_ts:
+            cached = None
+        fetch_start_ts = start_ts if cached is None else max(start_ts, cached.end_ts)
+        planned.append(_PlannedStatistics(key, cached, fetch_start_ts))
+        if fetch_start_ts < end_ts:
+            fetches.setdefault((fetch_start_ts, end_ts), set()).add(statistic_id)
+    return _PlannedQuery(
+        query,
+        planned,
+        fetches,
+        cacheable,
+        _period_start(min(end_ts, compiled_until_ts), period),
+    )
+
+
+def _merge_query(
+    cache: EnergyStatisticsCache,
+    planned_query: _PlannedQuery,
+    fetched: dict[str, list[StatisticsRow]],
+    start_ts: float,
+    end_ts: float,
+    cacheable: bool,
+) -> dict[str, list[StatisticsRow]]:
+    """Merge the fetched statistics of a query with the cache and cache them."""
+    complete_end_ts = planned_query.complete_end_ts
+    result: dict[str, list[StatisticsRow]] = {}
+    for plan in planned_query.planned:
+        statistic_id = plan.key[0]
+        rows = fetched.get(statistic_id, [])
+        if (cached := plan.cached) is not None:
+            rows = [
+                row for row in cached.rows if start_ts <= row["start"] < end_ts
+            ] + rows
+        if rows:
+            result[statistic_id] = rows
+        if not cacheable or complete_end_ts <= plan.fetch_start_ts:
+            continue
+        complete_rows = [
+            row
+            for row in rows
+            if row["start"] >= plan.fetch_start_ts and row["end"] <= complete_end_ts
+        ]
+        if cached is not None:
+            if cached.end_ts != plan.fetch_start_ts:
+                # Another request extended the cached statistics meanwhile
+                continue
+            cached.rows.extend(complete_rows)
+            cached.end_ts = complete_end_ts
+        else:
+            cache.async_set(
+                plan.key, _CachedStatistics(start_ts, complete_end_ts, complete_rows)
+            )
+    return result
+
+
+async def async_get_statistics(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime,
+    queries: list[StatisticsQuery],
+) -> list[dict[str, list[StatisticsRow]]]:
+    """Return the statistics of queries during a period, reusing cached periods.
+
+    Only the periods which are not in the cache are fetched from the
+    database, for all queries in one executor job. The cache is only used
+    for a query if start_time is the start of one of its periods. The
+    returned rows may be shared with the cache and must not be modified.
+    """
+    instance = recorder.get_instance(hass)
+    cache = hass.data[DATA_STATISTICS_CACHE]
+    generation = instance.statistics_generation
+    cache.async_validate(generation, hass.config.time_zone)
+
+    start_ts = start_time.timestamp()
+    end_ts = end_time.timestamp()
+    # The statistics of an hour are compiled shortly after it ended,
+    # periods ending before the previous hour are complete
+    compiled_until = dt_util.utcnow().replace(
+        minute=0, second=0, microsecond=0
+    ) - timedelta(hours=1)
+    planned_queries = [
+        _plan_query(cache, query, start_ts, end_ts, compiled_until.timestamp())
+        for query in queries
+    ]
+
+    fetched: list[dict[str, list[StatisticsRow]]] = [{} for _ in planned_queries]
+    if any(planned_query.fetches for planned_query in planned_queries):
+        fetched = await instance.async_add_read_executor_job(
+            _fetch_statistics, hass, planned_queries
+        )
+    # Do not cache what was fetched if the statistics changed meanwhile
+    unchanged = generation == instance.statistics_generation
+
+    return [
+        _merge_query(
+            cache,
+            planned_query,
+            query_fetched,
+            start_ts,
+            end_ts,
+            unchanged and planned_query.cacheable,
+        )
+        for planned_query, query_fetched in zip(planned_queries, fetched, strict=True)
+    ]
@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import recorder, websocket_api
 from homeassistant.components.recorder.statistics import StatisticsRow
+from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.integration_platform import (
@@ -23,6 +24,14 @@ from homeassistant.helpers.singleton import singleton
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .dashboard import (
+    DATA_STATISTICS_CACHE,
+    EnergyStatisticsCache,
+    StatisticsQuery,
+    async_get_statistics,
+    dashboard_statistic_ids,
+    grid_consumption_statistic_ids,
+)
 from .data import (
     DEVICE_CONSUMPTION_SCHEMA,
     ENERGY_SOURCE_SCHEMA,
@@ -52,6 +61,8 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate)
     websocket_api.async_register_command(hass, ws_solar_forecast)
     websocket_api.async_register_command(hass, ws_get_fossil_energy_consumption)
+    websocket_api.async_register_command(hass, ws_get_dashboard_data)
+    hass.data[DATA_STATISTICS_CACHE] = EnergyStatisticsCache()
 
 
 @singleton("energy_platforms")
@@ -236,6 +247,121 @@ async def ws_solar_forecast(
     connection.send_result(msg["id"], forecasts)
 
 
+def _combine_change_statistics(
+    stats: dict[str, list[StatisticsRow]], statistic_ids: list[str]
+) -> dict[float, float]:
+    """Combine multiple statistics, returns a dict indexed by start time."""
+    result: defaultdict[float, float] = defaultdict(float)
+
+    for statistics_id, stat in stats.items():
+        if statistics_id not in statistic_ids:
+            continue
+        for period in stat:
+            if period["change"] is None:
+                continue
+            result[period["start"]] += period["change"]
+
+    return {key: result[key] for key in sorted(result)}
+
+
+def _reduce_deltas(
+    stat_list: list[dict[str, Any]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+) -> list[dict[str, Any]]:
+    """Reduce hourly deltas to daily or monthly deltas."""
+    result: list[dict[str, Any]] = []
+    deltas: list[float] = []
+    if not stat_list:
+        return result
+    prev_stat: dict[str, Any] = stat_list[0]
+    fake_stat = {"start": stat_list[-1]["start"] + period.total_seconds()}
+
+    # Loop over the hourly deltas + a fake entry to end the period
+    for statistic in chain(stat_list, (fake_stat,)):
+        if not same_period(prev_stat["start"], statistic["start"]):
+            start, _ = period_start_end(prev_stat["start"])
+            # The previous statistic was the last entry of the period
+            result.append(
+                {
+                    "start": dt_util.utc_from_timestamp(start).isoformat(),
+                    "delta": sum(deltas),
+                }
+            )
+            deltas = []
+        if statistic.get("delta") is not None:
+            deltas.append(statistic["delta"])
+        prev_stat = statistic
+
+    return result
+
+
+def _fossil_energy_consumption(
+    statistics: dict[str, list[StatisticsRow]],
+    energy_statistic_ids: list[str],
+    co2_statistic_id: str,
+    statistics_period: str,
+) -> dict[str, float]:
+    """Calculate the fossil based energy from hourly energy and CO2 statistics."""
+    merged_energy_statistics = _combine_change_statistics(
+        statistics, energy_statistic_ids
+    )
+    indexed_co2_statistics = cast(
+        dict[float, float],
+        {
+            period["start"]: period["mean"]
+            for period in statistics.get(co2_statistic_id, {})
+        },
+    )
+
+    # Calculate amount of fossil based energy, assume 100% fossil if missing
+    fossil_energy = [
+        {"start": start, "delta": delta * indexed_co2_statistics.get(start, 100) / 100}
+        for start, delta in merged_energy_statistics.items()
+    ]
+
+    reduced_fossil_energy: list[dict[str, Any]]
+    if statistics_period == "hour":
+        reduced_fossil_energy = [
+            {
+                "start": dt_util.utc_from_timestamp(period["start"]).isoformat(),
+                "delta": period["delta"],
+            }
+            for period in fossil_energy
+        ]
+
+    elif statistics_period == "day":
+        _same_day_ts, _day_start_end_ts = recorder.statistics.reduce_day_ts_factory()
+        reduced_fossil_energy = _reduce_deltas(
+            fossil_energy,
+            _same_day_ts,
+            _day_start_end_ts,
+            timedelta(days=1),
+        )
+    elif statistics_period == "week":
+        _same_week_ts, _week_start_end_ts = recorder.statistics.reduce_week_ts_factory()
+        reduced_fossil_energy = _reduce_deltas(
+            fossil_energy,
+            _same_week_ts,
+            _week_start_end_ts,
+            timedelta(weeks=1),
+        )
+    else:
+        (
+            _same_month_ts,
+            _month_start_end_ts,
+        ) = recorder.statistics.reduce_month_ts_factory()
+        reduced_fossil_energy = _reduce_deltas(
+            fossil_energy,
+            _same_month_ts,
+            _month_start_end_ts,
+            timedelta(days=1),
+        )
+
+    return {period["start"]: period["delta"] for period in reduced_fossil_energy}
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "energy/fossil_energy_consumption",
@@ -272,7 +398,7 @@ async def ws_get_fossil_energy_consumption(
     statistic_ids.add(msg["co2_statistic_id"])
 
     # Fetch energy + CO2 statistics
-    statistics = await recorder.get_instance(hass).async_add_executor_job(
+    statistics = await recorder.get_instance(hass).async_add_read_executor_job(
         recorder.statistics.statistics_during_period,
         hass,
         start_time,
@@ -283,99 +409,86 @@ async def ws_get_fossil_energy_consumption(
         {"mean", "change"},
     )
 
-    def _combine_change_statistics(
-        stats: dict[str, list[StatisticsRow]], statistic_ids: list[str]
-    ) -> dict[float, float]:
-        """Combine multiple statistics, returns a dict indexed by start time."""
-        result: defaultdict[float, float] = defaultdict(float)
-
-        for statistics_id, stat in stats.items():
-            if statistics_id not in statistic_ids:
-                continue
-            for period in stat:
-                if period["change"] is None:
-                    continue
-                result[period["start"]] += period["change"]
-
-        return {key: result[key] for key in sorted(result)}
-
-    def _reduce_deltas(
-        stat_list: list[dict[str, Any]],
-        same_period: Callable[[float, float], bool],
-        period_start_end: Callable[[float], tuple[float, float]],
-        period: timedelta,
-    ) -> list[dict[str, Any]]:
-        """Reduce hourly deltas to daily or monthly deltas."""
-        result: list[dict[str, Any]] = []
-        deltas: list[float] = []
-        if not stat_list:
-            return result
-        prev_stat: dict[str, Any] = stat_list[0]
-        fake_stat = {"start": stat_list[-1]["start"] + period.total_seconds()}
-
-        # Loop over the hourly deltas + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_stat,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, _ = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                result.append(
-                    {
-                        "start": dt_util.utc_from_timestamp(start).isoformat(),
-                        "delta": sum(deltas),
-                    }
-                )
-                deltas = []
-            if statistic.get("delta") is not None:
-                deltas.append(statistic["delta"])
-            prev_stat = statistic
+    result = _fossil_energy_consumption(
+        statistics, msg["energy_statistic_ids"], msg["co2_statistic_id"], msg["period"]
+    )
+    connection.send_result(msg["id"], result)
 
-        return result
 
-    merged_energy_statistics = _combine_change_statistics(
-        statistics, msg["energy_statistic_ids"]
-    )
-    indexed_co2_statistics = cast(
-        dict[float, float],
-        {
-            period["start"]: period["mean"]
-            for period in statistics.get(msg["co2_statistic_id"], {})
-        },
-    )
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "energy/dashboard_data",
+        vol.Required("start_time"): str,
+        vol.Required("end_time"): str,
+        vol.Required("period"): vol.Any("5minute", "hour", "day", "week", "month"),
+        vol.Optional("units"): UNIT_SCHEMA,
+        vol.Optional("co2_statistic_id"): str,
+    }
+)
+@websocket_api.async_response
+@_ws_with_manager
+async def ws_get_dashboard_data(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    manager: EnergyManager,
+) -> None:
+    """Return the statistics shown on the energy dashboard.
 
-    # Calculate amount of fossil based energy, assume 100% fossil if missing
-    fossil_energy = [
-        {"start": start, "delta": delta * indexed_co2_statistics.get(start, 100) / 100}
-        for start, delta in merged_energy_statistics.items()
-    ]
+    The statistics are planned from the energy preferences and fetched in
+    one go, completed periods are served from a cache.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
 
-    if msg["period"] == "hour":
-        reduced_fossil_energy = [
-            {
-                "start": dt_util.utc_from_timestamp(period["start"]).isoformat(),
-                "delta": period["delta"],
-            }
-            for period in fossil_energy
-        ]
+    if end_time := dt_util.parse_datetime(msg["end_time"]):
+        end_time = dt_util.as_utc(end_time)
+    else:
+        connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+        return
 
-    elif msg["period"] == "day":
-        _same_day_ts, _day_start_end_ts = recorder.statistics.reduce_day_ts_factory()
-        reduced_fossil_energy = _reduce_deltas(
-            fossil_energy,
-            _same_day_ts,
-            _day_start_end_ts,
-            timedelta(days=1),
+    prefs = manager.data or manager.default_preferences()
+    statistic_ids = dashboard_statistic_ids(prefs, hass.data[DOMAIN]["cost_sensors"])
+    queries = [
+        StatisticsQuery(statistic_ids, msg["period"], msg.get("units"), {"change"})
+    ]
+    grid_statistic_ids = grid_consumption_statistic_ids(prefs)
+    if co2_statistic_id := msg.get("co2_statistic_id"):
+        queries.extend(
+            (
+                StatisticsQuery(
+                    set(grid_statistic_ids),
+                    "hour",
+                    {"energy": UnitOfEnergy.KILO_WATT_HOUR},
+                    {"change"},
+                ),
+                StatisticsQuery({co2_statistic_id}, "hour", None, {"mean"}),
+            )
         )
-    else:
-        (
-            _same_month_ts,
-            _month_start_end_ts,
-        ) = recorder.statistics.reduce_month_ts_factory()
-        reduced_fossil_energy = _reduce_deltas(
-            fossil_energy,
-            _same_month_ts,
-            _month_start_end_ts,
-            timedelta(days=1),
+    results = await async_get_statistics(hass, start_time, end_time, queries)
+
+    result: dict[str, Any] = {
+        "statistics": {
+            statistic_id: [
+                {
+                    "start": int(row["start"] * 1000),
+                    "end": int(row["end"] * 1000),
+                    "change": row.get("change"),
+                }
+                for row in rows
+            ]
+            for statistic_id, rows in results[0].items()
+        }
+    }
+    if co2_statistic_id:
+        result["fossil_energy_consumption"] = _fossil_energy_consumption(
+            results[1] | results[2],
+            grid_statistic_ids,
+            co2_statistic_id,
+            # Fossil energy is calculated from hourly statistics
+            "hour" if msg["period"] == "5minute" else msg["period"],
         )
-
-    result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
     connection.send_result(msg["id"], result)
@@ -5,3 +5,9 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# how many hours of history to deliver per message when streaming
+HISTORY_CHUNK_HOURS = 24
+
+# Downsampling keeps up to four states per time bucket
+MIN_MAX_POINTS = 4
@@ -38,7 +38,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_HOURS,
+    MAX_PENDING_HISTORY_STATES,
+    MIN_MAX_POINTS,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,6 +77,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
@@ -88,6 +94,7 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
@@ -103,6 +110,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=MIN_MAX_POINTS)),
     }
 )
 @websocket_api.async_response
@@ -161,7 +169,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -172,6 +180,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -226,6 +235,7 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None = None,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
     states = cast(
@@ -241,6 +251,7 @@ def _generate_historical_response(
             minimal_response,
             no_attributes,
             True,
+            max_points,
         ),
     )
     last_time_ts = 0.0
@@ -281,25 +292,59 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None = None,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    Long periods are fetched and sent in chunks of HISTORY_CHUNK_HOURS,
+    oldest first, so only one chunk is held in memory at a time. The
+    next chunk is only fetched once the client has been sent the
+    previous one. Downsampled history is bounded already and is sent
+    at once.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    chunk = timedelta(hours=HISTORY_CHUNK_HOURS)
+    chunk_start = start_time
+    last_time_dt: dt | None = None
+    while True:
+        chunk_end = (
+            end_time
+            if max_points or end_time - chunk_start <= chunk
+            else chunk_start + chunk
+        )
+        is_last_chunk = chunk_end == end_time
+        (
+            last_time_ts,
+            chunk_last_time_dt,
+            payload,
+        ) = await instance.async_add_read_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            chunk_start,
+            chunk_end,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty and is_last_chunk and last_time_dt is None,
+            max_points,
+        )
+        if payload:
+            connection.send_message(payload)
+        if last_time_ts != 0:
+            last_time_dt = chunk_last_time_dt
+        if is_last_chunk:
+            return last_time_dt
+        await connection.async_wait_send_queue_drained()
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical states
+            return last_time_dt
+        # The chunks overlap by a microsecond since states
+        # exactly at the end of a chunk are not selected
+        chunk_start = chunk_end - timedelta(microseconds=1)
+        include_start_time_state = False
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -409,6 +454,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=MIN_MAX_POINTS)),
     }
 )
 @websocket_api.async_response
@@ -448,6 +494,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
 
     if end_time and end_time <= utc_now:
         if (
@@ -474,6 +521,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            max_points,
         )
         return
 
@@ -538,6 +586,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        max_points,
     )
 
     if msg_id not in connection.subscriptions:
@@ -35,6 +35,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# the largest chunk the older events are delivered in
+BIG_QUERY_MAX_CHUNK_HOURS = 24 * 7
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,10 +89,15 @@ async def _async_send_historical_events(
     """Select historical data from the database and deliver it to the websocket.
 
     If the query is considered a big query we will split the request into
-    two chunks so that they get the recent events first and the select
-    that is expected to take a long time comes in after to ensure
-    they are not stuck at a loading screen and can start looking at
-    the data right away.
+    chunks, newest first, so that they get the recent events first and the
+    selects that are expected to take a long time come in after to ensure
+    they are not stuck at a loading screen and can start looking at the
+    data right away. The first chunk covers BIG_QUERY_RECENT_HOURS and each
+    following chunk is twice as long as the one before, up to
+    BIG_QUERY_MAX_CHUNK_HOURS, to keep the number of selects down for long
+    periods. Only one chunk is held in memory at a time and the next chunk
+    is only selected once the previous one has been written to the
+    websocket.
 
     This function returns the time of the most recent event we sent to the
     websocket.
@@ -119,39 +126,44 @@ async def _async_send_historical_events(
             connection.send_message(message)
         return last_event_time
 
-    # This is a big query so we deliver
-    # the first three hours and then
-    # we fetch the old data
-    recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
-    recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
-        hass,
-        msg_id,
-        recent_query_start,
-        end_time,
-        event_processor,
-        partial=True,
-    )
-    if recent_query_last_event_time:
-        connection.send_message(recent_message)
-
-    older_message, older_query_last_event_time = await _async_get_ws_stream_events(
-        hass,
-        msg_id,
-        start_time,
-        recent_query_start,
-        event_processor,
-        partial,
-    )
-    # If there is no last_event_time, there are no historical
-    # results, but we still send an empty message
-    # if its the last one (not partial) so
-    # consumers of the api know their request was
-    # answered but there were no results
-    if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
-
-    # Returns the time of the newest event
-    return recent_query_last_event_time or older_query_last_event_time
+    big_query = timedelta(hours=BIG_QUERY_HOURS)
+    chunk = timedelta(hours=BIG_QUERY_RECENT_HOURS)
+    max_chunk = timedelta(hours=BIG_QUERY_MAX_CHUNK_HOURS)
+    newest_event_time: dt | None = None
+    chunk_end = end_time
+    while True:
+        # What is left is only split again if it is still a big query
+        if is_oldest_chunk := chunk_end - start_time <= big_query:
+            chunk_start = start_time
+        else:
+            chunk_start = chunk_end - chunk
+        message, last_event_time = await _async_get_ws_stream_events(
+            hass,
+            msg_id,
+            chunk_start,
+            chunk_end,
+            event_processor,
+            partial=partial or not is_oldest_chunk,
+        )
+        newest_event_time = newest_event_time or last_event_time
+        if is_oldest_chunk:
+            # If there is no last_event_time, there are no historical
+            # results, but we still send an empty message
+            # if its the last one (not partial) so
+            # consumers of the api know their request was
+            # answered but there were no results
+            if last_event_time or not partial or force_send:
+                connection.send_message(message)
+            # Returns the time of the newest event
+            return newest_event_time
+        if last_event_time:
+            connection.send_message(message)
+            await connection.async_wait_send_queue_drained()
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical events
+            return newest_event_time
+        chunk_end = chunk_start
+        chunk = min(chunk * 2, max_chunk)
 
 
 async def _async_get_ws_stream_events(
@@ -163,7 +175,7 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -501,7 +513,7 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -22,7 +22,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
@@ -214,6 +214,13 @@ async def async_setup_entry(  # noqa: C901
                             maybe_lru.get_stats(),
                         )
 
+        _LOGGER.critical(
+            "Cache stats for compiled templates: %s of %s used: %s",
+            len(template.COMPILED_TEMPLATE_LRU),
+            template.COMPILED_TEMPLATE_LRU.get_size(),
+            template.COMPILED_TEMPLATE_LRU.get_stats(),
+        )
+
         for lru in objgraph.by_type(_SQLALCHEMY_LRU_OBJECT):
             if (data := getattr(lru, "_data", None)) and isinstance(data, dict):
                 for key, value in dict(data).items():
@@ -38,9 +38,11 @@ from . import (
 )
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
+    DEFAULT_DB_READ_POOL_SIZE,
     DOMAIN,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
+    MAX_DB_READ_POOL_SIZE,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -64,6 +66,8 @@ CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_READ_POOL_SIZE = "db_read_pool_size"
+CONF_PARTITION_STATES = "partition_states"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
@@ -120,6 +124,12 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_DB_READ_POOL_SIZE, default=DEFAULT_DB_READ_POOL_SIZE
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_DB_READ_POOL_SIZE)
+                    ),
+                    vol.Optional(CONF_PARTITION_STATES, default=False): cv.boolean,
                 }
             ),
         )
@@ -149,6 +159,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    db_read_pool_size = conf[CONF_DB_READ_POOL_SIZE]
+    partition_states = conf[CONF_PARTITION_STATES]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -170,6 +182,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        db_read_pool_size=db_read_pool_size,
+        partition_states=partition_states,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -30,11 +30,26 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# Events are spilled to disk instead of being queued in memory
+# once the backlog reaches this size
+SPILL_QUEUE_MIN_BACKLOG = 30000
+SPILL_QUEUE_DIR = ".recorder_spill"
+SPILL_QUEUE_SEGMENT_SIZE = 16 * 1024**2
+SPILL_QUEUE_MAX_SIZE = 1024**3
+# The maximum number of spilled events recorded per drain task
+SPILL_QUEUE_DRAIN_BATCH_SIZE = 1000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 DEFAULT_MAX_BIND_VARS = 4000
 
+EVENT_RECORDER_PURGE_PROGRESS = "recorder_purge_progress"
+
 DB_WORKER_PREFIX = "DbWorker"
+DB_READER_PREFIX = "DbReader"
+
+DEFAULT_DB_READ_POOL_SIZE = 4
+MAX_DB_READ_POOL_SIZE = 16
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -48,6 +63,7 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 49
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 LEGACY_STATES_EVENT_FOREIGN_KEYS_FIXED_SCHEMA_VERSION = 43
@@ -6,7 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable
 from concurrent.futures import CancelledError
 import contextlib
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 import logging
 import queue
 import sqlite3
@@ -16,7 +16,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache.api import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -26,6 +33,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_STATE_CHANGED,
@@ -39,6 +47,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -50,9 +59,11 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
-from . import migration, statistics
+from . import migration, partitions, statistics
 from .const import (
+    DB_READER_PREFIX,
     DB_WORKER_PREFIX,
+    DEFAULT_DB_READ_POOL_SIZE,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -63,6 +74,10 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPILL_QUEUE_DIR,
+    SPILL_QUEUE_DRAIN_BATCH_SIZE,
+    SPILL_QUEUE_MAX_SIZE,
+    SPILL_QUEUE_MIN_BACKLOG,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -81,6 +96,8 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeScheduler
+from .spill_queue import SpillQueue
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -96,11 +113,15 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    DrainSpillQueueTask,
+    EventBatchTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    StatesPartitionsTask,
+    StatisticsRollupsCheckTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -117,12 +138,21 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Columns copied as is from the Events objects when inserting in bulk,
+# the foreign keys are resolved from the relationships instead.
+_EVENTS_BULK_INSERT_COLUMNS = tuple(
+    column.key
+    for column in Events.__table__.columns
+    if column.key not in ("event_id", "event_type_id", "data_id")
+)
+
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 
 # Controls how often we clean up
@@ -148,6 +178,19 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
 
+def _timed_read_job[_T](target: Callable[..., _T], *args: Any) -> _T:
+    """Run a read only query job and log how long it took."""
+    start = time.monotonic()
+    try:
+        return target(*args)
+    finally:
+        _LOGGER.debug(
+            "Read query %s took %.3f seconds",
+            getattr(target, "__name__", target),
+            time.monotonic() - start,
+        )
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -165,6 +208,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        db_read_pool_size: int = DEFAULT_DB_READ_POOL_SIZE,
+        partition_states: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -179,6 +224,9 @@ class Recorder(threading.Thread):
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        # Events are written ahead to disk instead of the queue
+        # when the backlog grows past SPILL_QUEUE_MIN_BACKLOG
+        self._spill_queue = SpillQueue(hass.config.path(SPILL_QUEUE_DIR))
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -204,6 +252,10 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # States and events are inserted in bulk with Core inserts
+        # instead of being flushed one by one by the ORM unit of work
+        self._bulk_insert_states = False
+        self._pending_event_inserts: list[Events] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -212,6 +264,7 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.purge_scheduler = PurgeScheduler()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -221,6 +274,23 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        # History, logbook and statistics queries run on their own
+        # executor so they do not queue behind other database jobs
+        self.db_read_pool_size = db_read_pool_size
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        # SQLite connections are per thread so the readers
+        # can be switched to read only
+        self._read_only_reader_connections = False
+        # The states table is partitioned by month on PostgreSQL
+        # so the purge can drop whole partitions
+        self.partition_states = partition_states
+        self.states_partitioned = False
+        # The time zone the day, week and month statistics rollups
+        # were built for, None until they have been checked
+        self.statistics_rollups_time_zone: tzinfo | None = None
+        # Incremented whenever statistics of past periods are changed
+        # so readers caching statistics know to drop their cache
+        self.statistics_generation = 0
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -228,6 +298,8 @@ class Recorder(threading.Thread):
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
+        self._core_config_listener: CALLBACK_TYPE | None = None
+        self._delayed_task_listeners: set[CALLBACK_TYPE] = set()
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
 
@@ -238,7 +310,17 @@ class Recorder(threading.Thread):
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        return self._queue.qsize() + self._spill_queue.pending
+
+    @property
+    def spilled_backlog(self) -> int:
+        """Return the number of events in the backlog spilled to disk."""
+        return self._spill_queue.pending
+
+    @property
+    def spilled_backlog_size(self) -> int:
+        """Return the size in bytes of the backlog spilled to disk."""
+        return self._spill_queue.size_bytes
 
     @cached_property
     def dialect_name(self) -> SupportedDialect | None:
@@ -280,6 +362,12 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+            self.recorder_and_worker_thread_ids,
+            thread_name_prefix=DB_READER_PREFIX,
+            max_workers=self.db_read_pool_size,
+            shutdown_hook=self._shutdown_pool,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -292,37 +380,67 @@ class Recorder(threading.Thread):
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
         queue_put = self._queue.put_nowait
+        queue_size = self._queue.qsize
+        spill_queue = self._spill_queue
 
         @callback
-        def _event_listener(event: Event) -> None:
-            """Listen for new events and put them in the process queue."""
+        def _spill(event: Event) -> bool:
+            """Spill the event to disk if the backlog is over budget."""
+            if spill_queue.active:
+                return spill_queue.put(event)
+            if queue_size() < SPILL_QUEUE_MIN_BACKLOG or not spill_queue.activate():
+                return False
+            _LOGGER.warning(
+                "The recorder backlog reached %s events, new events are written "
+                "to disk until the database catches up",
+                SPILL_QUEUE_MIN_BACKLOG,
+            )
+            # The spilled events are recorded once the
+            # events queued before them are processed
+            queue_put(DrainSpillQueueTask())
+            return spill_queue.put(event)
+
+        @callback
+        def _event_is_recorded(event: Event) -> bool:
+            """Return if the event should be recorded."""
             if event.event_type in exclude_event_types:
-                return
+                return False
 
             if entity_filter is None or not (
                 entity_id := event.data.get(ATTR_ENTITY_ID)
             ):
-                queue_put(event)
-                return
+                return True
 
             if isinstance(entity_id, str):
-                if entity_filter(entity_id):
-                    queue_put(event)
-                return
+                return entity_filter(entity_id)
 
             if isinstance(entity_id, list):
-                for eid in entity_id:
-                    if entity_filter(eid):
-                        queue_put(event)
-                        return
-                return
+                return any(entity_filter(eid) for eid in entity_id)
 
             # Unknown what it is.
-            queue_put(event)
+            return True
+
+        @callback
+        def _event_listener(event: Event) -> None:
+            """Listen for new events and put them in the process queue."""
+            if _event_is_recorded(event) and not _spill(event):
+                queue_put(event)
+
+        @callback
+        def _event_batch_listener(events: list[Event]) -> None:
+            """Listen for a batch of new events and queue them as one task."""
+            if not (events := [event for event in events if _event_is_recorded(event)]):
+                return
+            if not _spill(events[0]):
+                queue_put(EventBatchTask(events))
+                return
+            for event in events[1:]:
+                spill_queue.put(event)
 
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL,
             _event_listener,
+            batch_listener=_event_batch_listener,
         )
         self._queue_watcher = async_track_time_interval(
             self.hass,
@@ -331,6 +449,18 @@ class Recorder(threading.Thread):
             name="Recorder queue watcher",
         )
 
+    @callback
+    def async_queue_task_later(self, delay: float, task: RecorderTask) -> None:
+        """Queue a task after a delay."""
+
+        @callback
+        def _queue_task(_: datetime) -> None:
+            self._delayed_task_listeners.discard(cancel)
+            self.queue_task(task)
+
+        cancel = async_call_later(self.hass, delay, _queue_task)
+        self._delayed_task_listeners.add(cancel)
+
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
         """Queue a keep alive."""
@@ -354,6 +484,19 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read only query job from within the event loop.
+
+        History, logbook and statistics queries run concurrently on the
+        read pool instead of queuing behind other database jobs.
+        """
+        return self.hass.loop.run_in_executor(
+            self._db_read_executor, _timed_read_job, target, *args
+        )
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -372,6 +515,9 @@ class Recorder(threading.Thread):
             ),
             self.backlog,
         )
+        # Memory is running low, the serialized forms of the states
+        # are rebuilt on demand so they are safe to drop
+        self.hass.states.async_evict_serialized_caches()
         self._async_stop_queue_watcher_and_event_listener()
 
     def _available_memory(self) -> int:
@@ -382,8 +528,12 @@ class Recorder(threading.Thread):
 
     def _reached_max_backlog(self) -> bool:
         """Check if the system has reached the max queue backlog and return True if it has."""
+        # The spilled backlog does not use memory but the disk is not
+        # unlimited either
+        if self._spill_queue.size_bytes >= SPILL_QUEUE_MAX_SIZE:
+            return True
         # First check the minimum value since its cheap
-        if self.backlog < MAX_QUEUE_BACKLOG_MIN_VALUE:
+        if self._queue.qsize() < MAX_QUEUE_BACKLOG_MIN_VALUE:
             return False
         # If they have more RAM available, keep filling the backlog
         # since we do not want to stop recording events or give the
@@ -416,6 +566,11 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._core_config_listener:
+            self._core_config_listener()
+            self._core_config_listener = None
+        while self._delayed_task_listeners:
+            self._delayed_task_listeners.pop()()
 
     async def _async_close(self, event: Event) -> None:
         """Empty the queue if its still present at close."""
@@ -516,6 +671,19 @@ class Recorder(threading.Thread):
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
         else:
             self.queue_task(PerodicCleanupTask())
+        if self.states_partitioned:
+            self.queue_task(StatesPartitionsTask())
+        if self.statistics_rollups_time_zone is not None:
+            self.queue_task(StatisticsRollupsCheckTask())
+
+    @callback
+    def _async_core_config_updated(self, event: Event) -> None:
+        """Check the statistics rollups if the time zone changed."""
+        if (
+            self.statistics_rollups_time_zone is not None
+            and self.statistics_rollups_time_zone != dt_util.get_default_time_zone()
+        ):
+            self.queue_task(StatisticsRollupsCheckTask())
 
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
@@ -651,6 +819,11 @@ class Recorder(threading.Thread):
             self.hass, self._async_five_minute_tasks, minute=range(0, 60, 5), second=10
         )
 
+        # The statistics rollups follow the local time zone
+        self._core_config_listener = self.hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
+        )
+
     async def _async_wait_for_started(self) -> object | None:
         """Wait for the hass started future."""
         return await self._hass_started
@@ -688,6 +861,42 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_state_to_session(self, session: Session, dbstate: States) -> None:
+        """Add a state to the session or to the pending bulk inserts."""
+        if not self._bulk_insert_states:
+            self._add_to_session(session, dbstate)
+            return
+        self._event_session_has_pending_writes = True
+        self.states_manager.add_pending_insert(dbstate)
+
+    def _add_event_to_session(self, dbevent: Events) -> None:
+        """Add an event to the pending bulk inserts."""
+        self._event_session_has_pending_writes = True
+        self._pending_event_inserts.append(dbevent)
+
+    def _insert_pending_events(self, session: Session) -> None:
+        """Insert the pending events in bulk.
+
+        The session must be flushed before so the pending EventTypes
+        and EventData rows have their ids.
+        """
+        rows: list[dict[str, Any]] = []
+        for dbevent in self._pending_event_inserts:
+            row = {key: getattr(dbevent, key) for key in _EVENTS_BULK_INSERT_COLUMNS}
+            row["event_type_id"] = (
+                event_type.event_type_id
+                if (event_type := dbevent.event_type_rel)
+                else dbevent.event_type_id
+            )
+            row["data_id"] = (
+                event_data.data_id
+                if (event_data := dbevent.event_data_rel)
+                else dbevent.data_id
+            )
+            rows.append(row)
+        session.execute(insert(Events), rows)
+        self._pending_event_inserts.clear()
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -707,6 +916,11 @@ class Recorder(threading.Thread):
         self.thread_id = thread_id
         self.recorder_and_worker_thread_ids.add(thread_id)
 
+        # Events spilled to disk by a previous run that could
+        # not reach the database are recorded first
+        if self._spill_queue.load():
+            self.queue_task(DrainSpillQueueTask())
+
         setup_result = self._setup_recorder()
 
         if not setup_result:
@@ -789,6 +1003,9 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        if self.partition_states:
+            self._setup_states_partitions()
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -1035,6 +1252,46 @@ class Recorder(threading.Thread):
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _process_event_batch(self, events: list[Event[Any]]) -> None:
+        """Process a batch of events fired together.
+
+        The states meta and state attributes caches are primed for the whole
+        batch first so their ids are resolved with one query per table
+        instead of one per event. The events are then processed in order,
+        each one like an event from the queue, so an error only drops the
+        event it happened for.
+        """
+        if not self.enabled:
+            return
+        if state_change_events := [
+            event for event in events if event.event_type == EVENT_STATE_CHANGED
+        ]:
+            assert self.event_session is not None
+            session = self.event_session
+            try:
+                self.states_meta_manager.load(state_change_events, session)
+                self.state_attributes_manager.load(state_change_events, session)
+            except SQLAlchemyError:
+                # The ids are looked up for each event instead
+                _LOGGER.exception("SQLAlchemyError error priming the caches")
+                self._reopen_event_session()
+        for event in events:
+            self._process_one_task_or_event_or_recover(event)
+
+    def _drain_spill_queue(self) -> None:
+        """Record the next events spilled to disk.
+
+        The task queues itself again until the spill queue is empty
+        so other tasks are still run while the spilled backlog drains.
+        """
+        spill_queue = self._spill_queue
+        try:
+            if events := spill_queue.get_many(SPILL_QUEUE_DRAIN_BATCH_SIZE, 1):
+                self._process_event_batch(events)
+        finally:
+            if not spill_queue.deactivate_if_empty():
+                self.queue_task(DrainSpillQueueTask())
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
@@ -1054,7 +1311,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1079,7 +1336,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1161,7 +1418,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1209,6 +1466,15 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self.states_manager.has_pending_inserts or self._pending_event_inserts:
+            # Flush the pending metadata, attributes, event types and
+            # event data first so the bulk inserts can reference their ids
+            session.flush()
+            if self.states_manager.has_pending_inserts:
+                self.states_manager.insert_pending(session)
+            if self._pending_event_inserts:
+                self._insert_pending_events(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1258,6 +1524,7 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_event_inserts.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1283,6 +1550,12 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        assert self.engine is not None
+        # Bulk inserting states needs the ids of the inserted rows in order
+        # to link the old_state_id of the following states
+        self._bulk_insert_states = bool(
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
@@ -1377,11 +1650,17 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
+        if (
+            self._read_only_reader_connections
+            and threading.current_thread().name.startswith(DB_READER_PREFIX)
+        ):
+            setup_read_only_connection(dbapi_connection)
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
         kwargs: dict[str, Any] = {}
         self._completed_first_database_setup = False
+        self._read_only_reader_connections = False
 
         if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
             kwargs["connect_args"] = {"check_same_thread": False}
@@ -1393,6 +1672,9 @@ class Recorder(threading.Thread):
             kwargs["recorder_and_worker_thread_ids"] = (
                 self.recorder_and_worker_thread_ids
             )
+            # Keep a connection for every worker and reader thread
+            kwargs["pool_size"] = POOL_SIZE + self.db_read_pool_size
+            self._read_only_reader_connections = True
         elif self.db_url.startswith(
             (
                 MARIADB_URL_PREFIX,
@@ -1411,6 +1693,11 @@ class Recorder(threading.Thread):
                 with contextlib.suppress(ImportError):
                     kwargs["connect_args"]["conv"] = build_mysqldb_conv()
 
+        if not self.db_url.startswith(SQLITE_URL_PREFIX):
+            # Make room for the readers so they do not wait
+            # for connections used by the recorder and workers
+            kwargs["pool_size"] = POOL_SIZE + self.db_read_pool_size
+
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
@@ -1449,6 +1736,19 @@ class Recorder(threading.Thread):
         """Add tasks for missing statistics runs."""
         self.queue_task(CompileMissingStatisticsTask())
 
+    def _setup_states_partitions(self) -> None:
+        """Partition the states table and create the upcoming partitions."""
+        if self.dialect_name != SupportedDialect.POSTGRESQL:
+            _LOGGER.warning(
+                "Partitioning the states table is only supported with PostgreSQL"
+            )
+            return
+        try:
+            with session_scope(session=self.get_session()) as session:
+                self.states_partitioned = partitions.setup_states_partitions(session)
+        except SQLAlchemyError:
+            _LOGGER.exception("Error partitioning the states table")
+
     def _end_session(self) -> None:
         """End the recorder session."""
         if self.event_session is None:
@@ -1478,16 +1778,24 @@ class Recorder(threading.Thread):
         )
         self.hass.add_job(self._async_startup_done, startup_failed)
 
+        # Spilled events that were not recorded stay on disk for the next run
+        self._spill_queue.close()
+
         try:
             self._end_session()
         finally:
-            if self._db_executor:
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_executor)
+                if executor
+            ]
+            for executor in executors:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 48
+SCHEMA_VERSION = 49
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +93,9 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAY = "statistics_day"
+TABLE_STATISTICS_WEEK = "statistics_week"
+TABLE_STATISTICS_MONTH = "statistics_month"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +119,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAY,
+    TABLE_STATISTICS_WEEK,
+    TABLE_STATISTICS_MONTH,
 ]
 
 TABLES_TO_CHECK = [
@@ -813,6 +819,68 @@ class StatisticsShortTerm(Base, _StatisticsShortTerm):
     )
 
 
+class StatisticsRollupBase(StatisticsBase):
+    """Statistics rolled up from the hourly statistics of a calendar period.
+
+    The periods follow the local time zone, the duration is only the
+    nominal length of a period.
+    """
+
+    # Number of hourly statistics with a mean in the period
+    mean_weight: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDay(Base, StatisticsRollupBase):
+    """Daily statistics."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_day_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAY
+
+
+class StatisticsWeek(Base, StatisticsRollupBase):
+    """Weekly statistics."""
+
+    duration = timedelta(days=7)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_week_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_WEEK
+
+
+class StatisticsMonth(Base, StatisticsRollupBase):
+    """Monthly statistics."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_month_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTH
+
+
 class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     """Short term statistics with 32-bit index, used for schema migration."""
 
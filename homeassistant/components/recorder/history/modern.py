@@ -121,6 +121,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -136,6 +137,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -216,11 +218,15 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
     entity_ids is an optional iterable of entities to include in the results.
 
+    max_points is an optional limit of the states returned per entity
+    with a number as state, see _downsample_rows.
+
     filters is an optional SQLAlchemy filter which will be applied to the database
     queries unless entity_ids is given, in which case its ignored.
 
@@ -286,6 +292,11 @@ def get_significant_states_with_session(
         minimal_response,
         compressed_state_format,
         no_attributes=no_attributes,
+        downsample_range=(
+            (start_time_ts, end_time_ts or dt_util.utcnow().timestamp(), max_points)
+            if max_points
+            else None
+        ),
     )
 
 
@@ -669,6 +680,65 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def _downsample_rows(
+    rows: Iterable[Row],
+    start_time_ts: float,
+    end_time_ts: float,
+    max_points: int,
+    state_idx: int,
+    last_updated_ts_idx: int,
+) -> Iterator[Row]:
+    """Reduce the rows of an entity to about max_points rows.
+
+    The period is split in max_points // 4 buckets and only the
+    first, last, lowest and highest rows of each bucket are kept
+    which draws the same line graph as all the rows while the
+    number of rows no longer depends on how often the entity
+    reports. Rows with a state that is not a number are always
+    kept so the graph still shows when the entity was unavailable.
+    """
+    bucket_width = (end_time_ts - start_time_ts) / max(max_points // 4, 1)
+    if bucket_width <= 0:
+        yield from rows
+        return
+    # first, lowest, highest and last row of the current bucket
+    bucket: list[Row] = []
+    bucket_idx: int | None = None
+    low = high = 0.0
+    for row in rows:
+        try:
+            value = float(row[state_idx])
+        except (TypeError, ValueError):
+            yield from _bucket_rows(bucket, last_updated_ts_idx)
+            bucket = []
+            bucket_idx = None
+            yield row
+            continue
+        row_bucket_idx = int((row[last_updated_ts_idx] - start_time_ts) // bucket_width)
+        if row_bucket_idx != bucket_idx:
+            yield from _bucket_rows(bucket, last_updated_ts_idx)
+            bucket = [row, row, row, row]
+            bucket_idx = row_bucket_idx
+            low = high = value
+            continue
+        if value < low:
+            low = value
+            bucket[1] = row
+        elif value > high:
+            high = value
+            bucket[2] = row
+        bucket[3] = row
+    yield from _bucket_rows(bucket, last_updated_ts_idx)
+
+
+def _bucket_rows(bucket: list[Row], last_updated_ts_idx: int) -> list[Row]:
+    """Return the distinct rows kept for a bucket in time order."""
+    return sorted(
+        {id(row): row for row in bucket}.values(),
+        key=itemgetter(last_updated_ts_idx),
+    )
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
@@ -678,6 +748,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    downsample_range: tuple[float, float, int] | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -729,6 +800,10 @@ def _sorted_states_to_dict(
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
+        if downsample_range:
+            group = _downsample_rows(
+                group, *downsample_range, state_idx, last_updated_ts_idx
+            )
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
         if (
@@ -30,6 +30,7 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -55,6 +56,7 @@ from .const import (
     LEGACY_STATES_EVENT_FOREIGN_KEYS_FIXED_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -77,9 +79,12 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDay,
     StatisticsMeta,
+    StatisticsMonth,
     StatisticsRuns,
     StatisticsShortTerm,
+    StatisticsWeek,
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
@@ -103,8 +108,12 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
-from .tasks import RecorderTask
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    get_start_time,
+    rebuild_statistics_rollups,
+)
+from .tasks import RecorderTask, StatisticsRollupsCheckTask
 from .util import (
     database_job_retry_wrapper,
     database_job_retry_wrapper_method,
@@ -1988,6 +1997,14 @@ class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
         _migrate_columns_to_timestamp(self.instance, self.session_maker, self.engine)
 
 
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The rollups are filled by StatisticsRollupsMigration
+        for table in (StatisticsDay, StatisticsWeek, StatisticsMonth):
+            cast(Table, table.__table__).create(self.engine, checkfirst=True)
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2980,6 +2997,52 @@ class EntityIDPostMigration(BaseMigrationWithQuery, BaseOffLineMigration):
         return has_used_states_entity_ids()
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigration):
+    """Migration to fill the day, week and month statistics rollups."""
+
+    migration_id = "statistics_rollups"
+    max_initial_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION - 1
+
+    def __init__(
+        self,
+        *,
+        initial_schema_version: int,
+        start_schema_version: int,
+        migration_changes: dict[str, int],
+    ) -> None:
+        """Initialize a new StatisticsRollupsMigration."""
+        super().__init__(
+            initial_schema_version=initial_schema_version,
+            start_schema_version=start_schema_version,
+            migration_changes=migration_changes,
+        )
+        self._start_ts: float | None = None
+        self._time_zone = dt_util.get_default_time_zone()
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Roll up one month of hourly statistics, returns True if completed."""
+        if self._time_zone != (time_zone := dt_util.get_default_time_zone()):
+            # The time zone changed while migrating, start over
+            self._start_ts = None
+            self._time_zone = time_zone
+        self._start_ts = rebuild_statistics_rollups(instance, self._start_ts)
+        is_done = self._start_ts is None
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Start using the rollups once they are checked."""
+        instance.queue_task(StatisticsRollupsCheckTask())
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        needs_migrate = session.query(Statistics.id).first() is not None
+        return DataMigrationStatus(
+            needs_migrate=needs_migrate, migration_done=not needs_migrate
+        )
+
+
 NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
     StatesContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
     EventsContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
@@ -2990,6 +3053,7 @@ NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
 
 LIVE_DATA_MIGRATORS: tuple[type[BaseRunTimeMigration], ...] = (
     EventIDPostMigration,  # Introduced in HA Core 2023.4 by PR #89901
+    StatisticsRollupsMigration,
 )
 
 
@@ -0,0 +1,261 @@
+"""Partition the states table by time with PostgreSQL declarative partitioning."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import re
+from typing import cast
+
+from sqlalchemy import Table, text
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util import dt as dt_util
+
+from .db_schema import TABLE_STATES, States
+
+_LOGGER = logging.getLogger(__name__)
+
+# Partitions are created ahead of time so new states
+# do not end up in the default partition
+PARTITION_MONTHS_AHEAD = 2
+
+_UNPARTITIONED_STATES = f"{TABLE_STATES}_unpartitioned"
+_STATES_SEQUENCE = f"{TABLE_STATES}_partitioned_state_id_seq"
+
+
+@dataclass(slots=True, frozen=True)
+class Partition:
+    """A monthly partition of a table."""
+
+    name: str
+    start: datetime
+    end: datetime
+
+    @property
+    def start_ts(self) -> float:
+        """Return the first timestamp in the partition."""
+        return self.start.timestamp()
+
+    @property
+    def end_ts(self) -> float:
+        """Return the timestamp the partition ends before."""
+        return self.end.timestamp()
+
+
+def _partition_for_month(table: str, year: int, month: int) -> Partition:
+    """Return the partition of a table for a month."""
+    start = datetime(year, month, 1, tzinfo=dt_util.UTC)
+    end = (
+        datetime(year + 1, 1, 1, tzinfo=dt_util.UTC)
+        if month == 12
+        else datetime(year, month + 1, 1, tzinfo=dt_util.UTC)
+    )
+    return Partition(f"{table}_p{year:04d}{month:02d}", start, end)
+
+
+def month_partitions(table: str, start: datetime, end: datetime) -> list[Partition]:
+    """Return the monthly partitions of a table covering start to end."""
+    start = dt_util.as_utc(start)
+    partition = _partition_for_month(table, start.year, start.month)
+    partitions = [partition]
+    while partition.end <= end:
+        partition = _partition_for_month(table, partition.end.year, partition.end.month)
+        partitions.append(partition)
+    return partitions
+
+
+def create_partition_sql(table: str, partition: Partition) -> str:
+    """Return the statement to create a partition of a table."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF {table} "
+        f"FOR VALUES FROM ({partition.start_ts!r}) TO ({partition.end_ts!r})"
+    )
+
+
+def _partitions_until() -> datetime:
+    """Return the time partitions must be created until."""
+    return dt_util.utcnow() + timedelta(days=31 * PARTITION_MONTHS_AHEAD)
+
+
+def get_states_partitions(session: Session) -> list[Partition] | None:
+    """Return the monthly partitions of the states table, oldest first.
+
+    Returns None if the states table is not partitioned.
+    """
+    if not session.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": TABLE_STATES},
+    ).first():
+        return None
+    name_re = re.compile(rf"^{TABLE_STATES}_p(\d{{4}})(\d{{2}})$")
+    partitions = [
+        _partition_for_month(TABLE_STATES, int(match[1]), int(match[2]))
+        for name in session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table AND pg_table_is_visible(p.oid)"
+            ),
+            {"table": TABLE_STATES},
+        ).scalars()
+        if (match := name_re.match(name))
+    ]
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+def setup_states_partitions(session: Session) -> bool:
+    """Partition the states table if needed and create the upcoming partitions.
+
+    Returns False if the states table cannot be partitioned.
+    """
+    if (partitions := get_states_partitions(session)) is None:
+        if missing := session.execute(
+            text(
+                f"SELECT count(*) FROM {TABLE_STATES} "  # noqa: S608
+                "WHERE last_updated_ts IS NULL"
+            )
+        ).scalar():
+            # The partition key is part of the primary key
+            # so these states could not be copied
+            _LOGGER.error(
+                "The states table cannot be partitioned, "
+                "%s states have no last updated time",
+                missing,
+            )
+            return False
+        _create_partitioned_states(session)
+    else:
+        start = partitions[-1].end if partitions else dt_util.utcnow()
+        for partition in month_partitions(TABLE_STATES, start, _partitions_until()):
+            session.execute(text(create_partition_sql(TABLE_STATES, partition)))
+    if session.execute(
+        text("SELECT to_regclass(:table)"), {"table": _UNPARTITIONED_STATES}
+    ).scalar():
+        _move_unpartitioned_states(session)
+    return True
+
+
+def _create_partitioned_states(session: Session) -> None:
+    """Replace the states table with an empty table partitioned by month.
+
+    The states are kept in the renamed table until they are moved. The
+    sequence continues after the newest state so new states can be added
+    to the partitioned table before all states are moved. The primary
+    key must include the partition key so the self referencing foreign
+    key on old_state_id cannot be kept, the purge disconnects old states
+    itself.
+    """
+    _LOGGER.warning(
+        "Partitioning the states table by month; "
+        "This may take a while for a large database"
+    )
+    oldest_ts: float | None = session.execute(
+        text(f"SELECT min(last_updated_ts) FROM {TABLE_STATES}")  # noqa: S608
+    ).scalar()
+    primary_key: str = session.execute(
+        text(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = CAST(:table AS regclass) AND contype = 'p'"
+        ),
+        {"table": TABLE_STATES},
+    ).scalar_one()
+    statements = [
+        f"ALTER TABLE {TABLE_STATES} RENAME TO {_UNPARTITIONED_STATES}",
+        f"ALTER INDEX {primary_key} RENAME TO {_UNPARTITIONED_STATES}_pkey",
+        # Identity columns are not supported on partitioned tables
+        # before PostgreSQL 17 so a plain sequence is used instead
+        f"CREATE TABLE {TABLE_STATES} (LIKE {_UNPARTITIONED_STATES}) "
+        "PARTITION BY RANGE (last_updated_ts)",
+        f"CREATE SEQUENCE {_STATES_SEQUENCE}",
+        f"ALTER TABLE {TABLE_STATES} ALTER COLUMN state_id "
+        f"SET DEFAULT nextval('{_STATES_SEQUENCE}')",
+        f"ALTER SEQUENCE {_STATES_SEQUENCE} OWNED BY {TABLE_STATES}.state_id",
+        f"SELECT setval('{_STATES_SEQUENCE}', "  # noqa: S608
+        f"(SELECT COALESCE(max(state_id), 0) + 1 FROM {_UNPARTITIONED_STATES}), "
+        "false)",
+        f"ALTER TABLE {TABLE_STATES} ADD PRIMARY KEY (state_id, last_updated_ts)",
+        f"CREATE TABLE {TABLE_STATES}_default PARTITION OF {TABLE_STATES} DEFAULT",
+    ]
+    start = (
+        dt_util.utcnow() if oldest_ts is None else dt_util.utc_from_timestamp(oldest_ts)
+    )
+    statements.extend(
+        create_partition_sql(TABLE_STATES, partition)
+        for partition in month_partitions(TABLE_STATES, start, _partitions_until())
+    )
+    for statement in statements:
+        session.execute(text(statement))
+    session.commit()
+
+
+def _move_unpartitioned_states(session: Session) -> None:
+    """Move the states to the partitioned table in batches.
+
+    Each batch is committed so a move which was interrupted
+    continues with the remaining states on the next start.
+    """
+    result: CursorResult | None = None
+    while result is None or result.rowcount > 0:
+        result = session.connection().execute(
+            text(
+                f"WITH moved AS (DELETE FROM {_UNPARTITIONED_STATES} "  # noqa: S608
+                "WHERE state_id IN "
+                f"(SELECT state_id FROM {_UNPARTITIONED_STATES} "
+                "ORDER BY state_id LIMIT 100000) RETURNING *) "
+                f"INSERT INTO {TABLE_STATES} SELECT * FROM moved"
+            )
+        )
+        session.commit()
+    # The indexes are created once the states are moved
+    # since it is much faster than updating them for every row
+    connection = session.connection()
+    for index in cast(Table, States.__table__).indexes:
+        index.create(connection, checkfirst=True)
+    # The foreign keys to the other tables are kept,
+    # only the one referencing the states itself is dropped
+    for name, definition in session.execute(
+        text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = CAST(:table AS regclass) AND contype = 'f' "
+            "AND confrelid != conrelid"
+        ),
+        {"table": _UNPARTITIONED_STATES},
+    ).all():
+        session.execute(
+            text(f"ALTER TABLE {TABLE_STATES} ADD CONSTRAINT {name} {definition}")
+        )
+    session.execute(text(f"DROP TABLE {_UNPARTITIONED_STATES}"))
+    session.execute(text(f"ANALYZE {TABLE_STATES}"))
+    _LOGGER.warning("Partitioning the states table finished")
+
+
+def get_partition_attributes_ids(session: Session, partition: Partition) -> set[int]:
+    """Return the attributes ids used by the states in a partition."""
+    return set(
+        session.execute(
+            text(
+                f"SELECT DISTINCT attributes_id FROM {partition.name} "  # noqa: S608
+                "WHERE attributes_id IS NOT NULL"
+            )
+        ).scalars()
+    )
+
+
+def get_partition_max_state_id(session: Session, partition: Partition) -> int | None:
+    """Return the newest state id in a partition."""
+    return session.execute(
+        text(f"SELECT max(state_id) FROM {partition.name}")  # noqa: S608
+    ).scalar()
+
+
+def drop_partition(session: Session, partition: Partition) -> None:
+    """Drop a partition with all its rows."""
+    session.execute(text(f"DROP TABLE {partition.name}"))
@@ -6,12 +6,14 @@ from collections.abc import Callable
 from datetime import datetime
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
+from . import partitions
+from .const import EVENT_RECORDER_PURGE_PROGRESS
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -21,22 +23,27 @@ from .queries import (
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_before,
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_before,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_up_to,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_purge_boundary,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_purge_boundary,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -52,6 +59,75 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The time a purge task may spend deleting before it yields to the other
+# tasks, and the pause before the next slice when it used all of it
+PURGE_SLICE_TIME_BUDGET = 5.0
+PURGE_SLICE_PAUSE = 30.0
+# The delete latency the batch size is adapted to
+PURGE_TARGET_BATCH_LATENCY = 0.25
+MIN_PURGE_BATCH_SIZE = 100
+
+
+class PurgeScheduler:
+    """Pace the purge of states and events.
+
+    Each purge task runs as a slice limited by a time budget instead of a
+    fixed number of batches. The size of the delete batches follows the
+    measured delete latency so large databases do not hold table locks
+    for long, and the slices are spread out when the budget runs out.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the purge scheduler."""
+        self._batch_size: int | None = None
+        self._max_batch_size = 0
+        self._deadline = 0.0
+        self.budget_exhausted = False
+        self.slices = 0
+        self.states_purged = 0
+        self.events_purged = 0
+
+    def start_slice(self) -> None:
+        """Start a purge slice."""
+        self._deadline = time.monotonic() + PURGE_SLICE_TIME_BUDGET
+        self.budget_exhausted = False
+        self.slices += 1
+
+    def batch_size(self, max_bind_vars: int) -> int:
+        """Return the number of rows to delete in the next batch."""
+        self._max_batch_size = max_bind_vars
+        if self._batch_size is None or self._batch_size > max_bind_vars:
+            self._batch_size = max_bind_vars
+        return self._batch_size
+
+    def record_batch(self, elapsed: float) -> None:
+        """Adapt the batch size to the latency of a delete batch."""
+        assert self._batch_size is not None
+        if elapsed > PURGE_TARGET_BATCH_LATENCY:
+            self._batch_size = max(MIN_PURGE_BATCH_SIZE, self._batch_size // 2)
+        elif elapsed < PURGE_TARGET_BATCH_LATENCY / 2:
+            self._batch_size = min(
+                self._max_batch_size, self._batch_size + self._batch_size // 2
+            )
+        if time.monotonic() >= self._deadline:
+            self.budget_exhausted = True
+
+    def progress(self, finished: bool) -> dict[str, Any]:
+        """Return the progress of the purge."""
+        return {
+            "finished": finished,
+            "slices": self.slices,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "batch_size": self._batch_size,
+        }
+
+    def finish(self) -> None:
+        """Reset the progress once the purge is finished."""
+        self.slices = 0
+        self.states_purged = 0
+        self.events_purged = 0
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -66,6 +142,8 @@ def purge_old_data(
 
     Cleans up an timeframe of an hour, based on the oldest record.
     """
+    scheduler = instance.purge_scheduler
+    scheduler.start_slice()
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
@@ -85,6 +163,8 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
+            if instance.states_partitioned:
+                _purge_states_partitions(instance, session, purge_before)
             has_more_to_purge |= _purge_states_and_attributes_ids(
                 instance, session, states_batch_size, purge_before
             )
@@ -107,6 +187,10 @@ def purge_old_data(
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
+            if scheduler.budget_exhausted:
+                instance.hass.bus.fire(
+                    EVENT_RECORDER_PURGE_PROGRESS, scheduler.progress(False)
+                )
             return False
 
         if apply_filter and not _purge_filtered_data(instance, session):
@@ -124,6 +208,8 @@ def purge_old_data(
     with session_scope(session=instance.get_session(), read_only=True) as session:
         instance.recorder_runs_manager.load_from_db(session)
         instance.states_manager.load_from_db(session)
+    instance.hass.bus.fire(EVENT_RECORDER_PURGE_PROGRESS, scheduler.progress(True))
+    scheduler.finish()
     if repack:
         repack_database(instance)
     return True
@@ -192,16 +278,23 @@ def _purge_states_and_attributes_ids(
     # size batch of attributes_ids that will be around the size
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
-    max_bind_vars = instance.max_bind_vars
+    scheduler = instance.purge_scheduler
     for _ in range(states_batch_size):
-        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+        purge_before_ts, state_ids, attributes_ids = (
+            _select_state_attributes_ids_to_purge_in_range(
+                session, purge_before, scheduler.batch_size(instance.max_bind_vars)
+            )
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
-        _purge_state_ids(instance, session, state_ids)
+        start = time.monotonic()
+        _purge_state_ids(instance, session, state_ids, purge_before_ts)
+        scheduler.record_batch(time.monotonic() - start)
+        scheduler.states_purged += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if scheduler.budget_exhausted:
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -211,6 +304,29 @@ def _purge_states_and_attributes_ids(
     return has_remaining_state_ids_to_purge
 
 
+def _purge_states_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the states partitions that end before purge_before.
+
+    The states left in the partition purge_before falls in are
+    purged in batches afterwards.
+    """
+    purge_before_ts = purge_before.timestamp()
+    for partition in partitions.get_states_partitions(session) or ():
+        if partition.end_ts > purge_before_ts:
+            break
+        attributes_ids = partitions.get_partition_attributes_ids(session, partition)
+        if (
+            max_state_id := partitions.get_partition_max_state_id(session, partition)
+        ) is not None:
+            session.execute(disconnect_states_rows_up_to(max_state_id))
+            instance.states_manager.evict_state_ids_up_to(max_state_id)
+        partitions.drop_partition(session, partition)
+        _LOGGER.debug("Dropped states partition %s", partition.name)
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
@@ -227,16 +343,23 @@ def _purge_events_and_data_ids(
     # size batch of data_ids that will be around the size
     # max_bind_vars
     data_ids_batch: set[int] = set()
-    max_bind_vars = instance.max_bind_vars
+    scheduler = instance.purge_scheduler
     for _ in range(events_batch_size):
-        event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+        purge_before_ts, event_ids, data_ids = (
+            _select_event_data_ids_to_purge_in_range(
+                session, purge_before, scheduler.batch_size(instance.max_bind_vars)
+            )
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        start = time.monotonic()
+        _purge_event_ids(session, event_ids, purge_before_ts)
+        scheduler.record_batch(time.monotonic() - start)
+        scheduler.events_purged += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if scheduler.budget_exhausted:
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -247,13 +370,13 @@ def _purge_events_and_data_ids(
 
 
 def _select_state_attributes_ids_to_purge(
-    session: Session, purge_before: datetime, max_bind_vars: int
+    session: Session, purge_before_ts: float, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
     """Return sets of state and attribute ids to purge."""
     state_ids = set()
     attributes_ids = set()
     for state_id, attributes_id in session.execute(
-        find_states_to_purge(purge_before.timestamp(), max_bind_vars)
+        find_states_to_purge(purge_before_ts, max_bind_vars)
     ).all():
         state_ids.add(state_id)
         if attributes_id:
@@ -266,14 +389,68 @@ def _select_state_attributes_ids_to_purge(
     return state_ids, attributes_ids
 
 
+def _select_state_attributes_ids_to_purge_in_range(
+    session: Session, purge_before: datetime, batch_size: int
+) -> tuple[float | None, set[int], set[int]]:
+    """Return the range end and the state and attribute ids to purge in it.
+
+    The states are selected and deleted with a range on the last_updated_ts
+    index instead of a large IN clause of state ids. If too many states share
+    the same last_updated_ts to fit a range in the batch, the range end is
+    None and the state ids must be deleted by id instead.
+    """
+    purge_before_ts = purge_before.timestamp()
+    if (
+        range_end_ts := session.execute(
+            find_states_purge_boundary(purge_before_ts, batch_size)
+        ).scalar()
+    ) is None:
+        range_end_ts = purge_before_ts
+    state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
+        session, range_end_ts, batch_size
+    )
+    if state_ids:
+        return range_end_ts, state_ids, attributes_ids
+    if range_end_ts == purge_before_ts:
+        return None, state_ids, attributes_ids
+    return (
+        None,
+        *_select_state_attributes_ids_to_purge(session, purge_before_ts, batch_size),
+    )
+
+
+def _select_event_data_ids_to_purge_in_range(
+    session: Session, purge_before: datetime, batch_size: int
+) -> tuple[float | None, set[int], set[int]]:
+    """Return the range end and the event and data ids to purge in it.
+
+    See _select_state_attributes_ids_to_purge_in_range.
+    """
+    purge_before_ts = purge_before.timestamp()
+    if (
+        range_end_ts := session.execute(
+            find_events_purge_boundary(purge_before_ts, batch_size)
+        ).scalar()
+    ) is None:
+        range_end_ts = purge_before_ts
+    event_ids, data_ids = _select_event_data_ids_to_purge(
+        session, range_end_ts, batch_size
+    )
+    if event_ids:
+        return range_end_ts, event_ids, data_ids
+    if range_end_ts == purge_before_ts:
+        return None, event_ids, data_ids
+    return None, *_select_event_data_ids_to_purge(session, purge_before_ts, batch_size)
+
+
 def _select_event_data_ids_to_purge(
-    session: Session, purge_before: datetime, max_bind_vars: int
+    session: Session, purge_before_ts: float, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
     """Return sets of event and data ids to purge."""
     event_ids = set()
     data_ids = set()
     for event_id, data_id in session.execute(
-        find_events_to_purge(purge_before.timestamp(), max_bind_vars)
+        find_events_to_purge(purge_before_ts, max_bind_vars)
     ).all():
         event_ids.add(event_id)
         if data_id:
@@ -454,8 +631,17 @@ def _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
     return event_ids, state_ids, attributes_ids, data_ids
 
 
-def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
-    """Disconnect states and delete by state id."""
+def _purge_state_ids(
+    instance: Recorder,
+    session: Session,
+    state_ids: set[int],
+    purge_before_ts: float | None = None,
+) -> None:
+    """Disconnect states and delete by state id.
+
+    If purge_before_ts is set, the state ids are all the states before it
+    and they are deleted with an index range instead.
+    """
     if not state_ids:
         return
 
@@ -466,7 +652,10 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     disconnected_rows = session.execute(disconnect_states_rows(state_ids))
     _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
-    deleted_rows = session.execute(delete_states_rows(state_ids))
+    if purge_before_ts is None:
+        deleted_rows = session.execute(delete_states_rows(state_ids))
+    else:
+        deleted_rows = session.execute(delete_states_rows_before(purge_before_ts))
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
     # Evict eny entries in the old_states cache referring to a purged state
@@ -515,11 +704,20 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
-def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
-    """Delete by event id."""
+def _purge_event_ids(
+    session: Session, event_ids: set[int], purge_before_ts: float | None = None
+) -> None:
+    """Delete by event id.
+
+    If purge_before_ts is set, the event ids are all the events before it
+    and they are deleted with an index range instead.
+    """
     if not event_ids:
         return
-    deleted_rows = session.execute(delete_event_rows(event_ids))
+    if purge_before_ts is None:
+        deleted_rows = session.execute(delete_event_rows(event_ids))
+    else:
+        deleted_rows = session.execute(delete_event_rows_before(purge_before_ts))
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
 
@@ -172,6 +172,16 @@ def disconnect_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def disconnect_states_rows_up_to(max_state_id: int) -> StatementLambdaElement:
+    """Disconnect states rows linked to a state up to max_state_id."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id <= max_state_id)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete states rows."""
     return lambda_stmt(
@@ -181,6 +191,15 @@ def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def delete_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete states rows with an index range on last_updated_ts."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_data_rows(data_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete event_data rows."""
     return lambda_stmt(
@@ -234,6 +253,15 @@ def delete_event_rows(
     )
 
 
+def delete_event_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete events rows with an index range on time_fired_ts."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_recorder_runs_rows(
     purge_before: datetime, current_run_id: int
 ) -> StatementLambdaElement:
@@ -269,6 +297,32 @@ def find_states_to_purge(
     )
 
 
+def find_states_purge_boundary(
+    purge_before: float, batch_size: int
+) -> StatementLambdaElement:
+    """Find the last_updated_ts the next batch of states to purge ends before."""
+    return lambda_stmt(
+        lambda: select(States.last_updated_ts)
+        .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts.asc())
+        .offset(batch_size)
+        .limit(1)
+    )
+
+
+def find_events_purge_boundary(
+    purge_before: float, batch_size: int
+) -> StatementLambdaElement:
+    """Find the time_fired_ts the next batch of events to purge ends before."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired_ts)
+        .filter(Events.time_fired_ts < purge_before)
+        .order_by(Events.time_fired_ts.asc())
+        .offset(batch_size)
+        .limit(1)
+    )
+
+
 def find_oldest_state() -> StatementLambdaElement:
     """Find the last_updated_ts of the oldest state."""
     return lambda_stmt(
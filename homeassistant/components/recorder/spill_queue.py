@@ -0,0 +1,369 @@
+"""Spill the recorder backlog to disk when it exceeds the memory budget."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+from typing import Any, cast
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads_object
+
+from .const import SPILL_QUEUE_SEGMENT_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Each record is the length of the payload followed by the payload,
+# a length of zero marks the end of the records in a segment.
+_LENGTH = struct.Struct("<I")
+_SEGMENT_SUFFIX = ".seg"
+
+
+def _event_to_bytes(event: Event[Any]) -> bytes:
+    """Serialize an event for the spill queue."""
+    context = event.context
+    return json_bytes(
+        {
+            "t": event.event_type,
+            "d": event.data,
+            "o": event.origin.value,
+            "f": event.time_fired_timestamp,
+            "c": [context.id, context.user_id, context.parent_id],
+        }
+    )
+
+
+def _event_from_bytes(payload: bytes) -> Event[Any]:
+    """Deserialize an event from the spill queue."""
+    raw = json_loads_object(payload)
+    event_type: str = raw["t"]  # type: ignore[assignment]
+    data: dict[str, Any] = raw["d"]  # type: ignore[assignment]
+    if event_type == EVENT_STATE_CHANGED:
+        for key in ("old_state", "new_state"):
+            if data[key] is not None:
+                data[key] = State.from_dict(data[key])
+    context_id, user_id, parent_id = cast(list[str | None], raw["c"])
+    return Event(
+        event_type,
+        data,
+        EventOrigin(raw["o"]),
+        raw["f"],  # type: ignore[arg-type]
+        Context(user_id, parent_id, context_id),
+    )
+
+
+@dataclass(slots=True)
+class _Segment:
+    """A memory-mapped segment file of the spill queue."""
+
+    path: str
+    mmap: mmap.mmap
+    write_pos: int = 0
+    read_pos: int = 0
+    sealed: bool = False
+
+
+def _open_segment(path: str, size: int) -> _Segment:
+    """Create a new segment file of a fixed size and map it."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.ftruncate(fd, size)
+        return _Segment(path, mmap.mmap(fd, size))
+    finally:
+        os.close(fd)
+
+
+def _recover_segment(path: str) -> _Segment | None:
+    """Map an existing segment file and find the end of its records."""
+    if not (size := os.path.getsize(path)):
+        os.unlink(path)
+        return None
+    fd = os.open(path, os.O_RDWR)
+    try:
+        segment = _Segment(path, mmap.mmap(fd, size), sealed=True)
+    finally:
+        os.close(fd)
+    pos = 0
+    while pos + _LENGTH.size <= size:
+        (length,) = _LENGTH.unpack_from(segment.mmap, pos)
+        if not length or pos + _LENGTH.size + length > size:
+            break
+        pos += _LENGTH.size + length
+    segment.write_pos = pos
+    return segment
+
+
+class SpillQueue:
+    """Append-only on-disk queue of events.
+
+    The recorder switches to the spill queue when its in-memory queue
+    passes the backlog budget. Events are serialized in the event loop and
+    appended to memory-mapped segment files by a writer thread, the recorder
+    thread reads them back in order and deletes the segments it consumed.
+
+    Segments left behind by a previous run are recovered on load so the
+    events are still recorded after a restart.
+    """
+
+    def __init__(
+        self, directory: str, segment_size: int = SPILL_QUEUE_SEGMENT_SIZE
+    ) -> None:
+        """Initialize the spill queue."""
+        self._directory = directory
+        self._segment_size = segment_size
+        self._segments: deque[_Segment] = deque()
+        self._next_segment_id = 0
+        self._lock = threading.Lock()
+        self._written = threading.Condition(self._lock)
+        self._writer_queue: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._loaded = False
+        self._active = False
+        # Events accepted by put that have not been read back yet
+        self._pending = 0
+        self._size_bytes = 0
+
+    @property
+    def active(self) -> bool:
+        """Return if new events must be spilled to keep them in order."""
+        return self._active
+
+    @property
+    def pending(self) -> int:
+        """Return the number of spilled events waiting to be recorded."""
+        return self._pending
+
+    @property
+    def size_bytes(self) -> int:
+        """Return the size of the spilled events waiting to be recorded."""
+        return self._size_bytes
+
+    def load(self) -> bool:
+        """Recover the segments of a previous run.
+
+        Returns True if there are events to drain.
+
+        Must run in the recorder thread, events are only spilled once
+        the queue is loaded.
+        """
+        try:
+            names = sorted(
+                name
+                for name in os.listdir(self._directory)
+                if name.endswith(_SEGMENT_SUFFIX)
+            )
+        except FileNotFoundError:
+            names = []
+        with self._lock:
+            self._loaded = True
+            for name in names:
+                segment_id = int(name.removesuffix(_SEGMENT_SUFFIX))
+                self._next_segment_id = max(self._next_segment_id, segment_id + 1)
+                path = os.path.join(self._directory, name)
+                if (segment := _recover_segment(path)) is None:
+                    continue
+                self._segments.append(segment)
+                self._size_bytes += segment.write_pos
+                self._pending += self._count_records(segment)
+            if self._pending:
+                _LOGGER.warning(
+                    "Recovered %s events spilled to disk by a previous run",
+                    self._pending,
+                )
+                # New events are spilled after the recovered ones
+                self._active = True
+        if self._active:
+            self._start_writer()
+        return self._active
+
+    @staticmethod
+    def _count_records(segment: _Segment) -> int:
+        """Count the records of a recovered segment."""
+        count = 0
+        pos = 0
+        while pos < segment.write_pos:
+            (length,) = _LENGTH.unpack_from(segment.mmap, pos)
+            pos += _LENGTH.size + length
+            count += 1
+        return count
+
+    def activate(self) -> bool:
+        """Start spilling events.
+
+        Returns False if the queue is not loaded yet.
+
+        Must run in the event loop.
+        """
+        with self._lock:
+            if not self._loaded:
+                return False
+            self._active = True
+        self._start_writer()
+        return True
+
+    def _start_writer(self) -> None:
+        """Start the writer thread if it is not running."""
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._write_loop, name="Recorder spill", daemon=True
+            )
+            self._writer.start()
+
+    def put(self, event: Event[Any]) -> bool:
+        """Spill an event.
+
+        Returns False if the queue is not active and the event must
+        be queued in memory instead.
+
+        Must run in the event loop.
+        """
+        if not self.active:
+            return False
+        try:
+            payload = _event_to_bytes(event)
+        except (ValueError, TypeError):
+            _LOGGER.warning(
+                "Event %s is not JSON serializable and cannot be spilled to disk",
+                event,
+            )
+            return True
+        with self._lock:
+            # The queue may have been closed while the event was serialized
+            if not self._active:
+                return False
+            self._pending += 1
+            self._size_bytes += _LENGTH.size + len(payload)
+            # Queued under the lock so close stops the writer after it
+            self._writer_queue.put(payload)
+        return True
+
+    def _write_loop(self) -> None:
+        """Append the spilled events to the segment files."""
+        writer_queue = self._writer_queue
+        segment: _Segment | None = None
+        while (payload := writer_queue.get()) is not None:
+            record_size = _LENGTH.size + len(payload)
+            if segment is None or segment.write_pos + record_size >= len(segment.mmap):
+                segment = self._new_segment(segment, record_size)
+            pos = segment.write_pos
+            # The length is written last so a record torn by a crash
+            # reads as the end of the segment when it is recovered
+            segment.mmap[pos + _LENGTH.size : pos + record_size] = payload
+            _LENGTH.pack_into(segment.mmap, pos, len(payload))
+            with self._written:
+                segment.write_pos = pos + record_size
+                self._written.notify_all()
+        if segment is not None:
+            segment.mmap.flush()
+
+    def _new_segment(self, current: _Segment | None, record_size: int) -> _Segment:
+        """Seal the current segment and start a new one."""
+        if current is not None:
+            current.mmap.flush()
+        os.makedirs(self._directory, exist_ok=True)
+        path = os.path.join(
+            self._directory, f"{self._next_segment_id:010d}{_SEGMENT_SUFFIX}"
+        )
+        self._next_segment_id += 1
+        segment = _open_segment(
+            path, max(self._segment_size, record_size + _LENGTH.size)
+        )
+        with self._lock:
+            if current is not None:
+                current.sealed = True
+            self._segments.append(segment)
+        return segment
+
+    def get_many(self, max_events: int, timeout: float) -> list[Event[Any]]:
+        """Read up to max_events spilled events in order.
+
+        Waits up to timeout for the writer if events are pending
+        but not written yet.
+
+        Must run in the recorder thread.
+        """
+        events: list[Event[Any]] = []
+        with self._written:
+            if self._pending and not self._readable():
+                self._written.wait(timeout)
+            while len(events) < max_events and self._segments:
+                segment = self._segments[0]
+                if segment.read_pos >= segment.write_pos:
+                    if not segment.sealed:
+                        break
+                    self._segments.popleft()
+                    segment.mmap.close()
+                    os.unlink(segment.path)
+                    continue
+                pos = segment.read_pos
+                (length,) = _LENGTH.unpack_from(segment.mmap, pos)
+                start = pos + _LENGTH.size
+                payload = segment.mmap[start : start + length]
+                segment.read_pos = start + length
+                self._pending -= 1
+                self._size_bytes -= _LENGTH.size + length
+                try:
+                    events.append(_event_from_bytes(payload))
+                except ValueError:
+                    _LOGGER.exception("Error reading an event spilled to disk")
+        return events
+
+    def _readable(self) -> bool:
+        """Return if a written record has not been read yet."""
+        return any(segment.read_pos < segment.write_pos for segment in self._segments)
+
+    def deactivate_if_empty(self) -> bool:
+        """Stop spilling if all spilled events have been read.
+
+        Returns True if the queue was deactivated.
+
+        Must run in the recorder thread.
+        """
+        with self._lock:
+            if self._pending:
+                return False
+            self._active = False
+            return True
+
+    def close(self) -> None:
+        """Stop the writer and unmap the segments.
+
+        Segments that still hold events are kept on disk and recovered
+        on the next load, the records already read are dropped from them
+        so they are not recorded twice.
+
+        Must run in the recorder thread.
+        """
+        with self._lock:
+            self._loaded = False
+            self._active = False
+        if self._writer is not None:
+            self._writer_queue.put(None)
+            self._writer.join()
+            self._writer = None
+        with self._lock:
+            while self._segments:
+                segment = self._segments.popleft()
+                if remaining := segment.write_pos - segment.read_pos:
+                    segment_map = segment.mmap
+                    segment_map.move(0, segment.read_pos, remaining)
+                    segment_map[remaining : segment.write_pos] = bytes(
+                        segment.write_pos - remaining
+                    )
+                    segment_map.flush()
+                    segment_map.close()
+                else:
+                    segment.mmap.close()
+                    os.unlink(segment.path)
+            self._pending = 0
+            self._size_bytes = 0
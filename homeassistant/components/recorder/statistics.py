@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
+import math
 from operator import itemgetter
 import re
 from time import time as time_time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
-from sqlalchemy.engine.row import Row
+from sqlalchemy.engine.row import Row, RowMapping
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.lambdas import StatementLambdaElement
@@ -65,9 +66,13 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDay,
     StatisticsMeta,
+    StatisticsMonth,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
+    StatisticsWeek,
 )
 from .models import (
     StatisticData,
@@ -400,12 +405,15 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    instance: Recorder, session: Session, start: datetime
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+    The hour is then added to the day, week and month rollups.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -457,6 +465,9 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    if summary and _statistics_rollups_maintained(instance):
+        _add_hour_to_statistics_rollups(session, summary, start_time_ts, now_timestamp)
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -613,7 +624,7 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(instance, session, start)
 
     session.add(StatisticsRuns(start=start))
 
@@ -667,6 +678,23 @@ def _adjust_sum_statistics(
         )
 
 
+def _adjust_statistics_rollups(
+    session: Session,
+    metadata_id: int,
+    start_time: datetime,
+    adj: float,
+) -> None:
+    """Adjust the rollups after the sums of the hourly statistics were adjusted.
+
+    The periods starting after start_time are adjusted like the hourly
+    statistics, the period start_time is in is compiled again.
+    """
+    for table in ROLLUP_TABLES.values():
+        _adjust_sum_statistics(session, table, metadata_id, start_time, adj)
+    start_time_ts = start_time.timestamp()
+    _update_statistics_rollups(session, metadata_id, start_time_ts, start_time_ts)
+
+
 def _insert_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -810,7 +838,7 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_read_executor_job(
         list_statistic_ids,
         hass,
         statistic_ids,
@@ -1121,6 +1149,348 @@ def _reduce_statistics_per_month(
     )
 
 
+ROLLUP_TABLES: dict[str, type[StatisticsRollupBase]] = {
+    "day": StatisticsDay,
+    "week": StatisticsWeek,
+    "month": StatisticsMonth,
+}
+
+_ROLLUP_PERIOD_FACTORIES: dict[
+    type[StatisticsRollupBase],
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    StatisticsDay: reduce_day_ts_factory,
+    StatisticsWeek: reduce_week_ts_factory,
+    StatisticsMonth: reduce_month_ts_factory,
+}
+
+# The rollups are reduced before the unit is converted which gives
+# different results for conversions between units which are inverses
+_ROLLUP_UNSUPPORTED_CONVERTERS: set[type[BaseUnitConverter]] = {EnergyDistanceConverter}
+
+_ROLLUP_COLUMNS = ("mean", "mean_weight", "min", "max", "last_reset_ts", "state", "sum")
+
+# The consistency check compares the rollups of the last day
+_ROLLUP_CHECK_SECONDS = timedelta(days=1).total_seconds()
+
+
+def _rollup_period_start_end(
+    table: type[StatisticsRollupBase],
+) -> Callable[[float], tuple[float, float]]:
+    """Return a function returning the start and end of the period of a rollup."""
+    return _ROLLUP_PERIOD_FACTORIES[table]()[1]
+
+
+def _statistics_rollups_current(instance: Recorder) -> bool:
+    """Return if the rollups are built for the current time zone."""
+    return instance.statistics_rollups_time_zone == dt_util.get_default_time_zone()
+
+
+def _statistics_rollups_maintained(instance: Recorder) -> bool:
+    """Return if the rollups should be updated with the hourly statistics.
+
+    The rollups are not updated after the time zone changed until they
+    are rebuilt.
+    """
+    return instance.statistics_rollups_time_zone is None or _statistics_rollups_current(
+        instance
+    )
+
+
+def _add_to_statistics_rollup(
+    rollup: StatisticsRollupBase, stat: Mapping[str, Any] | RowMapping
+) -> None:
+    """Add an hourly statistic to a rollup.
+
+    The hourly statistics must be added in order, the newest hour
+    sets the state and sum of the rollup.
+    """
+    if (_mean := stat.get("mean")) is not None:
+        weight = rollup.mean_weight or 0
+        if rollup.mean is None or not weight:
+            rollup.mean = _mean
+        else:
+            rollup.mean = (rollup.mean * weight + _mean) / (weight + 1)
+        rollup.mean_weight = weight + 1
+    if (_min := stat.get("min")) is not None:
+        rollup.min = _min if rollup.min is None else min(rollup.min, _min)
+    if (_max := stat.get("max")) is not None:
+        rollup.max = _max if rollup.max is None else max(rollup.max, _max)
+    rollup.last_reset_ts = stat.get("last_reset_ts")
+    rollup.state = stat.get("state")
+    rollup.sum = stat.get("sum")
+
+
+def _new_statistics_rollup(
+    table: type[StatisticsRollupBase],
+    metadata_id: int,
+    start_ts: float,
+    now_timestamp: float,
+) -> StatisticsRollupBase:
+    """Return an empty rollup."""
+    return table(  # type: ignore[call-arg]
+        metadata_id=metadata_id, created_ts=now_timestamp, start_ts=start_ts
+    )
+
+
+def _add_hour_to_statistics_rollups(
+    session: Session,
+    summary: dict[int, StatisticDataTimestamp],
+    start_time_ts: float,
+    now_timestamp: float,
+) -> None:
+    """Add the hourly statistics of an hour to the rollups of its periods."""
+    for table in ROLLUP_TABLES.values():
+        period_start_ts = _rollup_period_start_end(table)(start_time_ts)[0]
+        rollups: dict[int | None, StatisticsRollupBase] = {
+            rollup.metadata_id: rollup
+            for rollup in session.query(table).filter(table.start_ts == period_start_ts)
+        }
+        for metadata_id, stat in summary.items():
+            if (rollup := rollups.get(metadata_id)) is None:
+                rollup = _new_statistics_rollup(
+                    table, metadata_id, period_start_ts, now_timestamp
+                )
+                session.add(rollup)
+            _add_to_statistics_rollup(rollup, stat)
+
+
+def _compile_statistics_rollups(
+    session: Session,
+    table: type[StatisticsRollupBase],
+    start_ts: float,
+    end_ts: float,
+    metadata_id: int | None,
+    now_timestamp: float,
+) -> list[StatisticsRollupBase]:
+    """Compile the rollups of the periods from start_ts to end_ts.
+
+    start_ts and end_ts must be aligned with the periods of the table.
+    """
+    period_start_end = _rollup_period_start_end(table)
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS)
+        .filter(Statistics.start_ts >= start_ts)
+        .filter(Statistics.start_ts < end_ts)
+    )
+    if metadata_id is not None:
+        stmt += lambda q: q.filter(Statistics.metadata_id == metadata_id)
+    stmt += lambda q: q.order_by(Statistics.metadata_id, Statistics.start_ts)
+    rows = execute_stmt_lambda_element(
+        session,
+        stmt,
+        dt_util.utc_from_timestamp(start_ts),
+        dt_util.utc_from_timestamp(end_ts),
+        orm_rows=False,
+    )
+    rollups: list[StatisticsRollupBase] = []
+    rollup: StatisticsRollupBase | None = None
+    period_end_ts = 0.0
+    for row in rows:
+        if (
+            rollup is None
+            or row.metadata_id != rollup.metadata_id
+            or row.start_ts >= period_end_ts
+        ):
+            period_start_ts, period_end_ts = period_start_end(row.start_ts)
+            rollup = _new_statistics_rollup(
+                table, row.metadata_id, period_start_ts, now_timestamp
+            )
+            rollups.append(rollup)
+        _add_to_statistics_rollup(rollup, row._mapping)  # noqa: SLF001
+    return rollups
+
+
+def _replace_statistics_rollups(
+    session: Session,
+    table: type[StatisticsRollupBase],
+    start_ts: float | None,
+    end_ts: float | None,
+    metadata_id: int | None,
+    rollups: list[StatisticsRollupBase],
+) -> None:
+    """Replace the rollups from start_ts to end_ts."""
+    query = session.query(table)
+    if start_ts is not None:
+        query = query.filter(table.start_ts >= start_ts)
+    if end_ts is not None:
+        query = query.filter(table.start_ts < end_ts)
+    if metadata_id is not None:
+        query = query.filter(table.metadata_id == metadata_id)
+    query.delete(synchronize_session=False)
+    session.add_all(rollups)
+
+
+def _update_statistics_rollups(
+    session: Session,
+    metadata_id: int,
+    first_start_ts: float,
+    last_start_ts: float,
+) -> None:
+    """Rebuild the rollups of a statistic after its hourly statistics changed."""
+    now_timestamp = time_time()
+    session.flush()
+    for table in ROLLUP_TABLES.values():
+        period_start_end = _rollup_period_start_end(table)
+        start_ts = period_start_end(first_start_ts)[0]
+        end_ts = period_start_end(last_start_ts)[1]
+        _replace_statistics_rollups(
+            session,
+            table,
+            start_ts,
+            end_ts,
+            metadata_id,
+            _compile_statistics_rollups(
+                session, table, start_ts, end_ts, metadata_id, now_timestamp
+            ),
+        )
+
+
+def rebuild_statistics_rollups(
+    instance: Recorder, start_ts: float | None
+) -> float | None:
+    """Rebuild the rollups of one month of hourly statistics.
+
+    Pass None to start with the oldest month, returns the start of the
+    next month to rebuild or None when all months are rebuilt.
+    """
+    now_timestamp = time_time()
+    first = start_ts is None
+    with session_scope(session=instance.get_session()) as session:
+        newest_ts: float | None = session.query(func.max(Statistics.start_ts)).scalar()
+        if start_ts is None:
+            start_ts = session.query(func.min(Statistics.start_ts)).scalar()
+        if newest_ts is None or start_ts is None:
+            for table in ROLLUP_TABLES.values():
+                session.query(table).delete(synchronize_session=False)
+            return None
+        month_start_ts, month_end_ts = reduce_month_ts_factory()[1](start_ts)
+        last = month_end_ts > newest_ts
+        _LOGGER.debug(
+            "Rebuilding statistics rollups for %s",
+            dt_util.utc_from_timestamp(month_start_ts),
+        )
+        for table in ROLLUP_TABLES.values():
+            period_start_end = _rollup_period_start_end(table)
+            period_start_ts = period_start_end(month_start_ts)[0]
+            period_end_ts = period_start_end(month_end_ts - 1)[1]
+            # The first and last months also remove the rollups before
+            # and after them which were built for another time zone
+            _replace_statistics_rollups(
+                session,
+                table,
+                None if first else period_start_ts,
+                None if last else period_end_ts,
+                None,
+                _compile_statistics_rollups(
+                    session, table, period_start_ts, period_end_ts, None, now_timestamp
+                ),
+            )
+    return None if last else month_end_ts
+
+
+def _statistics_rollups_match(
+    rollup: StatisticsRollupBase, other: StatisticsRollupBase
+) -> bool:
+    """Return if two rollups have the same values."""
+    for column in _ROLLUP_COLUMNS:
+        value = getattr(rollup, column)
+        other_value = getattr(other, column)
+        if value is None or other_value is None:
+            if value is not other_value:
+                return False
+        elif not math.isclose(value, other_value, rel_tol=1e-9):
+            return False
+    return True
+
+
+def check_statistics_rollups(instance: Recorder) -> bool:
+    """Check the rollups against the hourly statistics.
+
+    Returns False if the rollups are not aligned with the periods of the
+    local time zone or do not reach the newest hourly statistics and must
+    be rebuilt. The rollups of the last day which do not match the hourly
+    statistics are repaired.
+    """
+    now_timestamp = time_time()
+    repaired = 0
+    with session_scope(session=instance.get_session()) as session:
+        newest_ts: float | None = session.query(func.max(Statistics.start_ts)).scalar()
+        if newest_ts is None:
+            return True
+        for table in ROLLUP_TABLES.values():
+            period_start_end = _rollup_period_start_end(table)
+            newest_period_start_ts, end_ts = period_start_end(newest_ts)
+            if session.query(func.max(table.start_ts)).scalar() != (
+                newest_period_start_ts
+            ):
+                return False
+            start_ts = period_start_end(newest_ts - _ROLLUP_CHECK_SECONDS)[0]
+            rollups = _compile_statistics_rollups(
+                session, table, start_ts, end_ts, None, now_timestamp
+            )
+            compiled = {
+                (rollup.metadata_id, rollup.start_ts): rollup for rollup in rollups
+            }
+            existing = {
+                (rollup.metadata_id, rollup.start_ts): rollup
+                for rollup in session.query(table)
+                .filter(table.start_ts >= start_ts)
+                .filter(table.start_ts < end_ts)
+            }
+            # The loaded rollups are updated in place, replacing them would
+            # add new rows with the ids of the rows still in the session
+            for key, rollup in existing.items():
+                if key not in compiled:
+                    repaired += 1
+                    session.delete(rollup)
+            for key, rollup in compiled.items():
+                if (existing_rollup := existing.get(key)) is None:
+                    repaired += 1
+                    session.add(rollup)
+                elif not _statistics_rollups_match(rollup, existing_rollup):
+                    repaired += 1
+                    for column in _ROLLUP_COLUMNS:
+                        setattr(existing_rollup, column, getattr(rollup, column))
+    if repaired:
+        _LOGGER.warning(
+            "Repaired %s statistics rollups which did not match the hourly statistics",
+            repaired,
+        )
+    return True
+
+
+def _rollup_table_for_period(
+    instance: Recorder,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+) -> type[StatisticsRollupBase] | None:
+    """Return the rollup table to read a period from, if it can be used."""
+    table = ROLLUP_TABLES.get(period)
+    if table is None or not _statistics_rollups_current(instance):
+        return None
+    for _, stats_metadata in metadata.values():
+        if (
+            STATISTIC_UNIT_TO_UNIT_CONVERTER.get(stats_metadata["unit_of_measurement"])
+            in _ROLLUP_UNSUPPORTED_CONVERTERS
+        ):
+            return None
+    return table
+
+
+def _set_statistics_rollups_end(
+    result: dict[str, list[StatisticsRow]], table: type[StatisticsRollupBase]
+) -> None:
+    """Set the end of the rollups, the length of the periods varies."""
+    period_start_end = _rollup_period_start_end(table)
+    for rows in result.values():
+        for row in rows:
+            row["end"] = period_start_end(row["start"])[1]
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1661,7 +2031,7 @@ def _augment_result_with_change(
     start_time: datetime,
     units: dict[str, str] | None,
     _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[StatisticsBase],
     metadata: dict[str, tuple[int, StatisticMetaData]],
     result: dict[str, list[StatisticsRow]],
 ) -> None:
@@ -1726,7 +2096,8 @@ def _statistics_during_period_with_session(
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
     # Fetch metadata for the given (or all) statistic_ids
-    metadata = get_instance(hass).statistics_meta_manager.get_many(
+    instance = get_instance(hass)
+    metadata = instance.statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
     )
     if not metadata:
@@ -1773,9 +2144,14 @@ def _statistics_during_period_with_session(
         if end_time is not None:
             end_time = _find_month_end_time(dt_util.as_local(end_time))
 
-    table: type[Statistics | StatisticsShortTerm] = (
-        Statistics if period != "5minute" else StatisticsShortTerm
-    )
+    # Days, weeks and months are read from the rollups if they are
+    # up to date, otherwise they are reduced from hourly statistics
+    rollup_table = _rollup_table_for_period(instance, period, metadata)
+    table: type[StatisticsBase]
+    if rollup_table is not None:
+        table = rollup_table
+    else:
+        table = Statistics if period != "5minute" else StatisticsShortTerm
     stmt = _generate_statistics_during_period_stmt(
         start_time, end_time, metadata_ids, table, types
     )
@@ -1797,13 +2173,16 @@ def _statistics_during_period_with_session(
         types,
     )
 
-    if period == "day":
+    if rollup_table is not None:
+        _set_statistics_rollups_end(result, rollup_table)
+
+    elif period == "day":
         result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
+    elif period == "week":
         result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
+    elif period == "month":
         result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
@@ -2446,15 +2825,40 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
+    imported = False
     with session_scope(
         session=instance.get_session(),
         exception_filter=filter_unique_constraint_integrity_error(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
+    if imported and table != StatisticsShortTerm:
+        _update_imported_statistics_rollups(
+            instance, metadata["statistic_id"], statistics
+        )
+    return imported
+
+
+def _update_imported_statistics_rollups(
+    instance: Recorder, statistic_id: str, statistics: Iterable[StatisticData]
+) -> None:
+    """Update the rollups after importing hourly statistics.
+
+    The rollups are updated after the imported statistics are committed,
+    flushing them earlier would fail the import on a blocked duplicate.
+    """
+    if not _statistics_rollups_maintained(instance):
+        return
+    if not (start_times := [stat["start"].timestamp() for stat in statistics]):
+        return
+    with session_scope(session=instance.get_session()) as session:
+        if metadata := instance.statistics_meta_manager.get(session, statistic_id):
+            _update_statistics_rollups(
+                session, metadata[0], min(start_times), max(start_times)
+            )
 
 
 @retryable_database_job("adjust_statistics")
@@ -2496,6 +2900,14 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        if _statistics_rollups_maintained(instance):
+            _adjust_statistics_rollups(
+                session,
+                metadata[statistic_id][0],
+                start_time.replace(minute=0),
+                sum_adjustment,
+            )
+
     return True
 
 
@@ -2556,6 +2968,7 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            *ROLLUP_TABLES.values(),
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any, cast
 
+from sqlalchemy import insert
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
@@ -12,6 +13,14 @@ from ..db_schema import States
 from ..queries import find_oldest_state
 from ..util import execute_stmt_lambda_element
 
+# Columns copied as is from the States objects when inserting in bulk,
+# the foreign keys are resolved from the relationships instead.
+_BULK_INSERT_COPIED_COLUMNS = tuple(
+    column.key
+    for column in States.__table__.columns
+    if column.key not in ("state_id", "old_state_id", "attributes_id", "metadata_id")
+)
+
 
 class StatesManager:
     """Manage the states table."""
@@ -22,6 +31,7 @@ class StatesManager:
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
         self._oldest_ts: float | None = None
+        self._pending_inserts: list[States] = []
 
     @property
     def oldest_ts(self) -> float | None:
@@ -61,6 +71,80 @@ class StatesManager:
         if self._oldest_ts is None:
             self._oldest_ts = state.last_updated_ts
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to insert in bulk on the next commit.
+
+        The state is not added to the session, it is inserted by
+        insert_pending instead of the ORM unit of work.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the states added with add_pending_insert in bulk.
+
+        The session must be flushed before so the pending StatesMeta
+        and StateAttributes rows have their ids.
+
+        A state that links to a state of the same batch as old state is
+        inserted in a later round once the id of its old state is known, so
+        the number of statements grows with the number of changes of a
+        single entity in the commit interval, not with the number of states.
+
+        The database must support returning the ids of a multi row insert
+        in order.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        # A state is only removed from the pending inserts once its round
+        # was inserted. If a statement fails, the states inserted before
+        # are still part of the transaction and the commit is retried with
+        # the remaining states, so no state is lost or inserted twice.
+        pending = {id(dbstate) for dbstate in self._pending_inserts}
+        stmt = insert(States).returning(States.state_id, sort_by_parameter_order=True)
+        while self._pending_inserts:
+            rows: list[dict[str, Any]] = []
+            inserting: list[States] = []
+            deferred: list[States] = []
+            for dbstate in self._pending_inserts:
+                old_state_id: int | None
+                if (old_state := dbstate.old_state) is None:
+                    old_state_id = dbstate.old_state_id
+                elif id(old_state) not in pending:
+                    old_state_id = old_state.state_id
+                else:
+                    deferred.append(dbstate)
+                    continue
+                row = {
+                    key: getattr(dbstate, key) for key in _BULK_INSERT_COPIED_COLUMNS
+                }
+                row["old_state_id"] = old_state_id
+                row["attributes_id"] = (
+                    attributes.attributes_id
+                    if (attributes := dbstate.state_attributes)
+                    else dbstate.attributes_id
+                )
+                row["metadata_id"] = (
+                    states_meta.metadata_id
+                    if (states_meta := dbstate.states_meta_rel)
+                    else dbstate.metadata_id
+                )
+                rows.append(row)
+                inserting.append(dbstate)
+            state_ids = session.execute(stmt, rows).scalars().all()
+            for dbstate, state_id in zip(inserting, state_ids, strict=True):
+                dbstate.state_id = state_id
+                pending.discard(id(dbstate))
+            self._pending_inserts = deferred
+
+    @property
+    def has_pending_inserts(self) -> bool:
+        """Return if there are states to insert in bulk."""
+        return bool(self._pending_inserts)
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -90,6 +174,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
         self._oldest_ts = None
 
     def load_from_db(self, session: Session) -> None:
@@ -125,6 +210,16 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_state_ids_up_to(self, max_state_id: int) -> None:
+        """Evict the committed states up to max_state_id.
+
+        Used when a whole partition of states is dropped.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id, state_id in list(last_committed_ids.items()):
+            if state_id <= max_state_id:
+                del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -6,13 +6,15 @@ import abc
 import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, tzinfo
 import logging
 import threading
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import Event
 from homeassistant.helpers.recorder import DATA_RECORDER
 from homeassistant.helpers.typing import UndefinedType
+from homeassistant.util import dt as dt_util
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
@@ -54,6 +56,7 @@ class ChangeStatisticsUnitTask(RecorderTask):
             self.new_unit_of_measurement,
             self.old_unit_of_measurement,
         )
+        instance.statistics_generation += 1
 
 
 @dataclass(slots=True)
@@ -66,6 +69,7 @@ class ClearStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
         statistics.clear_statistics(instance, self.statistic_ids)
+        instance.statistics_generation += 1
         if self.on_done:
             self.on_done()
 
@@ -87,6 +91,7 @@ class UpdateStatisticsMetadataTask(RecorderTask):
             self.new_statistic_id,
             self.new_unit_of_measurement,
         )
+        instance.statistics_generation += 1
         if self.on_done:
             self.on_done()
 
@@ -126,9 +131,14 @@ class PurgeTask(RecorderTask):
             periodic_db_cleanups(instance)
             return
         # Schedule a new purge task if this one didn't finish
-        instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
-        )
+        task = PurgeTask(self.purge_before, self.repack, self.apply_filter)
+        if instance.purge_scheduler.budget_exhausted:
+            # Give the database a break before the next slice
+            instance.hass.add_job(
+                instance.async_queue_task_later, purge.PURGE_SLICE_PAUSE, task
+            )
+            return
+        instance.queue_task(task)
 
 
 @dataclass(slots=True)
@@ -180,6 +190,7 @@ class CompileMissingStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Run statistics task to compile missing statistics."""
         if statistics.compile_missing_statistics(instance):
+            instance.statistics_generation += 1
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(CompileMissingStatisticsTask())
@@ -198,6 +209,7 @@ class ImportStatisticsTask(RecorderTask):
         if statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            instance.statistics_generation += 1
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(
@@ -223,6 +235,7 @@ class AdjustStatisticsTask(RecorderTask):
             self.sum_adjustment,
             self.adjustment_unit,
         ):
+            instance.statistics_generation += 1
             return
         # Schedule a new adjust statistics task if this one didn't finish
         instance.queue_task(
@@ -295,6 +308,77 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class EventBatchTask(RecorderTask):
+    """Record a batch of events fired together."""
+
+    events: list[Event]
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._process_event_batch(self.events)  # noqa: SLF001
+
+
+@dataclass(slots=True)
+class DrainSpillQueueTask(RecorderTask):
+    """Record the events spilled to disk in order."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._drain_spill_queue()  # noqa: SLF001
+
+
+@dataclass(slots=True)
+class StatesPartitionsTask(RecorderTask):
+    """Create the upcoming partitions of the states table."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._setup_states_partitions()  # noqa: SLF001
+
+
+@dataclass(slots=True)
+class StatisticsRollupsCheckTask(RecorderTask):
+    """Check the statistics rollups and rebuild them if needed."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        time_zone = dt_util.get_default_time_zone()
+        if statistics.check_statistics_rollups(instance):
+            instance.statistics_rollups_time_zone = time_zone
+            return
+        _LOGGER.warning(
+            "Rebuilding the statistics rollups for the %s time zone", time_zone
+        )
+        instance.statistics_rollups_time_zone = None
+        instance.queue_task(RebuildStatisticsRollupsTask(None, time_zone))
+
+
+@dataclass(slots=True)
+class RebuildStatisticsRollupsTask(RecorderTask):
+    """Rebuild the statistics rollups one month at a time."""
+
+    start_ts: float | None
+    time_zone: tzinfo
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        if self.time_zone != (time_zone := dt_util.get_default_time_zone()):
+            # The time zone changed while rebuilding, start over
+            instance.queue_task(RebuildStatisticsRollupsTask(None, time_zone))
+            return
+        if (
+            start_ts := statistics.rebuild_statistics_rollups(instance, self.start_ts)
+        ) is None:
+            _LOGGER.warning("Statistics rollups rebuilt")
+            instance.statistics_rollups_time_zone = time_zone
+            return
+        instance.queue_task(RebuildStatisticsRollupsTask(start_ts, time_zone))
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
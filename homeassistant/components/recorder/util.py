@@ -570,6 +570,14 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_only_connection(dbapi_connection: DBAPIConnection) -> None:
+    """Prevent a SQLite reader connection from writing.
+
+    WAL mode lets the readers run concurrently with the writer.
+    """
+    execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
@@ -9,6 +10,8 @@ import datetime
 import itertools
 import logging
 import math
+from operator import attrgetter
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -26,12 +29,20 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -78,6 +89,127 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# The buffer starts over if the statistics fall this many states behind
+MAX_BUFFERED_STATES = 250000
+
+_last_updated = attrgetter("last_updated")
+
+
+class StatisticsStatesBuffer:
+    """Collect the sensor states needed to compile the next statistics.
+
+    The states are collected from state_changed events so compiling the
+    statistics of a period does not have to select them from the database.
+    Each period drops the states before it, except the last one which is
+    the state at the start of the next period.
+
+    The database is still used for periods which started before the
+    buffer, after a restart or when the buffer had to start over.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the buffer."""
+        self._hass = hass
+        # The states are added in the event loop and
+        # taken by the statistics run in the recorder thread
+        self._lock = threading.Lock()
+        self._states: dict[str, list[State]] = {}
+        self._count = 0
+        # The buffer has all states from this time
+        self._since: datetime.datetime | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start collecting states."""
+        self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, _async_sensor_filter
+        )
+        with self._lock:
+            self._async_reset()
+
+    @callback
+    def _async_reset(self) -> None:
+        """Start over from the current states."""
+        self._states = {
+            state.entity_id: [state]
+            for state in self._hass.states.async_all(DOMAIN)
+            if ATTR_STATE_CLASS in state.attributes
+        }
+        self._count = len(self._states)
+        # States set with a time in the future would otherwise be missed
+        self._since = max(
+            [
+                dt_util.utcnow(),
+                *(states[0].last_updated for states in self._states.values()),
+            ]
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        with self._lock:
+            if self._since is None:
+                return
+            if new_state is None or ATTR_STATE_CLASS not in new_state.attributes:
+                # Removed sensors and sensors without a state
+                # class have no statistics to compile
+                if (states := self._states.pop(entity_id, None)) is not None:
+                    self._count -= len(states)
+                return
+            if new_state.last_updated < self._since:
+                # The clock went backwards, states may be missing
+                self._async_reset()
+                return
+            if (states := self._states.get(entity_id)) is None:
+                states = self._states[entity_id] = []
+                if (old_state := event.data["old_state"]) is not None:
+                    states.append(old_state)
+                    self._count += 1
+            states.append(new_state)
+            self._count += 1
+            if self._count > MAX_BUFFERED_STATES:
+                _LOGGER.debug("Statistics fell behind, no longer buffering states")
+                self._async_reset()
+
+    def get_states(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> dict[str, list[State]] | None:
+        """Return the states of a period and drop the states before it.
+
+        The states of each sensor start with the last state before the
+        period, if there is one.
+
+        Returns None if the buffer does not have all states of the period.
+        """
+        with self._lock:
+            if self._since is None or start < self._since:
+                return None
+            period_states: dict[str, list[State]] = {}
+            count = 0
+            for entity_id, states in self._states.items():
+                start_idx = max(bisect_left(states, start, key=_last_updated) - 1, 0)
+                end_idx = bisect_left(states, end, key=_last_updated)
+                if end_idx:
+                    period_states[entity_id] = states[start_idx:end_idx]
+                    del states[: end_idx - 1]
+                count += len(states)
+            self._count = count
+            self._since = end
+            return period_states
+
+
+# States collected for the next statistics run
+STATES_BUFFER: HassKey[StatisticsStatesBuffer] = HassKey(
+    f"{DOMAIN}_statistics_states_buffer"
+)
+
+
+@callback
+def _async_sensor_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changes of sensors."""
+    return split_entity_id(event_data["entity_id"])[0] == DOMAIN
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -402,22 +534,36 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+def compile_statistics(
     hass: HomeAssistant,
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
 ) -> statistics.PlatformCompiledStatistics:
     """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
-
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    history_list: dict[str, list[State]] | None
+    if (history_list := _buffered_history(hass, start, end)) is not None:
+        for entity_id, entity_history in history_list.items():
+            if entity_id in wanted_statistics and (
+                "sum" not in wanted_statistics[entity_id]
+            ):
+                # Only the significant states, like the database query below
+                history_list[entity_id] = [
+                    state
+                    for state in entity_history
+                    if state.last_updated < start
+                    or state.last_changed == state.last_updated
+                ]
+        return _compile_statistics(
+            hass, session, start, end, sensor_states, wanted_statistics, history_list
+        )
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: dict[str, list[State]] = {}
+    history_list = {}
     if entities_full_history:
         history_list = history.get_full_significant_states_with_session(
             hass,
@@ -441,6 +587,37 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+    return _compile_statistics(
+        hass, session, start, end, sensor_states, wanted_statistics, history_list
+    )
+
+
+def _buffered_history(
+    hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
+) -> dict[str, list[State]] | None:
+    """Return the buffered states of the period.
+
+    Starts the buffer on the first statistics run, the next runs
+    can then use it instead of selecting the states.
+    """
+    if (buffer := hass.data.get(STATES_BUFFER)) is None:
+        buffer = hass.data[STATES_BUFFER] = StatisticsStatesBuffer(hass)
+        hass.add_job(buffer.async_start)
+        return None
+    return buffer.get_states(start, end)
+
+
+def _compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    history_list: dict[str, list[State]],
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end from their states."""
+    result: list[StatisticResult] = []
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
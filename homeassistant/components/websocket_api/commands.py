@@ -64,6 +64,7 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_diffs import async_subscribe_entity_diffs
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -394,6 +395,38 @@ def _forward_entity_changes(
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+@callback
+def _forward_entity_changes_batch(
+    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    message_id_as_bytes: bytes,
+    events: list[Event[EventStateChangedData]],
+) -> None:
+    """Forward a batch of entity state changed events to websocket."""
+    if entity_ids or entity_filter:
+        events = [
+            event
+            for event in events
+            if (not entity_ids or event.data["entity_id"] in entity_ids)
+            and (not entity_filter or entity_filter(event.data["entity_id"]))
+        ]
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    if not user.is_admin and not permissions.access_all_entities(POLICY_READ):
+        events = [
+            event
+            for event in events
+            if permissions.check_entity(event.data["entity_id"], POLICY_READ)
+        ]
+    if not events:
+        return
+    for message in messages.state_diff_batch_messages(message_id_as_bytes, events):
+        send_message(message)
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -415,17 +448,35 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
+    if const.FEATURE_BATCH_ENTITY_DIFFS in connection.supported_features:
+        connection.subscriptions[msg_id] = async_subscribe_entity_diffs(
+            hass,
+            connection.user,
             entity_ids,
             entity_filter,
-            connection.user,
+            connection.send_message,
             message_id_as_bytes,
-        ),
-    )
+        )
+    else:
+        connection.subscriptions[msg_id] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_entity_changes,
+                connection.send_message,
+                entity_ids,
+                entity_filter,
+                connection.user,
+                message_id_as_bytes,
+            ),
+            batch_listener=partial(
+                _forward_entity_changes_batch,
+                connection.send_message,
+                entity_ids,
+                entity_filter,
+                connection.user,
+                message_id_as_bytes,
+            ),
+        )
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -40,6 +40,7 @@ class ActiveConnection:
     """Handle an active websocket client connection."""
 
     __slots__ = (
+        "_wait_send_queue_drained",
         "binary_handlers",
         "can_coalesce",
         "handlers",
@@ -60,6 +61,7 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_send_queue_drained: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -75,12 +77,22 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._wait_send_queue_drained = wait_send_queue_drained
         current_connection.set(self)
 
     def __repr__(self) -> str:
         """Return the representation."""
         return f"<ActiveConnection {self.get_description(None)}>"
 
+    async def async_wait_send_queue_drained(self) -> None:
+        """Wait until the queued messages have been written to the client.
+
+        Commands that send a large response in chunks wait between
+        chunks so a slow client does not make the queue grow.
+        """
+        if self._wait_send_queue_drained is not None:
+            await self._wait_send_queue_drained()
+
     def set_supported_features(self, features: dict[str, float]) -> None:
         """Set supported features."""
         self.supported_features = features
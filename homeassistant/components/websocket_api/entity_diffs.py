@@ -0,0 +1,175 @@
+"""Share the batched state diffs of subscribe_entities between connections."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.timer_wheel import TimerWheelHandle
+
+from . import messages
+from .const import DOMAIN
+
+# The state diffs of the events fired during this many seconds are sent in
+# one go to connections which support batched entity diffs
+ENTITY_DIFF_FLUSH_INTERVAL = 0.1
+
+type _SubscriptionKey = tuple[str, frozenset[str] | None]
+type _SendMessage = Callable[[str | bytes | dict[str, Any]], None]
+
+
+class EntityDiffSubscription:
+    """Connections subscribed to the same entities of the same user.
+
+    The state changed events are filtered once for all connections, and
+    the diffs of the events of a flush interval are serialized once and
+    sent to each connection with its own message id.
+    """
+
+    __slots__ = (
+        "_entity_filter",
+        "_entity_ids",
+        "_events",
+        "_flush_handle",
+        "_hass",
+        "_key",
+        "_subscribers",
+        "_unsub_state_changed",
+        "_user",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: _SubscriptionKey | None,
+        user: User,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+    ) -> None:
+        """Initialize the subscription."""
+        self._hass = hass
+        self._key = key
+        self._user = user
+        self._entity_ids = entity_ids
+        self._entity_filter = entity_filter
+        self._subscribers: dict[object, tuple[_SendMessage, bytes]] = {}
+        self._events: list[Event[EventStateChangedData]] = []
+        self._flush_handle: TimerWheelHandle | None = None
+        self._unsub_state_changed = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_handle_state_changed,
+            event_filter=self._async_filter_state_changed,
+        )
+
+    @callback
+    def async_add_subscriber(
+        self, send_message: _SendMessage, message_id_as_bytes: bytes
+    ) -> CALLBACK_TYPE:
+        """Add a connection, it gets the diffs of events fired from now on."""
+        # Diffs of earlier events are already part of the states the
+        # connection was sent when it subscribed
+        self._async_flush()
+        token = object()
+        self._subscribers[token] = (send_message, message_id_as_bytes)
+        return lambda: self._async_remove_subscriber(token)
+
+    @callback
+    def _async_remove_subscriber(self, token: object) -> None:
+        """Remove a connection, the last one removes the subscription."""
+        if self._subscribers.pop(token, None) is None or self._subscribers:
+            return
+        self._unsub_state_changed()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._events.clear()
+        if self._key is not None:
+            del self._hass.data[DATA_ENTITY_DIFF_SUBSCRIPTIONS][self._key]
+
+    @callback
+    def _async_filter_state_changed(self, event_data: EventStateChangedData) -> bool:
+        """Filter state changed events of the subscribed entities."""
+        entity_id = event_data["entity_id"]
+        return (not self._entity_ids or entity_id in self._entity_ids) and (
+            not self._entity_filter or self._entity_filter(entity_id)
+        )
+
+    @callback
+    def _async_handle_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Queue the event until the next flush."""
+        self._events.append(event)
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.timer_wheel.async_call_later(
+                ENTITY_DIFF_FLUSH_INTERVAL, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the diffs of the queued events to all connections."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not (events := self._events):
+            return
+        self._events = []
+        # We have to lookup the permissions again because the user might have
+        # changed since the subscription was created.
+        user = self._user
+        permissions = user.permissions
+        if not user.is_admin and not permissions.access_all_entities(POLICY_READ):
+            events = [
+                event
+                for event in events
+                if permissions.check_entity(event.data["entity_id"], POLICY_READ)
+            ]
+            if not events:
+                return
+        partial_messages = messages.partial_state_diff_batch_messages(events)
+        for send_message, message_id_as_bytes in list(self._subscribers.values()):
+            for partial_message in partial_messages:
+                send_message(
+                    messages.message_with_id(partial_message, message_id_as_bytes)
+                )
+
+
+@callback
+def async_subscribe_entity_diffs(
+    hass: HomeAssistant,
+    user: User,
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    send_message: _SendMessage,
+    message_id_as_bytes: bytes,
+) -> CALLBACK_TYPE:
+    """Send batched state diffs of entities to a connection.
+
+    Connections of the same user subscribed to the same entities share a
+    subscription. Subscriptions with an entity filter are not shared.
+    """
+    if entity_filter is not None:
+        return EntityDiffSubscription(
+            hass, None, user, entity_ids, entity_filter
+        ).async_add_subscriber(send_message, message_id_as_bytes)
+    subscriptions = hass.data.setdefault(DATA_ENTITY_DIFF_SUBSCRIPTIONS, {})
+    key = (user.id, frozenset(entity_ids) if entity_ids else None)
+    if (subscription := subscriptions.get(key)) is None:
+        subscription = subscriptions[key] = EntityDiffSubscription(
+            hass, key, user, entity_ids, None
+        )
+    return subscription.async_add_subscriber(send_message, message_id_as_bytes)
+
+
+DATA_ENTITY_DIFF_SUBSCRIPTIONS: HassKey[
+    dict[_SubscriptionKey, EntityDiffSubscription]
+] = HassKey(f"{DOMAIN}_entity_diff_subscriptions")
@@ -73,6 +73,7 @@ class WebSocketHandler:
         "_authenticated",
         "_closing",
         "_connection",
+        "_drained_future",
         "_handle_task",
         "_hass",
         "_logger",
@@ -107,6 +108,8 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Resolved by the writer once the queue is empty
+        self._drained_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -145,6 +148,7 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if not message_queue:
+                    self._release_drained_future()
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -176,6 +180,24 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drained_future()
+
+    @callback
+    def _release_drained_future(self) -> None:
+        """Release the tasks waiting for the queue to be written."""
+        if (drained_future := self._drained_future) is not None:
+            self._drained_future = None
+            if not drained_future.done():
+                drained_future.set_result(None)
+
+    async def _async_wait_send_queue_drained(self) -> None:
+        """Wait until the writer has sent all queued messages."""
+        if self._closing or not self._message_queue:
+            return
+        if self._drained_future is None:
+            self._drained_future = self._loop.create_future()
+        # Shielded since several commands may wait on the same future
+        await asyncio.shield(self._drained_future)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -332,7 +354,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_wait_send_queue_drained,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
@@ -364,6 +392,7 @@ class WebSocketHandler:
             self._closing = True
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
+            self._release_drained_future()
 
             await self._async_cleanup_writer_and_close(disconnect_warn, connection)
 
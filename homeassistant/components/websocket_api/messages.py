@@ -162,6 +162,62 @@ def cached_state_diff_message(
     )
 
 
+def state_diff_batch_messages(
+    message_id_as_bytes: bytes, events: list[Event[EventStateChangedData]]
+) -> list[bytes]:
+    """Return event messages combining the state diffs of a batch of events.
+
+    Consecutive events are merged into a single message, a new message is
+    started when an entity changes more than once so no diff is lost.
+    """
+    return [
+        message_with_id(message, message_id_as_bytes)
+        for message in partial_state_diff_batch_messages(events)
+    ]
+
+
+def partial_state_diff_batch_messages(
+    events: list[Event[EventStateChangedData]],
+) -> list[bytes]:
+    """Return the messages of state_diff_batch_messages without the id.
+
+    The messages can be shared by connections subscribed to the same
+    entities, the id is added with message_with_id.
+    """
+    if len(events) == 1:
+        return [_partial_cached_state_diff_message(events[0])]
+    messages: list[bytes] = []
+    combined: dict[str, Any] = {}
+    entity_ids: set[str] = set()
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if entity_id in entity_ids:
+            messages.append(_partial_state_diff_batch_message(combined))
+            combined = {}
+            entity_ids.clear()
+        entity_ids.add(entity_id)
+        for key, value in _state_diff_event(event).items():
+            if key == ENTITY_EVENT_REMOVE:
+                combined.setdefault(key, []).extend(value)
+            else:
+                combined.setdefault(key, {}).update(value)
+    messages.append(_partial_state_diff_batch_message(combined))
+    return messages
+
+
+def message_with_id(partial_message: bytes, message_id_as_bytes: bytes) -> bytes:
+    """Add the id to a message serialized without it."""
+    return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
+
+
+def _partial_state_diff_batch_message(combined: dict[str, Any]) -> bytes:
+    """Serialize a combined state diff event message without the id."""
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": combined})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
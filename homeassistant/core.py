@@ -15,6 +15,7 @@ from collections.abc import (
     Iterable,
     KeysView,
     Mapping,
+    Sequence,
     ValuesView,
 )
 import concurrent.futures
@@ -33,6 +34,7 @@ from typing import (
     Any,
     Final,
     Generic,
+    NamedTuple,
     NotRequired,
     Self,
     TypedDict,
@@ -40,6 +42,7 @@ from typing import (
     cast,
     overload,
 )
+import weakref
 
 from propcache.api import cached_property, under_cached_property
 import voluptuous as vol
@@ -105,6 +108,7 @@ from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
+from .util.timer_wheel import TimerWheel
 from .util.ulid import ulid_at_time, ulid_now
 
 # Typing imports that create a circular dependency
@@ -449,6 +453,8 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Timers of the helpers sharing the handles of the event loop
+        self.timer_wheel = TimerWheel(self.loop)
         self._stop_future: concurrent.futures.Future[None] | None = None
         self._shutdown_jobs: list[HassJobWithArgs] = []
         self.import_executor = InterruptibleThreadPoolExecutor(
@@ -1420,6 +1426,11 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+_IndexedJobType = tuple[
+    _FilterableJobType[_DataT],  # filterable job
+    tuple[tuple[str, Any], ...],  # remaining event_data_match items
+]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1459,13 +1470,29 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_debug",
+        "_hass",
+        "_indexed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        # event_type -> event_data key -> event_data value -> jobs
+        self._indexed_listeners: dict[
+            EventType[Any] | str, dict[str, dict[Any, list[_IndexedJobType[Any]]]]
+        ] = {}
+        # filterable job -> job receiving all matching events of a batch at once
+        self._batch_listeners: dict[
+            _FilterableJobType[Any],
+            HassJob[[list[Event[Any]]], Coroutine[Any, Any, None] | None],
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1483,7 +1510,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(jobs) for key, jobs in self._listeners.items()}
+        for event_type, indexed in self._indexed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for by_value in indexed.values() for jobs in by_value.values()
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1549,6 +1581,10 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (
+            indexed := self._indexed_listeners.get(event_type)
+        ):
+            listeners = listeners + _async_match_indexed_listeners(indexed, event_data)
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1578,6 +1614,71 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def async_fire_batch_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        events: Sequence[Event[_DataT]],
+    ) -> None:
+        """Fire a batch of events of the same type, for internal use only.
+
+        Listeners registered with a batch_listener receive all matching
+        events of the batch in a single call, all other listeners receive
+        the events one by one in order, as if they were fired individually.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        indexed = self._indexed_listeners.get(event_type)
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            listeners = listeners + self._match_all_listeners
+        batch_listeners = self._batch_listeners
+        batches: dict[_FilterableJobType[_DataT], list[Event[_DataT]]] = {}
+
+        for event in events:
+            event_data = event.data
+            if self._debug:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, event.origin, event_data)
+                )
+            event_listeners = listeners
+            if indexed:
+                event_listeners = event_listeners + _async_match_indexed_listeners(
+                    indexed, event_data
+                )
+            for filterable_job in event_listeners:
+                job, event_filter = filterable_job
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+
+                if batch_listeners and filterable_job in batch_listeners:
+                    if (batch := batches.get(filterable_job)) is None:
+                        batches[filterable_job] = batch = []
+                    batch.append(event)
+                    continue
+
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+        for filterable_job, batch in batches.items():
+            batch_job = batch_listeners[filterable_job]
+            try:
+                self._hass.async_run_hass_job(batch_job, batch)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", batch_job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1605,6 +1706,11 @@ class EventBus:
         listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[_DataT], bool] | None = None,
         run_immediately: bool | object = _SENTINEL,
+        event_data_match: Mapping[str, Any] | None = None,
+        batch_listener: Callable[
+            [list[Event[_DataT]]], Coroutine[Any, Any, None] | None
+        ]
+        | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1615,6 +1721,19 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        An optional event_data_match, a mapping of event data keys to
+        hashable values (for example ``{"domain": "light"}``), limits the
+        listener to events whose data contains all of the given items.
+        Unlike event_filter, it is resolved through an index so the cost
+        of firing an event only grows with the number of matching
+        listeners. If both are passed, event_filter runs after the
+        event_data_match has matched.
+
+        An optional batch_listener is called instead of listener when
+        events are fired as a batch (for example by
+        StateMachine.async_set_many) with all events of the batch that
+        passed the filters, so the batch can be processed in one pass.
+
         If run_immediately is passed:
           - callbacks will be run right away instead of using call_soon.
           - coroutine functions will be scheduled eagerly.
@@ -1635,12 +1754,46 @@ class EventBus:
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
         if event_type == EVENT_STATE_REPORTED:
-            if not event_filter:
+            if not event_filter and not event_data_match:
                 raise HomeAssistantError(
                     f"Event filter is required for event {event_type}"
                 )
+        if batch_listener is not None:
+            self._batch_listeners[filterable_job] = HassJob(
+                batch_listener, f"listen batch {event_type}"
+            )
+        if event_data_match:
+            return self._async_listen_indexed_job(
+                event_type, filterable_job, event_data_match
+            )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def _async_listen_indexed_job(
+        self,
+        event_type: EventType[_DataT] | str,
+        filterable_job: _FilterableJobType[_DataT],
+        event_data_match: Mapping[str, Any],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type matching event data items."""
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                f"Event data match is not supported for {MATCH_ALL} listeners"
+            )
+        (key, value), *remaining = event_data_match.items()
+        try:
+            hash(value)
+        except TypeError as err:
+            raise HomeAssistantError(
+                f"Event data match value for {key} must be hashable"
+            ) from err
+        indexed_job: _IndexedJobType[_DataT] = (filterable_job, tuple(remaining))
+        indexed = self._indexed_listeners.setdefault(event_type, {})
+        indexed.setdefault(key, {}).setdefault(value, []).append(indexed_job)
+        return functools.partial(
+            self._async_remove_indexed_listener, event_type, key, value, indexed_job
+        )
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1728,6 +1881,7 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        self._batch_listeners.pop(filterable_job, None)
         try:
             self._listeners[event_type].remove(filterable_job)
 
@@ -1741,6 +1895,62 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        value: Any,
+        indexed_job: _IndexedJobType[_DataT],
+    ) -> None:
+        """Remove an indexed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        self._batch_listeners.pop(indexed_job[0], None)
+        try:
+            indexed = self._indexed_listeners[event_type]
+            by_value = indexed[key]
+            jobs = by_value[value]
+            jobs.remove(indexed_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", indexed_job[0]
+            )
+            return
+
+        # Prune empty index levels so firing does not visit them
+        if not jobs:
+            del by_value[value]
+            if not by_value:
+                del indexed[key]
+                if not indexed:
+                    del self._indexed_listeners[event_type]
+
+
+def _async_match_indexed_listeners(
+    indexed: dict[str, dict[Any, list[_IndexedJobType[_DataT]]]],
+    event_data: _DataT,
+) -> list[_FilterableJobType[_DataT]]:
+    """Return the indexed listeners whose event data match the event."""
+    matched: list[_FilterableJobType[_DataT]] = []
+    for key, by_value in indexed.items():
+        if (value := event_data.get(key, _SENTINEL)) is _SENTINEL:
+            continue
+        try:
+            jobs = by_value.get(value)
+        except TypeError:  # unhashable value in event data
+            continue
+        if not jobs:
+            continue
+        for filterable_job, remaining in jobs:
+            if not remaining or all(
+                event_data.get(item_key, _SENTINEL) == item_value
+                for item_key, item_value in remaining
+            ):
+                matched.append(filterable_job)
+    return matched
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -1752,6 +1962,45 @@ class CompressedState(TypedDict):
     lu: NotRequired[float]  # COMPRESSED_STATE_LAST_UPDATED
 
 
+# Value types that are safe to intern attributes for, the type is part of
+# the interning key so equal values of different types (1, 1.0 and True)
+# never share a mapping.
+_INTERNABLE_ATTRIBUTE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Attributes of states are interned so states with equal attributes
+# (most sensors of the same kind) share a single ReadOnlyDict.
+_INTERNED_ATTRIBUTES: weakref.WeakValueDictionary[
+    tuple[tuple[str, type, Any], ...], ReadOnlyDict[str, Any]
+] = weakref.WeakValueDictionary()
+
+# Cached serialized forms of a State that can be rebuilt on demand
+_STATE_SERIALIZED_CACHE_KEYS = (
+    "_as_dict",
+    "_as_read_only_dict",
+    "as_dict_json",
+    "json_fragment",
+    "as_compressed_state",
+    "as_compressed_state_json",
+)
+
+
+def _intern_attributes(attributes: Mapping[str, Any]) -> ReadOnlyDict[str, Any]:
+    """Return a shared ReadOnlyDict for the attributes.
+
+    Attributes with values that are not simple scalars are not interned.
+    """
+    internable_types = _INTERNABLE_ATTRIBUTE_TYPES
+    key: list[tuple[str, type, Any]] = []
+    for attr_key, value in attributes.items():
+        if (value_type := type(value)) not in internable_types:
+            return ReadOnlyDict(attributes)
+        key.append((attr_key, value_type, value))
+    interned_key = tuple(key)
+    if (interned := _INTERNED_ATTRIBUTES.get(interned_key)) is None:
+        interned = _INTERNED_ATTRIBUTES[interned_key] = ReadOnlyDict(attributes)
+    return interned
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -1812,7 +2061,7 @@ class State:
         # there is no need to check for subclassing with
         # isinstance here so we can use the faster type check.
         if type(attributes) is not ReadOnlyDict:
-            self.attributes = ReadOnlyDict(attributes or {})
+            self.attributes = _intern_attributes(attributes or {})
         else:
             self.attributes = attributes
         self.last_reported = last_reported or dt_util.utcnow()
@@ -1993,6 +2242,15 @@ class State:
             context=context,
         )
 
+    def evict_serialized_cache(self) -> None:
+        """Drop the cached serialized forms of the state.
+
+        They are rebuilt the next time they are needed.
+        """
+        cache = self._cache
+        for key in _STATE_SERIALIZED_CACHE_KEYS:
+            cache.pop(key, None)
+
     def expire(self) -> None:
         """Mark the state as old.
 
@@ -2063,6 +2321,22 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+class StateWrite(NamedTuple):
+    """A state write for StateMachine.async_set_many.
+
+    The fields are in the same order as the arguments of
+    StateMachine.async_set_internal.
+    """
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    context: Context | None = None
+    state_info: StateInfo | None = None
+    timestamp: float | None = None
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
@@ -2156,6 +2430,15 @@ class StateMachine:
             entity_id.lower()
         )
 
+    @callback
+    def async_evict_serialized_caches(self) -> None:
+        """Drop the cached serialized forms of all states to free memory.
+
+        This method must be run in the event loop.
+        """
+        for state in self._states_data.values():
+            state.evict_serialized_cache()
+
     def is_state(self, entity_id: str, state: str) -> bool:
         """Test if entity exists and is in specified state.
 
@@ -2387,6 +2670,121 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def async_set_many(self, writes: Iterable[StateWrite]) -> None:
+        """Set the state of many entities at once.
+
+        All states are validated before any of them is committed, if one of
+        them is invalid InvalidStateError is raised and the state machine is
+        left untouched. Once committed, the state_changed and state_reported
+        events are fired in the order of the writes, consecutive events of
+        the same type as a batch: listeners registered with a batch_listener
+        process each batch in a single call while other listeners receive the
+        events one by one as if each state had been set with async_set.
+
+        This method must be run in the event loop.
+        """
+        states_data = self._states_data
+        now_timestamp = time.time()
+        # entity_id -> state staged earlier in this batch
+        staged: dict[str, State] = {}
+        pending: list[tuple[str, State | None, State | None, Context, float]] = []
+
+        for write in writes:
+            entity_id = write.entity_id.lower()
+            new_state = str(write.state)
+            attributes = write.attributes or {}
+            timestamp = write.timestamp or now_timestamp
+            context = write.context or Context(id=ulid_at_time(timestamp))
+            old_state = staged.get(entity_id) or states_data.get(entity_id)
+            if old_state is None:
+                same_state = False
+                same_attr = False
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not write.force_update
+                same_attr = old_state.attributes == attributes
+                last_changed = old_state.last_changed if same_state else None
+
+            if same_state and same_attr:
+                pending.append((entity_id, old_state, None, context, timestamp))
+                continue
+
+            if same_attr:
+                if TYPE_CHECKING:
+                    assert old_state is not None
+                attributes = old_state.attributes
+
+            now = dt_util.utc_from_timestamp(timestamp)
+            # This is intentionally called with positional only arguments for
+            # performance reasons
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                now,
+                now,
+                context,
+                old_state is None,
+                write.state_info,
+                timestamp,
+            )
+            staged[entity_id] = state
+            pending.append((entity_id, old_state, state, context, timestamp))
+
+        events: list[Event[Any]] = []
+        for entity_id, old_state, staged_state, context, timestamp in pending:
+            if staged_state is None:
+                if TYPE_CHECKING:
+                    assert old_state is not None
+                old_last_reported = old_state.last_reported
+                old_state.last_reported = dt_util.utc_from_timestamp(timestamp)
+                old_state._cache["last_reported_timestamp"] = timestamp  # noqa: SLF001
+                state_reported_data: EventStateReportedData = {
+                    "entity_id": entity_id,
+                    "old_last_reported": old_last_reported,
+                    "new_state": old_state,
+                }
+                events.append(
+                    Event(
+                        EVENT_STATE_REPORTED,
+                        state_reported_data,
+                        EventOrigin.local,
+                        timestamp,
+                        context,
+                    )
+                )
+                continue
+            if old_state is not None:
+                old_state.expire()
+            self._states[entity_id] = staged_state
+            state_changed_data: EventStateChangedData = {
+                "entity_id": entity_id,
+                "old_state": old_state,
+                "new_state": staged_state,
+            }
+            events.append(
+                Event(
+                    EVENT_STATE_CHANGED,
+                    state_changed_data,
+                    EventOrigin.local,
+                    timestamp,
+                    context,
+                )
+            )
+
+        # Consecutive events of the same type are fired as one batch so
+        # the events are fired in the order of the writes
+        batch: list[Event[Any]] = []
+        for event in events:
+            if batch and event.event_type != batch[0].event_type:
+                self._bus.async_fire_batch_internal(batch[0].event_type, batch)
+                batch = []
+            batch.append(event)
+        if batch:
+            self._bus.async_fire_batch_internal(batch[0].event_type, batch)
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
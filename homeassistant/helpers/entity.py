@@ -44,6 +44,7 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    StateWrite,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
@@ -136,6 +137,56 @@ def async_generate_entity_id(
     return test_string
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the state of many entities to the state machine at once.
+
+    This is the batched version of Entity.async_write_ha_state for integrations
+    that update many entities in one burst, like a gateway reconnecting. The
+    states are committed together and state changed listeners that support it
+    process them in a single pass.
+    """
+    writes: list[StateWrite] = []
+    for entity in entities:
+        if not entity.hass or not entity._verified_state_writable:  # noqa: SLF001
+            entity._async_verify_state_writable()  # noqa: SLF001
+        if (write := entity._async_calculate_state_write()) is not None:  # noqa: SLF001
+            writes.append(write)
+    if not writes:
+        return
+    try:
+        hass.states.async_set_many(writes)
+    except InvalidStateError:
+        # Fall back to writing the states one by one so only the
+        # invalid states are replaced with unknown
+        for write in writes:
+            _async_set_state(hass, write)
+
+
+@callback
+def _async_set_state(hass: HomeAssistant, write: StateWrite) -> None:
+    """Write a state to the state machine, fall back to unknown if invalid."""
+    try:
+        hass.states.async_set_internal(
+            write.entity_id,
+            write.state,
+            write.attributes,
+            write.force_update,
+            write.context,
+            write.state_info,
+            write.timestamp,  # type: ignore[arg-type]
+        )
+    except InvalidStateError:
+        _LOGGER.exception(
+            "Failed to set state for %s, fall back to %s",
+            write.entity_id,
+            STATE_UNKNOWN,
+        )
+        hass.states.async_set(
+            write.entity_id, STATE_UNKNOWN, {}, write.force_update, write.context
+        )
+
+
 def get_capability(hass: HomeAssistant, entity_id: str, capability: str) -> Any | None:
     """Get a capability attribute of an entity.
 
@@ -1123,9 +1174,18 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (write := self._async_calculate_state_write()) is not None:
+            _async_set_state(self.hass, write)
+
+    @callback
+    def _async_calculate_state_write(self) -> StateWrite | None:
+        """Calculate the state write for the state machine.
+
+        Returns None if the entity must not write its state.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1141,7 +1201,7 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
@@ -1223,23 +1283,15 @@ class Entity(
             self._context = None
             self._context_set = None
 
-        try:
-            hass.states.async_set_internal(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+        return StateWrite(
+            entity_id,
+            state,
+            attr,
+            self.force_update,
+            self._context,
+            self._state_info,
+            time_now,
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
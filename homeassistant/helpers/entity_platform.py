@@ -1010,6 +1010,19 @@ class EntityPlatform:
             self.platform_name, []
         ).append(self)
 
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity] | None = None) -> None:
+        """Write the state of many entities of this platform at once.
+
+        Writes all entities of the platform if entities is not passed.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .entity import async_write_ha_states
+
+        async_write_ha_states(
+            self.hass, self.entities.values() if entities is None else entities
+        )
+
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
 
@@ -6,9 +6,11 @@ import asyncio
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial, wraps
+from heapq import heappop, heappush
+from itertools import count
 import logging
 from random import randint
 import time
@@ -42,6 +44,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.timer_wheel import TimerWheelHandle
 
 from . import frame
 from .device_registry import (
@@ -75,6 +78,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TRACK_UTC_TIME_CHANGE_DATA: HassKey[dict[_TimePatternKey, _TrackUTCTimeChange]] = (
+    HassKey("track_utc_time_change_data")
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -114,6 +120,17 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         bool,
     ]
+    batch_dispatcher_callable: (
+        Callable[
+            [
+                HomeAssistant,
+                dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+                list[Event[_TypedDictT]],
+            ],
+            None,
+        ]
+        | None
+    ) = None
 
 
 @dataclass(slots=True, frozen=True)
@@ -338,7 +355,53 @@ def _async_dispatch_entity_id_event_soon[_StateEventDataT: EventStateEventData](
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
+    hass.loop.call_soon(_async_dispatch_state_change_event, hass, callbacks, event)
+
+
+@callback
+def _async_dispatch_entity_id_events_soon[_StateEventDataT: EventStateEventData](
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    events: list[Event[_StateEventDataT]],
+) -> None:
+    """Dispatch a batch of events to listeners soon in a single loop callback."""
+    hass.loop.call_soon(_async_dispatch_entity_id_events, hass, callbacks, events)
+
+
+@callback
+def _async_dispatch_entity_id_events[_StateEventDataT: EventStateEventData](
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    events: list[Event[_StateEventDataT]],
+) -> None:
+    """Dispatch a batch of events to listeners."""
+    if (scheduler := hass.data.get(_TEMPLATE_REFRESH_SCHEDULER)) is not None:
+        # Refresh the templates once for all events of the batch
+        scheduler.async_hold()
+    for event in events:
+        _async_dispatch_entity_id_event(hass, callbacks, event)
+    if scheduler is not None:
+        scheduler.async_release()
+
+
+@callback
+def _async_dispatch_state_change_event[_StateEventDataT: EventStateEventData](
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    event: Event[_StateEventDataT],
+) -> None:
+    """Dispatch a state change to listeners."""
+    if (
+        len(callbacks.get(event.data["entity_id"], ())) < 2
+        or (scheduler := hass.data.get(_TEMPLATE_REFRESH_SCHEDULER)) is None
+    ):
+        _async_dispatch_entity_id_event(hass, callbacks, event)
+        return
+    # Several templates may be refreshed for the state change, refresh
+    # them in dependency order once all listeners have been called
+    scheduler.async_hold()
+    _async_dispatch_entity_id_event(hass, callbacks, event)
+    scheduler.async_release()
 
 
 @callback
@@ -376,6 +439,7 @@ _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
     filter_callable=_async_state_filter,
+    batch_dispatcher_callable=_async_dispatch_entity_id_events_soon,
 )
 
 
@@ -469,6 +533,11 @@ def _async_track_event(
             tracker.event_type,
             partial(tracker.dispatcher_callable, hass, callbacks),
             event_filter=partial(tracker.filter_callable, hass, callbacks),
+            batch_listener=(
+                partial(tracker.batch_dispatcher_callable, hass, callbacks)
+                if tracker.batch_dispatcher_callable
+                else None
+            ),
         )
         event_data = _KeyedEventData(listener, callbacks)
         hass_data[tracker_key] = event_data
@@ -971,6 +1040,306 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+def _discard_dependent(
+    dependents: dict[str, set[TrackTemplateResultInfo]],
+    key: str,
+    tracker: TrackTemplateResultInfo,
+) -> None:
+    """Remove a tracker from the dependents of an entity or domain."""
+    if (trackers := dependents.get(key)) is None:
+        return
+    trackers.discard(tracker)
+    if not trackers:
+        del dependents[key]
+
+
+class _TemplateRefreshScheduler:
+    """Refresh the tracked templates in dependency order.
+
+    The trackers triggered by the state changes dispatched together are
+    collected and each one is refreshed once for all of them. Trackers
+    which depend on an entity whose state is written by another tracker,
+    like a template entity using the state of another template entity,
+    are refreshed after it, and the trackers depending on a state written
+    while refreshing are refreshed in the same pass instead of in later
+    loop iterations.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._track_states: dict[TrackTemplateResultInfo, TrackStates] = {}
+        self._all_dependents: set[TrackTemplateResultInfo] = set()
+        self._entity_dependents: dict[str, set[TrackTemplateResultInfo]] = {}
+        self._domain_dependents: dict[str, set[TrackTemplateResultInfo]] = {}
+        # entity_id -> tracker writing the state of the entity
+        self._producers: dict[str, TrackTemplateResultInfo] = {}
+        # tracker -> trackers writing a state the tracker depends on
+        self._upstream: dict[TrackTemplateResultInfo, set[TrackTemplateResultInfo]] = {}
+        self._ranks: dict[TrackTemplateResultInfo, int] = {}
+        self._pending: dict[
+            TrackTemplateResultInfo, list[Event[EventStateChangedData]]
+        ] = {}
+        self._queue: list[tuple[int, int, TrackTemplateResultInfo]] = []
+        self._sequence = count()
+        self._deferred: dict[
+            TrackTemplateResultInfo, list[Event[EventStateChangedData]]
+        ] = {}
+        # state written while refreshing -> trackers scheduled for it
+        self._written: dict[State, set[TrackTemplateResultInfo]] = {}
+        self._refreshed: set[TrackTemplateResultInfo] = set()
+        self._holds = 0
+        self._running = False
+        self._finish_handle: asyncio.Handle | None = None
+
+    @callback
+    def async_set_track_states(
+        self, tracker: TrackTemplateResultInfo, track_states: TrackStates
+    ) -> None:
+        """Set the states a tracker depends on."""
+        if self._track_states.get(tracker) == track_states:
+            return
+        self._async_remove_dependent(tracker)
+        self._track_states[tracker] = track_states
+        if track_states.all_states:
+            self._all_dependents.add(tracker)
+        for entity_id in track_states.entities:
+            self._entity_dependents.setdefault(entity_id, set()).add(tracker)
+        for domain in track_states.domains:
+            self._domain_dependents.setdefault(domain, set()).add(tracker)
+        self._async_update_upstream(tracker)
+
+    @callback
+    def async_set_producer(
+        self, tracker: TrackTemplateResultInfo, entity_id: str
+    ) -> None:
+        """Set the tracker writing the state of an entity."""
+        if self._producers.get(entity_id) is tracker:
+            return
+        self._producers[entity_id] = tracker
+        for dependent in self._async_dependents(entity_id):
+            self._async_update_upstream(dependent)
+
+    @callback
+    def async_remove(
+        self, tracker: TrackTemplateResultInfo, entity_id: str | None
+    ) -> None:
+        """Remove a tracker."""
+        self._async_remove_dependent(tracker)
+        self._pending.pop(tracker, None)
+        self._deferred.pop(tracker, None)
+        self._ranks.pop(tracker, None)
+        if self._upstream.pop(tracker, None):
+            self._ranks.clear()
+        if entity_id is None or self._producers.get(entity_id) is not tracker:
+            return
+        del self._producers[entity_id]
+        for dependent in self._async_dependents(entity_id):
+            self._async_update_upstream(dependent)
+
+    @callback
+    def _async_remove_dependent(self, tracker: TrackTemplateResultInfo) -> None:
+        """Remove the states a tracker depends on."""
+        if (track_states := self._track_states.pop(tracker, None)) is None:
+            return
+        self._all_dependents.discard(tracker)
+        for entity_id in track_states.entities:
+            _discard_dependent(self._entity_dependents, entity_id, tracker)
+        for domain in track_states.domains:
+            _discard_dependent(self._domain_dependents, domain, tracker)
+
+    @callback
+    def _async_dependents(self, entity_id: str) -> set[TrackTemplateResultInfo]:
+        """Return the trackers depending on the state of an entity."""
+        dependents = set(self._all_dependents)
+        dependents.update(self._entity_dependents.get(entity_id, ()))
+        dependents.update(
+            self._domain_dependents.get(split_entity_id(entity_id)[0], ())
+        )
+        return dependents
+
+    @callback
+    def _async_update_upstream(self, tracker: TrackTemplateResultInfo) -> None:
+        """Update the trackers writing a state a tracker depends on.
+
+        The ranks are only computed again if they changed.
+        """
+        track_states = self._track_states[tracker]
+        producers = self._producers
+        if track_states.all_states:
+            upstream = set(producers.values())
+        else:
+            upstream = {
+                producers[entity_id]
+                for entity_id in track_states.entities
+                if entity_id in producers
+            }
+            if domains := track_states.domains:
+                upstream.update(
+                    producer
+                    for entity_id, producer in producers.items()
+                    if split_entity_id(entity_id)[0] in domains
+                )
+        upstream.discard(tracker)
+        if upstream == self._upstream.get(tracker, set()):
+            return
+        if upstream:
+            self._upstream[tracker] = upstream
+        else:
+            del self._upstream[tracker]
+        self._ranks.clear()
+
+    @callback
+    def async_hold(self) -> None:
+        """Collect the trackers to refresh until released."""
+        self._holds += 1
+
+    @callback
+    def async_release(self) -> None:
+        """Refresh the collected trackers once no longer held."""
+        self._holds -= 1
+        if not self._holds and not self._running and self._pending:
+            self._async_run()
+
+    @callback
+    def async_schedule(
+        self, tracker: TrackTemplateResultInfo, event: Event[EventStateChangedData]
+    ) -> None:
+        """Schedule a refresh of a tracker for a state change."""
+        if (
+            self._written
+            and (new_state := event.data["new_state"]) is not None
+            and tracker in self._written.get(new_state, ())
+        ):
+            # Already scheduled when the state was written while refreshing
+            return
+        self._async_schedule(tracker, event)
+
+    @callback
+    def _async_schedule(
+        self, tracker: TrackTemplateResultInfo, event: Event[EventStateChangedData]
+    ) -> None:
+        """Schedule a refresh of a tracker."""
+        if tracker in self._refreshed:
+            # Refresh it again in the next loop iteration like the state
+            # change would if it was dispatched, this breaks loops of
+            # trackers depending on each other
+            self._deferred.setdefault(tracker, []).append(event)
+            return
+        self._async_add_pending(tracker, [event])
+        if not self._holds and not self._running:
+            self._async_run()
+
+    @callback
+    def _async_add_pending(
+        self,
+        tracker: TrackTemplateResultInfo,
+        events: list[Event[EventStateChangedData]],
+    ) -> None:
+        """Add the events a tracker has to be refreshed for."""
+        if (pending := self._pending.get(tracker)) is not None:
+            pending.extend(events)
+            return
+        self._pending[tracker] = events
+        heappush(
+            self._queue, (self._async_rank(tracker), next(self._sequence), tracker)
+        )
+
+    @callback
+    def _async_rank(self, tracker: TrackTemplateResultInfo) -> int:
+        """Return the length of the longest chain of trackers a tracker depends on."""
+        if (rank := self._ranks.get(tracker)) is not None:
+            return rank
+        # Trackers depending on each other are ranked in no particular order
+        self._ranks[tracker] = rank = 0
+        for producer in self._upstream.get(tracker, ()):
+            rank = max(rank, self._async_rank(producer) + 1)
+        self._ranks[tracker] = rank
+        return rank
+
+    @callback
+    def _async_run(self) -> None:
+        """Refresh the pending trackers, dependencies first."""
+        self._running = True
+        pending = self._pending
+        queue = self._queue
+        states = self.hass.states
+        while queue:
+            tracker = heappop(queue)[2]
+            if (events := pending.pop(tracker, None)) is None:
+                continue
+            self._refreshed.add(tracker)
+            entity_id = tracker._entity_id  # noqa: SLF001
+            old_state = states.get(entity_id) if entity_id is not None else None
+            try:
+                tracker._refresh_events(events)  # noqa: SLF001
+            except Exception:
+                _LOGGER.exception("Error while refreshing templates of %s", tracker)
+            if (
+                entity_id is not None
+                and (new_state := states.get(entity_id)) is not None
+                and new_state is not old_state
+            ):
+                self._async_state_written(entity_id, old_state, new_state)
+        self._refreshed.clear()
+        self._running = False
+        # The state changes written while refreshing are still dispatched to
+        # the trackers refreshed for them, forget them once they have been
+        if self._finish_handle is not None:
+            self._finish_handle.cancel()
+        self._finish_handle = self.hass.loop.call_soon(self._async_finish)
+
+    @callback
+    def _async_state_written(
+        self, entity_id: str, old_state: State | None, new_state: State
+    ) -> None:
+        """Refresh the trackers depending on a state in the current pass.
+
+        The state_changed event fired for the state is only dispatched in a
+        later loop iteration, the trackers are refreshed for an event with
+        the same data instead.
+        """
+        event: Event[EventStateChangedData] = Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+            time_fired_timestamp=new_state.last_updated_timestamp,
+            context=new_state.context,
+        )
+        self._written[new_state] = dependents = self._async_dependents(entity_id)
+        for tracker in dependents:
+            self._async_schedule(tracker, event)
+
+    @callback
+    def _async_finish(self) -> None:
+        """Forget the written states and refresh the deferred trackers."""
+        self._finish_handle = None
+        self._written.clear()
+        if not self._deferred:
+            return
+        deferred, self._deferred = self._deferred, {}
+        for tracker, events in deferred.items():
+            self._async_add_pending(tracker, events)
+        if not self._holds:
+            self._async_run()
+
+
+_TEMPLATE_REFRESH_SCHEDULER: HassKey[_TemplateRefreshScheduler] = HassKey(
+    "template_refresh_scheduler"
+)
+
+
+@callback
+def _async_get_template_refresh_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRefreshScheduler:
+    """Return the template refresh scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_REFRESH_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_REFRESH_SCHEDULER] = _TemplateRefreshScheduler(
+            hass
+        )
+    return scheduler
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -980,6 +1349,7 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        entity_id: str | None = None,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
@@ -987,6 +1357,8 @@ class TrackTemplateResultInfo:
 
         self._track_templates = track_templates
         self._has_super_template = has_super_template
+        self._entity_id = entity_id
+        self._scheduler = _async_get_template_refresh_scheduler(hass)
 
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
@@ -1058,9 +1430,13 @@ class TrackTemplateResultInfo:
                 else:
                     log_fn(logging.ERROR, str(info.exception))
 
+        track_states = _render_infos_to_track_states(self._info.values())
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass, track_states, self._async_schedule_refresh
         )
+        self._scheduler.async_set_track_states(self, track_states)
+        if self._entity_id is not None:
+            self._scheduler.async_set_producer(self, self._entity_id)
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1116,6 +1492,7 @@ class TrackTemplateResultInfo:
         """Cancel the listener."""
         assert self._track_state_changes
         self._track_state_changes.async_remove()
+        self._scheduler.async_remove(self, self._entity_id)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -1125,6 +1502,35 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _async_schedule_refresh(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a refresh of the templates for a state change."""
+        self._scheduler.async_schedule(self, event)
+
+    def _render_template_for_events(
+        self,
+        track_template_: TrackTemplate,
+        now: float,
+        events: list[Event[EventStateChangedData]],
+    ) -> tuple[bool | TrackTemplateResult, int]:
+        """Re-render the template for the last event which triggers a re-render.
+
+        Returns the result of _render_template_if_ready and the index of
+        the event. If there are no events the template is re-rendered
+        unconditionally and the index is -1.
+        """
+        if not events:
+            return self._render_template_if_ready(track_template_, now, None), -1
+
+        info = self._info[track_template_.template]
+        for index in range(len(events) - 1, -1, -1):
+            if _event_triggers_rerender(event := events[index], info):
+                return self._render_template_if_ready(
+                    track_template_, now, event
+                ), index
+
+        return False, -1
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1133,6 +1539,8 @@ class TrackTemplateResultInfo:
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
+        The event must trigger a re-render of the template.
+
         Returns False if the template was not re-rendered.
 
         Returns True if the template re-rendered and did not
@@ -1146,9 +1554,6 @@ class TrackTemplateResultInfo:
         if event:
             info = self._info[template]
 
-            if not _event_triggers_rerender(event, info):
-                return False
-
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1234,9 +1639,26 @@ class TrackTemplateResultInfo:
         replayed is True if the event is being replayed because the
         rate limit was hit.
         """
+        self._refresh_events([event] if event else [], track_templates, replayed)
+
+    @callback
+    def _refresh_events(
+        self,
+        events: list[Event[EventStateChangedData]],
+        track_templates: Iterable[TrackTemplate] | None = None,
+        replayed: bool | None = False,
+    ) -> None:
+        """Refresh the templates once for a list of state_changed events.
+
+        The action is called with the last event which triggered a
+        template to render a new result.
+        """
         updates: list[TrackTemplateResult] = []
         info_changed = False
-        now = event.time_fired_timestamp if not replayed and event else time.time()
+        action_index = -1
+        now = (
+            events[-1].time_fired_timestamp if not replayed and events else time.time()
+        )
 
         block_updates = False
         super_template = self._track_templates[0] if self._has_super_template else None
@@ -1245,11 +1667,14 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update, index = self._render_template_for_events(
+                super_template, now, events
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
                 super_result = update.result
+                action_index = index
             else:
                 super_result = self._last_result.get(super_template.template)
 
@@ -1267,7 +1692,8 @@ class TrackTemplateResultInfo:
             ):
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
-                event = None
+                events = []
+                action_index = -1
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1276,23 +1702,27 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update, index = self._render_template_for_events(
+                    track_template_, now, events
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
+                if isinstance(update, TrackTemplateResult):
+                    action_index = max(action_index, index)
 
         if info_changed:
             assert self._track_state_changes
-            self._track_state_changes.async_update_listeners(
-                _render_infos_to_track_states(
-                    [
-                        _suppress_domain_all_in_render_info(info)
-                        if self._rate_limit.async_has_timer(template)
-                        else info
-                        for template, info in self._info.items()
-                    ]
-                )
+            track_states = _render_infos_to_track_states(
+                [
+                    _suppress_domain_all_in_render_info(info)
+                    if self._rate_limit.async_has_timer(template)
+                    else info
+                    for template, info in self._info.items()
+                ]
             )
+            self._track_state_changes.async_update_listeners(track_states)
+            self._scheduler.async_set_track_states(self, track_states)
             _LOGGER.debug(
                 (
                     "Template group %s listens for %s, re-render blocked by super"
@@ -1309,7 +1739,9 @@ class TrackTemplateResultInfo:
         for track_result in updates:
             self._last_result[track_result.template] = track_result.result
 
-        self.hass.async_run_hass_job(self._job, event, updates)
+        self.hass.async_run_hass_job(
+            self._job, events[action_index] if action_index >= 0 else None, updates
+        )
 
 
 type TrackTemplateResultListener = Callable[
@@ -1340,6 +1772,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    entity_id: str | None = None,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1371,13 +1804,18 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    entity_id
+        The entity whose state the action writes, templates depending on it
+        are re-rendered after this one when their sources change together.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, entity_id
+    )
     tracker.async_setup(strict=strict, log_fn=log_fn)
     return tracker
 
@@ -1491,13 +1929,13 @@ class _TrackPointUTCTime:
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _cancel_callback: TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        hass = self.hass
+        self._cancel_callback = hass.timer_wheel.async_call_at(
+            hass.loop.time() + self.expected_fire_timestamp - time.time(), self
         )
 
     @callback
@@ -1516,15 +1954,14 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            self._cancel_callback = self.hass.timer_wheel.async_call_later(delta, self)
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the timer."""
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback.cancel()
@@ -1582,7 +2019,9 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
+    return hass.timer_wheel.async_call_at(
+        loop_time, _run_async_call_action, hass, job
+    ).cancel
 
 
 @callback
@@ -1604,8 +2043,9 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    loop = hass.loop
-    return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
+    return hass.timer_wheel.async_call_later(
+        delay, _run_async_call_action, hass, job
+    ).cancel
 
 
 call_later = threaded_listener_factory(async_call_later)
@@ -1622,7 +2062,7 @@ class _TrackTimeInterval:
     cancel_on_shutdown: bool | None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1643,10 +2083,8 @@ class _TrackTimeInterval:
         """Schedule the timer."""
         if TYPE_CHECKING:
             assert self._track_job is not None
-        hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+        self._timer_handle = self.hass.timer_wheel.async_call_later(
+            self.seconds, self._interval_listener, self._track_job
         )
 
     @callback
@@ -1659,7 +2097,7 @@ class _TrackTimeInterval:
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the timer."""
         if TYPE_CHECKING:
             assert self._timer_handle is not None
         self._timer_handle.cancel()
@@ -1787,14 +2225,24 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+type _TimePatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
+    """Track a time pattern for all listeners of it with a single timer."""
+
     hass: HomeAssistant
+    key: _TimePatternKey
     time_match_expression: tuple[list[int], list[int], list[int]]
     microsecond: int
     local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    # The listeners by the token they were added with, the same job
+    # may be added more than once
+    jobs: dict[object, HassJob[[datetime], Coroutine[Any, Any, None] | None]] = field(
+        default_factory=dict
+    )
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1833,11 +2281,32 @@ class _TrackUTCTimeChange:
             self._pattern_time_change_listener_job,
             self._calculate_next(utc_now + timedelta(seconds=1)),
         )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
+        # A listener may remove listeners of the same pattern
+        for token, job in list(self.jobs.items()):
+            if token not in self.jobs:
+                continue
+            try:
+                hass.async_run_hass_job(job, localized_now, background=True)
+            except Exception:
+                _LOGGER.exception("Error running time change listener %s", job)
 
     @callback
-    def async_cancel(self) -> None:
-        """Cancel the call_at."""
+    def async_add_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> CALLBACK_TYPE:
+        """Add a listener of the time pattern."""
+        token = object()
+        self.jobs[token] = job
+        return partial(self._async_remove_job, token)
+
+    @callback
+    def _async_remove_job(self, token: object) -> None:
+        """Remove a listener, the last one cancels the timer."""
+        if self.jobs.pop(token, None) is None:
+            return
+        if self.jobs:
+            return
+        self.hass.data[_TRACK_UTC_TIME_CHANGE_DATA].pop(self.key)
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback()
@@ -1871,21 +2340,30 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    # Listeners of patterns matching the same times share a single timer
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    trackers = hass.data.setdefault(_TRACK_UTC_TIME_CHANGE_DATA, {})
+    if (track := trackers.get(key)) is None:
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
+        track = trackers[key] = _TrackUTCTimeChange(
+            hass,
+            key,
+            (matching_seconds, matching_minutes, matching_hours),
+            microsecond,
+            local,
+            listener_job_name,
+        )
+        track.async_attach()
+    return track.async_add_job(job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -1968,11 +2446,17 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
 
     if info.filter(entity_id):
-        return True
+        return (
+            old_state is None
+            or new_state is None
+            or info.filter_state_change(old_state, new_state)
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
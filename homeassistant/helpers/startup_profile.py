@@ -0,0 +1,196 @@
+"""Profile the startup and pre-import the integrations slow to import.
+
+The time it took to import and to set up each integration is saved once
+startup finished. On the next start the integrations which were slow to
+import are imported in the import executor while the other integrations
+are resolved and set up, so their setup does not have to wait for them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+from typing import TypedDict, cast
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_get_setup_timings
+from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.json import load_json_object
+
+from .storage import STORAGE_DIR, Store, get_internal_store_manager
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.startup_profile"
+STORAGE_VERSION = 1
+
+# Integrations which took at least this many seconds to import are
+# imported ahead of their setup on the next start
+MIN_PRE_IMPORT_TIME = 0.05
+
+
+class StartupProfile(TypedDict):
+    """Timings of the last startup."""
+
+    startup_time: float
+    import_times: dict[str, float]
+    setup_times: dict[str, float]
+    unused_preloaded_platforms: dict[str, list[str]]
+    storage_load_times: dict[str, float]
+
+
+@callback
+def _async_get_store(hass: HomeAssistant) -> Store[StartupProfile]:
+    """Return the store of the startup profile."""
+    return Store[StartupProfile](hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+
+
+async def async_save_startup_profile(hass: HomeAssistant, startup_time: float) -> None:
+    """Save the timings of the startup which just finished."""
+    await _async_get_store(hass).async_save(
+        {
+            "startup_time": round(startup_time, 3),
+            "import_times": {
+                domain: round(import_time, 4)
+                for domain, import_time in loader.async_get_import_timings(hass).items()
+            },
+            "setup_times": {
+                domain: round(setup_time, 4)
+                for domain, setup_time in async_get_setup_timings(hass).items()
+            },
+            "unused_preloaded_platforms": (
+                loader.async_get_unused_preloaded_platforms(hass)
+            ),
+            "storage_load_times": {
+                key: round(load_time, 4)
+                for key, load_time in get_internal_store_manager(hass)
+                .async_get_load_timings()
+                .items()
+            },
+        }
+    )
+
+
+def _has_requirements(
+    integration: loader.Integration, integrations: dict[str, loader.Integration]
+) -> bool:
+    """Return if an integration or one of its dependencies has requirements."""
+    return any(
+        (dependency := integrations.get(domain)) is None or dependency.requirements
+        for domain in (integration.domain, *integration.all_dependencies)
+    )
+
+
+def get_pre_import_order(
+    profile: StartupProfile,
+    integrations: dict[str, loader.Integration],
+    skip_domains: set[str],
+) -> list[loader.Integration]:
+    """Return the integrations slow to import, dependencies first.
+
+    Integrations with requirements, or depending on one, are skipped
+    since the requirements are only installed when they are set up.
+
+    An integration has more dependencies than each of its dependencies,
+    so sorting by the number of dependencies is a dependency order.
+    """
+    import_times = profile["import_times"]
+    return sorted(
+        (
+            integration
+            for domain, integration in integrations.items()
+            if domain not in skip_domains
+            and import_times.get(domain, 0) >= MIN_PRE_IMPORT_TIME
+            and integration.import_executor
+            and integration.all_dependencies_resolved
+            and integration.pkg_path not in sys.modules
+            and not _has_requirements(integration, integrations)
+        ),
+        key=lambda integration: (
+            len(integration.all_dependencies),
+            -import_times[integration.domain],
+        ),
+    )
+
+
+async def _async_pre_import(integration: loader.Integration) -> None:
+    """Import the component of an integration ahead of its setup."""
+    try:
+        await integration.async_get_component()
+    except Exception:  # noqa: BLE001
+        # The error is logged when the integration is set up
+        _LOGGER.debug("Failed to pre-import %s", integration.domain, exc_info=True)
+
+
+async def async_pre_import_integrations(
+    hass: HomeAssistant,
+    integrations: dict[str, loader.Integration],
+    skip_domains: set[str],
+) -> None:
+    """Import the integrations which were slow to import on the last start.
+
+    The integrations in skip_domains are not imported, they are set up
+    before the imports would be done.
+
+    The imports are all queued at once; the import executor runs them in
+    order, so each integration is imported after its dependencies.
+    """
+    if not (profile := await _async_get_store(hass).async_load()):
+        return
+    if not (to_import := get_pre_import_order(profile, integrations, skip_domains)):
+        return
+    _LOGGER.debug("Pre-importing %s", [integration.domain for integration in to_import])
+    await asyncio.gather(
+        *(
+            create_eager_task(
+                _async_pre_import(integration),
+                name=f"pre-import {integration.domain}",
+                loop=hass.loop,
+            )
+            for integration in to_import
+        )
+    )
+
+
+def startup_report(config_dir: str) -> str:
+    """Return a report of the last startup saved in a config directory."""
+    path = os.path.join(config_dir, STORAGE_DIR, STORAGE_KEY)
+    if not os.path.isfile(path):
+        return "No startup profile found, start Home Assistant first"
+    profile = cast(StartupProfile, load_json_object(path)["data"])
+    import_times = profile["import_times"]
+    setup_times = profile["setup_times"]
+    domains = sorted(
+        import_times.keys() | setup_times.keys(),
+        key=lambda domain: import_times.get(domain, 0) + setup_times.get(domain, 0),
+        reverse=True,
+    )
+    width = max(len("Integration"), *(len(domain) for domain in domains))
+    lines = [
+        f"Startup took {profile['startup_time']:.2f}s",
+        f"{'Integration':<{width}}  {'Import':>8}  {'Setup':>8}",
+    ]
+    lines.extend(
+        f"{domain:<{width}}  {import_times.get(domain, 0):>7.3f}s  "
+        f"{setup_times.get(domain, 0):>7.3f}s"
+        for domain in domains
+    )
+    if unused_platforms := profile.get("unused_preloaded_platforms"):
+        lines.append("Preloaded platforms which were not used:")
+        lines.extend(
+            f"{domain:<{width}}  {', '.join(platforms)}"
+            for domain, platforms in sorted(unused_platforms.items())
+        )
+    if storage_load_times := profile.get("storage_load_times"):
+        key_width = max(len(key) for key in storage_load_times)
+        lines.append("Storage files loaded:")
+        lines.extend(
+            f"{key:<{key_width}}  {load_time:>7.3f}s"
+            for key, load_time in sorted(
+                storage_load_times.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+    return "\n".join(lines)
@@ -7,11 +7,14 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
+import mmap
 import os
 from pathlib import Path
-from typing import Any
+import time
+from typing import Any, cast
 
 from propcache.api import cached_property
 
@@ -30,8 +33,9 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
-from homeassistant.util import dt as dt_util, json as json_util
-from homeassistant.util.file import WriteError
+from homeassistant.util import dt as dt_util, json as json_util, ulid as ulid_util
+from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -48,6 +52,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# The journal of a journaled store is compacted into the store file when it
+# grew to this share of the size of the store file
+JOURNAL_COMPACT_RATIO = 0.5
+JOURNAL_SUFFIX = ".journal"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -114,6 +123,8 @@ class _StoreManager:
         self._invalidated: set[str] = set()
         self._files: set[str] | None = None
         self._data_preload: dict[str, json_util.JsonValueType] = {}
+        self._preloading: dict[str, asyncio.Task[None]] = {}
+        self._load_times: dict[str, float] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
 
@@ -173,6 +184,23 @@ class _StoreManager:
         _LOGGER.debug("%s: Cache miss, not preloaded", key)
         return None
 
+    async def async_fetch_preloaded(
+        self, key: str
+    ) -> tuple[bool, json_util.JsonValueType | None] | None:
+        """Fetch data from cache, waiting for the key if it is being preloaded."""
+        if (task := self._preloading.get(key)) is not None:
+            await asyncio.shield(task)
+        return self.async_fetch(key)
+
+    @callback
+    def async_get_load_timings(self) -> dict[str, float]:
+        """Return how long loading each storage file took."""
+        return self._load_times
+
+    def record_load_time(self, key: str, load_time: float) -> None:
+        """Record how long loading a storage file took."""
+        self._load_times[key] = load_time
+
     @callback
     def _async_schedule_cleanup(self, _event: Event) -> None:
         """Schedule the cleanup of old files."""
@@ -203,22 +231,55 @@ class _StoreManager:
         self._data_preload.clear()
 
     async def async_preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
+        """Cache the keys.
+
+        Each file is loaded in its own executor job, a store can use the
+        data of its file while the other files are still loading.
+        """
         # If async_initialize has not been called yet, we can't preload
-        if self._files is not None and (existing := self._files.intersection(keys)):
-            await self._hass.async_add_executor_job(self._preload, existing)
-
-    def _preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
-        storage_path = self._storage_path
-        data_preload = self._data_preload
-        for key in keys:
-            storage_file: Path = storage_path.joinpath(key)
-            try:
-                if storage_file.is_file():
-                    data_preload[key] = json_util.load_json(storage_file)
-            except Exception as ex:  # noqa: BLE001
-                _LOGGER.debug("Error loading %s: %s", key, ex)
+        if self._files is None or not (existing := self._files.intersection(keys)):
+            return
+        preloading = self._preloading
+        for key in existing:
+            if key not in preloading:
+                preloading[key] = create_eager_task(
+                    self._async_preload(key),
+                    name=f"preload storage {key}",
+                    loop=self._hass.loop,
+                )
+        await asyncio.gather(*(preloading[key] for key in existing))
+
+    async def _async_preload(self, key: str) -> None:
+        """Cache a key."""
+        try:
+            data = await self._hass.async_add_executor_job(self._preload, key)
+        finally:
+            del self._preloading[key]
+        # A store may have saved while the file was loading
+        if data is not None and key not in self._invalidated:
+            self._data_preload[key] = data
+
+    def _preload(self, key: str) -> json_util.JsonValueType | None:
+        """Load a file, decoding it straight from a memory map of the file."""
+        storage_file: Path = self._storage_path.joinpath(key)
+        if not storage_file.is_file():
+            return None
+        start = time.perf_counter()
+        try:
+            with storage_file.open("rb") as fdesc:
+                if not os.fstat(fdesc.fileno()).st_size:
+                    # Empty files can not be memory mapped
+                    return json_util.json_loads(fdesc.read())
+                with (
+                    mmap.mmap(fdesc.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                    memoryview(mapped) as buffer,
+                ):
+                    return json_util.json_loads(buffer)
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.debug("Error loading %s: %s", key, ex)
+            return None
+        finally:
+            self._load_times[key] = time.perf_counter() - start
 
     def _initialize_files(self) -> None:
         """Initialize the cache."""
@@ -241,8 +302,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the changes of each save to a journal
+        instead of writing the whole file. The journal is compacted into
+        the file when it grew too large and when Home Assistant stops.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +325,23 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        # What the store file and its journal hold, once written
+        self._journal_base: dict[str, Any] | None = None
+        self._journal_size = 0
+        self._journal_snapshot_size = 0
+        self._journal_compact = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -321,15 +399,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
-        elif cache := self._manager.async_fetch(self.key):
+        elif cache := await self._manager.async_fetch_preloaded(self.key):
             exists, data = cache
             if not exists:
                 return None
-        else:
-            try:
+            if self._journal:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    self._replay_journal, data
                 )
+        else:
+            try:
+                data = await self.hass.async_add_executor_job(self._load_json)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -386,6 +466,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if data == {}:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -517,6 +601,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal:
+            # Leave a complete file behind, older versions ignore the journal
+            self._journal_compact = True
+            if self._data is None and self._journal_base is not None:
+                self._data = self._journal_base
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -541,6 +630,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal_size:
+                # Compact the journal when Home Assistant stops
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -551,6 +644,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            self._write_journal_data(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +657,104 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+    def _write_journal_data(self, path: str, data: dict[str, Any]) -> None:
+        """Append the changes to the journal or compact it into the file."""
+        encoder = self._encoder
+        try:
+            if encoder and encoder is not JSONEncoder:
+                # Custom encoders can only be used with json.dumps
+                new = json_util.json_loads_object(json.dumps(data, cls=encoder))
+            else:
+                new = json_util.json_loads_object(json_helper.json_bytes(data))
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}: {err}"
+            ) from err
+
+        base = self._journal_base
+        compact, self._journal_compact = self._journal_compact, False
+        if (
+            base is not None
+            and not compact
+            and self._journal_size < self._journal_snapshot_size * JOURNAL_COMPACT_RATIO
+        ):
+            if (change := _journal_diff(base, new)) is None:
+                return
+            line = json_helper.json_bytes([change]) + b"\n"
+            _LOGGER.debug("Appending %s bytes to %s", len(line), self.journal_path)
+            try:
+                with open(self.journal_path, "ab") as fdesc:
+                    fdesc.write(line)
+                    if self._atomic_writes:
+                        os.fsync(fdesc.fileno())
+            except OSError as err:
+                _LOGGER.exception("Saving file failed: %s", self.journal_path)
+                raise WriteError(err) from err
+            self._journal_base = new
+            self._journal_size += len(line)
+            return
+
+        # The journal starts with the id of the file it applies to, so a
+        # journal left behind when compacting fails is not replayed
+        journal_id = ulid_util.ulid_now()
+        _LOGGER.debug("Compacting the journal of %s into %s", self.key, path)
+        json_helper.save_json(
+            path,
+            {**new, "journal": journal_id},
+            self._private,
+            atomic_writes=self._atomic_writes,
+        )
+        header = json_helper.json_bytes({"journal": journal_id}) + b"\n"
+        write_utf8_file(self.journal_path, header, self._private, mode="wb")
+        self._journal_base = new
+        self._journal_size = 0
+        self._journal_snapshot_size = os.path.getsize(path)
+
+    def _replay_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the changes in the journal to the data of the file.
+
+        If the journal is complete, later saves append to it.
+        """
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                journal = fdesc.read()
+        except FileNotFoundError:
+            return data
+        lines = journal.splitlines()
+        if (
+            not lines
+            or "journal" not in data
+            or lines[0] != json_helper.json_bytes({"journal": data["journal"]})
+        ):
+            return data
+        for line in lines[1:]:
+            try:
+                changes = cast(list[list[Any]], json_util.json_loads(line))
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # The last change may be incomplete if writing it was interrupted
+                _LOGGER.warning(
+                    "Ignoring incomplete change in the journal of %s", self.key
+                )
+                return data
+            for change in changes:
+                data = _journal_apply(data, change)
+        if journal.endswith(b"\n") and self._journal_base is None:
+            # The data may be changed by whoever loaded it
+            base = json_util.json_loads_object(json_helper.json_bytes(data))
+            del base["journal"]
+            self._journal_base = base
+            self._journal_size = len(journal) - len(lines[0]) - 1
+            self._journal_snapshot_size = os.path.getsize(self.path)
+        return data
+
+    def _load_json(self) -> json_util.JsonValueType:
+        """Load the file and record how long it took."""
+        start = time.perf_counter()
+        try:
+            return json_util.load_json(self.path)
+        finally:
+            self._manager.record_load_time(self.key, time.perf_counter() - start)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +767,67 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            self._journal_base = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _journal_equal(old: Any, new: Any) -> bool:
+    """Return if JSON data is equal, telling 1, 1.0 and true apart."""
+    return bool(old == new) and json_helper.json_bytes(old) == json_helper.json_bytes(
+        new
+    )
+
+
+def _journal_diff(old: Any, new: Any) -> list[Any] | None:
+    """Return the change from old to new JSON data, None if they are equal.
+
+    Changes are ["=", value] to replace a value, ["d", changes, deleted]
+    to change and delete keys of an object, and ["l", start, end, items]
+    to replace the items from start to end of an array.
+    """
+    if type(old) is not type(new):
+        return ["=", new]
+    if type(new) is dict:
+        changes: dict[str, Any] = {}
+        for key, value in new.items():
+            if key not in old:
+                changes[key] = ["=", value]
+            elif (change := _journal_diff(old[key], value)) is not None:
+                changes[key] = change
+        deleted = [key for key in old if key not in new]
+        if not changes and not deleted:
+            return None
+        return ["d", changes, deleted]
+    if type(new) is list:
+        # Replace the items between the equal items at the start and the end
+        end = min(len(old), len(new))
+        start = 0
+        while start < end and _journal_equal(old[start], new[start]):
+            start += 1
+        if start == len(old) == len(new):
+            return None
+        same_end = 0
+        while start + same_end < end and _journal_equal(
+            old[-1 - same_end], new[-1 - same_end]
+        ):
+            same_end += 1
+        return ["l", start, len(old) - same_end, new[start : len(new) - same_end]]
+    if old == new:
+        return None
+    return ["=", new]
+
+
+def _journal_apply(data: Any, change: list[Any]) -> Any:
+    """Apply a change made by _journal_diff to JSON data."""
+    if change[0] == "=":
+        return change[1]
+    if change[0] == "d":
+        for key, value_change in change[1].items():
+            data[key] = _journal_apply(data.get(key), value_change)
+        for key in change[2]:
+            data.pop(key, None)
+        return data
+    data[change[1] : change[2]] = change[3]
+    return data
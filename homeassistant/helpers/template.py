@@ -6,7 +6,7 @@ from ast import literal_eval
 import asyncio
 import base64
 import collections.abc
-from collections.abc import Callable, Generator, Iterable
+from collections.abc import Callable, Generator, Iterable, Iterator
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from copy import deepcopy
@@ -34,7 +34,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -94,10 +93,13 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .template_fast_path import FastPath, FastPathUnsupported, compile_fast_path
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
 if TYPE_CHECKING:
+    from _collections_abc import dict_items, dict_keys, dict_values
+
     from _typeshed import OptExcInfo
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -136,6 +138,18 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "name",
 }
 
+# Properties of the states iterated over in a template which are collected
+# per domain to only re-render the template when a state change changes
+# one of them, reading anything else re-renders it on any state change
+_ITERATED_STATE_PROPERTIES = {
+    *_COLLECTABLE_STATE_ATTRIBUTES,
+    "entity_id",
+    "format_state",
+    "last_reported",
+    "state_with_unit",
+}
+_ANY_PROPERTY = "*"
+
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
 
@@ -164,11 +178,27 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+#
+# COMPILED_TEMPLATE_CACHE_SIZE is the number of compiled templates kept
+# in memory. Compiled templates are shared by all templates with the same
+# source and environment type, which avoids compiling the same source
+# over and over again when many templates are created from blueprints.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
+COMPILED_TEMPLATE_LRU: LRU[tuple[str, str], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
+FAST_PATH_TEMPLATE_LRU: LRU[tuple[str, str], FastPath | None] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
+# Results of these types parse back to themselves
+_FAST_PATH_NATIVE_TYPES = {bool, int}
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -353,6 +383,10 @@ def _false(arg: str) -> bool:
     return False
 
 
+def _true_state_change(old_state: State, new_state: State) -> bool:
+    return True
+
+
 @lru_cache(maxsize=EVAL_CACHE_SIZE)
 def _cached_parse_result(render_result: str) -> Any:
     """Parse a result and cache the result."""
@@ -395,8 +429,11 @@ class RenderInfo:
         "exception",
         "filter",
         "filter_lifecycle",
+        "filter_state_change",
         "has_time",
         "is_static",
+        "iterated_attributes",
+        "iterated_properties",
         "rate_limit",
         "template",
     )
@@ -407,6 +444,7 @@ class RenderInfo:
         # Will be set sensibly once frozen.
         self.filter_lifecycle: Callable[[str], bool] = _true
         self.filter: Callable[[str], bool] = _true
+        self.filter_state_change: Callable[[State, State], bool] = _true_state_change
         self._result: str | None = None
         self.is_static = False
         self.exception: TemplateError | None = None
@@ -415,6 +453,10 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # domain -> names of the properties, and keys of the attributes,
+        # read from the states of the domain while iterating over them
+        self.iterated_properties: dict[str, set[str]] = {}
+        self.iterated_attributes: dict[str, set[str]] = {}
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -457,6 +499,30 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _filter_iterated_state_change(self, old_state: State, new_state: State) -> bool:
+        """Template should re-render if the entity state changes.
+
+        Only when the entity is referenced or when something which was read
+        from the states of its domain while iterating over them changed.
+        """
+        if new_state.entity_id in self.entities:
+            return True
+        domain = new_state.domain
+        if properties := self.iterated_properties.get(domain):
+            if _ANY_PROPERTY in properties:
+                return True
+            for name in properties:
+                if getattr(old_state, name) != getattr(new_state, name):
+                    return True
+        if not (keys := self.iterated_attributes.get(domain)):
+            return False
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        return old_attributes is not new_attributes and any(
+            old_attributes.get(key, _SENTINEL) != new_attributes.get(key, _SENTINEL)
+            for key in keys
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -491,6 +557,9 @@ class RenderInfo:
             else:
                 self.filter_lifecycle = _false
 
+        if self.all_states or self.domains:
+            self.filter_state_change = self._filter_iterated_state_change
+
         if self.all_states:
             return
 
@@ -510,6 +579,7 @@ class Template:
         "_compiled",
         "_compiled_code",
         "_exc_info",
+        "_fast_path",
         "_hash_cache",
         "_limited",
         "_log_fn",
@@ -542,6 +612,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_path: FastPath | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: OptExcInfo | None = None
@@ -577,14 +648,15 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        env = self._env
+        if compiled := COMPILED_TEMPLATE_LRU.get((env.environment_type, self.template)):
             self._compiled_code = compiled
             return
 
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
-                self._compiled_code = self._env.compile(self.template)
+                self._compiled_code = env.compile(self.template)
             except jinja2.TemplateError as err:
                 raise TemplateError(err) from err
 
@@ -639,10 +711,32 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
-        try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
-        except Exception as err:
-            raise TemplateError(err) from err
+        render_result: str | None = None
+        if (fast_path := self._fast_path) is not None:
+            try:
+                with _template_context_manager as cm:
+                    cm.set_template(self.template, "rendering")
+                    env = cast(TemplateEnvironment, compiled.environment)
+                    result = fast_path(env, kwargs)
+            except FastPathUnsupported:
+                # Leave the template to Jinja from now on
+                self._fast_path = None
+            except Exception as err:
+                raise TemplateError(err) from err
+            else:
+                if (
+                    type(result) in _FAST_PATH_NATIVE_TYPES
+                    and parse_result
+                    and not (self.hass and self.hass.config.legacy_templates)
+                ):
+                    return result
+                render_result = str(result)
+
+        if render_result is None:
+            try:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
+            except Exception as err:
+                raise TemplateError(err) from err
 
         if len(render_result) > MAX_TEMPLATE_OUTPUT:
             raise TemplateError(
@@ -861,6 +955,8 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if log_fn is None:
+            self._fast_path = _get_fast_path(env, self.template)
 
         return self._compiled
 
@@ -1032,6 +1128,91 @@ class DomainStates:
         return f"<template DomainStates('{self._domain}')>"
 
 
+class _IteratedStateAttributes(ReadOnlyDict[str, Any]):
+    """Attributes of a state iterated over in a template.
+
+    Collects which attributes are read by the template, everything but
+    looking up keys collects all of them.
+    """
+
+    def __init__(self, domain: str, attributes: ReadOnlyDict[str, Any]) -> None:
+        """Initialize the attributes."""
+        super().__init__(attributes)
+        self._domain = domain
+
+    def _collect(self, key: str | None) -> None:
+        if (render_info := _render_info.get()) is None:
+            return
+        if key is None:
+            render_info.iterated_properties.setdefault(self._domain, set()).add(
+                "attributes"
+            )
+        else:
+            render_info.iterated_attributes.setdefault(self._domain, set()).add(key)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return an attribute."""
+        self._collect(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Return if there is an attribute."""
+        self._collect(key if isinstance(key, str) else None)
+        return super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return an attribute or the default."""
+        self._collect(key)
+        return super().get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the attributes."""
+        self._collect(None)
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        """Return the number of attributes."""
+        self._collect(None)
+        return super().__len__()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the attributes."""
+        self._collect(None)
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        """Compare the attributes."""
+        self._collect(None)
+        return super().__ne__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the representation of the attributes."""
+        self._collect(None)
+        return super().__repr__()
+
+    def keys(self) -> dict_keys[str, Any]:
+        """Return the keys of the attributes."""
+        self._collect(None)
+        return super().keys()
+
+    def values(self) -> dict_values[str, Any]:
+        """Return the values of the attributes."""
+        self._collect(None)
+        return super().values()
+
+    def items(self) -> dict_items[str, Any]:
+        """Return the attributes."""
+        self._collect(None)
+        return super().items()
+
+    def copy(self) -> dict[str, Any]:
+        """Return a copy of the attributes."""
+        self._collect(None)
+        return dict(super().items())
+
+
 class TemplateStateBase(State):
     """Class to represent a state object in a template."""
 
@@ -1051,9 +1232,16 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
         self._cache: dict[str, Any] = {}
 
-    def _collect_state(self) -> None:
-        if self._collect and (render_info := _render_info.get()):
+    def _collect_state(self, *names: str) -> None:
+        if (render_info := _render_info.get()) is None:
+            return
+        if self._collect:
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+        elif names:
+            # The state is iterated over, collect what is read from it
+            render_info.iterated_properties.setdefault(
+                self._state.domain, set()
+            ).update(names)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -1061,7 +1249,9 @@ class TemplateStateBase(State):
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
+            if (render_info := _render_info.get()) is not None:
+                if not self._collect:
+                    return getattr(self, item)
                 render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
@@ -1081,37 +1271,46 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
-        return self._state.attributes
+        if self._collect or (render_info := _render_info.get()) is None:
+            self._collect_state()
+            return self._state.attributes
+        # The state is iterated over, collect which attributes are read
+        domain = self._state.domain
+        render_info.iterated_properties.setdefault(domain, set())
+        if (attributes := self._cache.get("_iterated_attributes")) is None:
+            attributes = self._cache["_iterated_attributes"] = _IteratedStateAttributes(
+                domain, self._state.attributes
+            )
+        return attributes
 
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
     @property
     def last_reported(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_reported."""
-        self._collect_state()
+        self._collect_state("last_reported")
         return self._state.last_reported
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
@@ -1129,7 +1328,7 @@ class TemplateStateBase(State):
     @property
     def name(self) -> str:  # type: ignore[override]
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state("name")
         return self._state.name
 
     @property
@@ -1146,7 +1345,7 @@ class TemplateStateBase(State):
             async_rounded_state,
         )
 
-        self._collect_state()
+        self._collect_state("state", "attributes")
         if rounded and self._state.domain == SENSOR_DOMAIN:
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
@@ -1157,7 +1356,7 @@ class TemplateStateBase(State):
 
     def __eq__(self, other: object) -> bool:
         """Ensure we collect on equality check."""
-        self._collect_state()
+        self._collect_state("state", "attributes", "context")
         return self._state.__eq__(other)
 
 
@@ -1174,6 +1373,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state(_ANY_PROPERTY)
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -2573,6 +2773,11 @@ def to_json(
     sort_keys: bool = False,
 ) -> str:
     """Convert an object to a JSON string."""
+    if (render_info := _render_info.get()) is not None:
+        # orjson serializes the attributes of the states iterated over
+        # without collecting which of them are read
+        for properties in render_info.iterated_properties.values():
+            properties.add("attributes")
     if ensure_ascii:
         # For those who need ascii, we can't use orjson, so we fall back to the json library.
         return json.dumps(
@@ -2747,6 +2952,16 @@ class TemplateContextManager(AbstractContextManager):
 _template_context_manager = TemplateContextManager()
 
 
+def _get_fast_path(env: TemplateEnvironment, template_str: str) -> FastPath | None:
+    """Return the shared fast path of a template, or None if it has none."""
+    key = (env.environment_type, template_str)
+    try:
+        return FAST_PATH_TEMPLATE_LRU[key]
+    except KeyError:
+        fast_path = FAST_PATH_TEMPLATE_LRU[key] = compile_fast_path(env, template_str)
+        return fast_path
+
+
 def _render_with_context(
     template_str: str, template: jinja2.Template, **kwargs: Any
 ) -> str:
@@ -2875,9 +3090,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        # The compiled templates are cached per type of environment, without
+        # hass the Home Assistant filters and functions are missing
+        self.environment_type: Literal["normal", "limited", "strict", "no_hass"] = (
+            "no_hass"
+            if hass is None
+            else "limited"
+            if limited
+            else "strict"
+            if strict
+            else "normal"
+        )
+        # Functions which are passed a context they do not use
+        self.context_free_functions: set[Callable[..., Any]] = set()
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2997,6 +3222,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
                 return func(hass, *args, **kwargs)
 
+            self.context_free_functions.add(wrapper)
             return jinja_context(wrapper)
 
         self.globals["device_entities"] = hassfunction(device_entities)
@@ -3166,7 +3392,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.globals["today_at"] = hassfunction(today_at)
         self.filters["today_at"] = self.globals["today_at"]
 
-    def is_safe_callable(self, obj):
+    def is_safe_callable(self, obj: Any) -> bool:
         """Test if callback is safe."""
         return isinstance(
             obj, (AllStates, StateTranslated)
@@ -3174,6 +3400,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
     def is_safe_attribute(self, obj, attr, value):
         """Test if attribute is safe."""
+        if isinstance(obj, TemplateState) and attr not in _ITERATED_STATE_PROPERTIES:
+            # Only some properties of states iterated over are collected
+            obj._collect_state(_ANY_PROPERTY)  # noqa: SLF001
+
         if isinstance(
             obj, (AllStates, DomainStates, TemplateState, LoopContext, AsyncLoopContext)
         ):
@@ -3231,7 +3461,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         compiled = super().compile(source)
-        self.template_cache[source] = compiled
+        if isinstance(source, str):
+            COMPILED_TEMPLATE_LRU[(self.environment_type, source)] = compiled
         return compiled
 
 
@@ -0,0 +1,289 @@
+"""Evaluate simple templates without rendering them with Jinja.
+
+Most templates are a single expression like
+``{{ states('sensor.x') | float * 2 }}``. Rendering them with Jinja
+creates a new context and runs the generated render function every
+time. The expression of such templates is compiled to nested closures
+instead, which call the same globals, filters and sandbox checks as
+Jinja does. Anything else raises FastPathUnsupported so the template
+is rendered with Jinja.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import operator
+from typing import TYPE_CHECKING, Any, cast
+
+import jinja2
+from jinja2 import nodes
+
+if TYPE_CHECKING:
+    from .template import TemplateEnvironment
+
+type FastPath = Callable[[TemplateEnvironment, dict[str, Any]], Any]
+
+_BINARY_OPERATORS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mod: operator.mod,
+    nodes.Pow: operator.pow,
+}
+_UNARY_OPERATORS: dict[type[nodes.UnaryExpr], Callable[[Any], Any]] = {
+    nodes.Not: operator.not_,
+    nodes.Neg: operator.neg,
+    nodes.Pos: operator.pos,
+}
+_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda left, right: left in right,
+    "notin": lambda left, right: left not in right,
+}
+
+
+class FastPathUnsupported(Exception):
+    """Raised when a template has to be rendered with Jinja."""
+
+
+def compile_fast_path(env: TemplateEnvironment, source: str) -> FastPath | None:
+    """Return a fast path for a template, or None if it is not supported."""
+    try:
+        template = env.parse(source)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if (
+        len(template.body) != 1
+        or not isinstance(output := template.body[0], nodes.Output)
+        or len(output.nodes) != 1
+        or isinstance(output.nodes[0], nodes.TemplateData)
+    ):
+        return None
+    try:
+        return _compile(output.nodes[0])
+    except FastPathUnsupported:
+        return None
+
+
+def _defined(value: Any) -> Any:
+    """Return a value, undefined values are left to Jinja."""
+    if isinstance(value, jinja2.Undefined):
+        raise FastPathUnsupported
+    return value
+
+
+def _with_pass_arg(env: TemplateEnvironment, func: Any, args: list[Any]) -> list[Any]:
+    """Add the argument Jinja passes to some functions and filters."""
+    if (pass_arg := getattr(func, "jinja_pass_arg", None)) is None:
+        return args
+    if pass_arg.name == "environment":
+        return [env, *args]
+    if pass_arg.name == "context" and func in env.context_free_functions:
+        return [None, *args]
+    raise FastPathUnsupported
+
+
+def _compile(node: nodes.Node) -> FastPath:
+    """Compile an expression."""
+    if (compiler := _COMPILERS.get(type(node))) is None:
+        raise FastPathUnsupported
+    return compiler(node)
+
+
+def _compile_list(items: list[nodes.Expr]) -> list[FastPath]:
+    """Compile a list of expressions."""
+    return [_compile(item) for item in items]
+
+
+def _compile_keywords(keywords: list[nodes.Keyword]) -> list[tuple[str, FastPath]]:
+    """Compile keyword arguments."""
+    return [(keyword.key, _compile(keyword.value)) for keyword in keywords]
+
+
+def _compile_const(node: nodes.Const) -> FastPath:
+    """Compile a constant."""
+    value = node.value
+    return lambda env, variables: value
+
+
+def _compile_name(node: nodes.Name) -> FastPath:
+    """Compile a variable, looked up like Jinja does in the variables first."""
+    name = node.name
+
+    def _name(env: TemplateEnvironment, variables: dict[str, Any]) -> Any:
+        if name in variables:
+            return _defined(variables[name])
+        if name in env.globals:
+            return env.globals[name]
+        raise FastPathUnsupported
+
+    return _name
+
+
+def _compile_getattr(node: nodes.Getattr) -> FastPath:
+    """Compile an attribute lookup, checked by the sandbox."""
+    obj = _compile(node.node)
+    attr = node.attr
+    return lambda env, variables: _defined(env.getattr(obj(env, variables), attr))
+
+
+def _compile_getitem(node: nodes.Getitem) -> FastPath:
+    """Compile a subscript, checked by the sandbox."""
+    if isinstance(node.arg, nodes.Slice):
+        raise FastPathUnsupported
+    obj = _compile(node.node)
+    arg = _compile(node.arg)
+    return lambda env, variables: _defined(
+        env.getitem(obj(env, variables), arg(env, variables))
+    )
+
+
+def _compile_call(node: nodes.Call) -> FastPath:
+    """Compile a call, checked by the sandbox."""
+    if node.dyn_args is not None or node.dyn_kwargs is not None:
+        raise FastPathUnsupported
+    func = _compile(node.node)
+    call_args = _compile_list(node.args)
+    call_kwargs = _compile_keywords(node.kwargs)
+
+    def _call(env: TemplateEnvironment, variables: dict[str, Any]) -> Any:
+        obj = func(env, variables)
+        args = [arg(env, variables) for arg in call_args]
+        kwargs = {key: value(env, variables) for key, value in call_kwargs}
+        # str.format and format_map are only sandboxed when Jinja calls them
+        if env.wrap_str_format(obj) is not None or not env.is_safe_callable(obj):
+            raise FastPathUnsupported
+        try:
+            return _defined(obj(*_with_pass_arg(env, obj, args), **kwargs))
+        except StopIteration as err:
+            raise FastPathUnsupported from err
+
+    return _call
+
+
+def _compile_filter(node: nodes.Filter) -> FastPath:
+    """Compile a filter."""
+    if node.node is None or node.dyn_args is not None or node.dyn_kwargs is not None:
+        raise FastPathUnsupported
+    filter_value = _compile(node.node)
+    name = node.name
+    filter_args = _compile_list(node.args)
+    # Jinja types the keyword arguments of filters as pairs, they are keywords
+    filter_kwargs = _compile_keywords(cast(list[nodes.Keyword], node.kwargs))
+
+    def _filter(env: TemplateEnvironment, variables: dict[str, Any]) -> Any:
+        if (func := env.filters.get(name)) is None:
+            raise FastPathUnsupported
+        args = [filter_value(env, variables)]
+        args.extend(arg(env, variables) for arg in filter_args)
+        kwargs = {key: value(env, variables) for key, value in filter_kwargs}
+        return _defined(func(*_with_pass_arg(env, func, args), **kwargs))
+
+    return _filter
+
+
+def _compile_and(node: nodes.And) -> FastPath:
+    """Compile a logical and."""
+    left = _compile(node.left)
+    right = _compile(node.right)
+    return lambda env, variables: left(env, variables) and right(env, variables)
+
+
+def _compile_or(node: nodes.Or) -> FastPath:
+    """Compile a logical or."""
+    left = _compile(node.left)
+    right = _compile(node.right)
+    return lambda env, variables: left(env, variables) or right(env, variables)
+
+
+def _compile_binary(node: nodes.BinExpr) -> FastPath:
+    """Compile an arithmetic operator."""
+    binary_operator = _BINARY_OPERATORS[type(node)]
+    left = _compile(node.left)
+    right = _compile(node.right)
+    return lambda env, variables: binary_operator(
+        left(env, variables), right(env, variables)
+    )
+
+
+def _compile_unary(node: nodes.UnaryExpr) -> FastPath:
+    """Compile a unary operator."""
+    unary_operator = _UNARY_OPERATORS[type(node)]
+    operand = _compile(node.node)
+    return lambda env, variables: unary_operator(operand(env, variables))
+
+
+def _compile_compare(node: nodes.Compare) -> FastPath:
+    """Compile a comparison, chained comparisons behave like in Python."""
+    expr = _compile(node.expr)
+    operands = [
+        (_COMPARE_OPERATORS[operand.op], _compile(operand.expr)) for operand in node.ops
+    ]
+
+    def _compare(env: TemplateEnvironment, variables: dict[str, Any]) -> Any:
+        left = expr(env, variables)
+        result: Any = True
+        for compare, right_expr in operands:
+            right = right_expr(env, variables)
+            if not (result := compare(left, right)):
+                return result
+            left = right
+        return result
+
+    return _compare
+
+
+def _compile_concat(node: nodes.Concat) -> FastPath:
+    """Compile a string concatenation."""
+    items = _compile_list(node.nodes)
+    return lambda env, variables: "".join([str(item(env, variables)) for item in items])
+
+
+def _compile_cond(node: nodes.CondExpr) -> FastPath:
+    """Compile an inline if expression."""
+    if node.expr2 is None:
+        raise FastPathUnsupported
+    test = _compile(node.test)
+    if_true = _compile(node.expr1)
+    if_false = _compile(node.expr2)
+    return lambda env, variables: (
+        if_true(env, variables) if test(env, variables) else if_false(env, variables)
+    )
+
+
+def _compile_list_literal(node: nodes.List) -> FastPath:
+    """Compile a list literal."""
+    items = _compile_list(node.items)
+    return lambda env, variables: [item(env, variables) for item in items]
+
+
+def _compile_tuple_literal(node: nodes.Tuple) -> FastPath:
+    """Compile a tuple literal."""
+    items = _compile_list(node.items)
+    return lambda env, variables: tuple([item(env, variables) for item in items])
+
+
+_COMPILERS: dict[type[nodes.Node], Callable[[Any], FastPath]] = {
+    nodes.Const: _compile_const,
+    nodes.Name: _compile_name,
+    nodes.Getattr: _compile_getattr,
+    nodes.Getitem: _compile_getitem,
+    nodes.Call: _compile_call,
+    nodes.Filter: _compile_filter,
+    nodes.And: _compile_and,
+    nodes.Or: _compile_or,
+    **dict.fromkeys(_BINARY_OPERATORS, _compile_binary),
+    **dict.fromkeys(_UNARY_OPERATORS, _compile_unary),
+    nodes.Compare: _compile_compare,
+    nodes.Concat: _compile_concat,
+    nodes.CondExpr: _compile_cond,
+    nodes.List: _compile_list_literal,
+    nodes.Tuple: _compile_tuple_literal,
+}
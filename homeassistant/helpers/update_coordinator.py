@@ -8,7 +8,7 @@ from collections.abc import Awaitable, Callable, Coroutine, Generator
 from datetime import datetime, timedelta
 from functools import partial
 import logging
-from random import randint
+from random import randint, random
 from time import monotonic
 from typing import Any, Generic, Protocol, TypeVar
 import urllib.error
@@ -19,7 +19,7 @@ import requests
 
 from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -232,16 +232,18 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
-        # We use loop.call_at because DataUpdateCoordinator does
+        # We use the timer wheel because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
         hass = self.hass
-        loop = hass.loop
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
-        )
-        self._unsub_refresh = loop.call_at(
+        interval = self._update_interval_seconds
+        if hass.state is CoreState.starting:
+            # Coordinators set up together at startup would keep polling at
+            # the same time, spread their first refresh across their interval
+            interval *= 1 - random()
+        next_refresh = int(hass.loop.time()) + self._microsecond + interval
+        self._unsub_refresh = hass.timer_wheel.async_call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
 
@@ -29,7 +29,7 @@ from propcache.api import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -49,6 +49,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -80,6 +81,22 @@ BASE_PRELOAD_PLATFORMS = [
     "system_health",
     "trigger",
 ]
+# Platforms of BASE_PRELOAD_PLATFORMS which are processed by the integration
+# of the same name. They are only preloaded if that integration is set up or
+# is going to be set up, as they would never be imported otherwise.
+LAZY_PRELOAD_PLATFORMS = {
+    "backup",
+    "diagnostics",
+    "energy",
+    "group",
+    "hardware",
+    "intent",
+    "logbook",
+    "media_source",
+    "recorder",
+    "repairs",
+    "system_health",
+}
 
 
 @dataclass
@@ -133,6 +150,11 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_TIMES: HassKey[dict[str, float]] = HassKey("import_times")
+DATA_MANIFEST_INDEX: HassKey[ManifestIndex] = HassKey("manifest_index")
+MANIFEST_INDEX_KEY = "core.manifest_index"
+MANIFEST_INDEX_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -271,6 +293,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMES] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -294,18 +317,21 @@ def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
     except ImportError:
         return {}
 
-    dirs = [
-        entry
-        for path in custom_components.__path__
-        for entry in pathlib.Path(path).iterdir()
-        if entry.is_dir()
-    ]
+    if (index := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        dirs = [
+            entry.name
+            for path in custom_components.__path__
+            for entry in pathlib.Path(path).iterdir()
+            if entry.is_dir()
+        ]
+    else:
+        dirs = [
+            name
+            for path in custom_components.__path__
+            for name in index.list_custom_components(path)
+        ]
 
-    integrations = _resolve_integrations_from_root(
-        hass,
-        custom_components,
-        [comp.name for comp in dirs],
-    )
+    integrations = _resolve_integrations_from_root(hass, custom_components, dirs)
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -322,7 +348,10 @@ async def async_get_custom_components(
     if comps_or_future is None:
         future = hass.data[DATA_CUSTOM_COMPONENTS] = hass.loop.create_future()
 
+        if DATA_MANIFEST_INDEX not in hass.data:
+            await _async_load_manifest_index(hass)
         comps = await hass.async_add_executor_job(_get_custom_components, hass)
+        hass.data[DATA_MANIFEST_INDEX].async_schedule_save()
 
         hass.data[DATA_CUSTOM_COMPONENTS] = comps
         future.set_result(comps)
@@ -653,30 +682,33 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index = hass.data.get(DATA_MANIFEST_INDEX)
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
-                continue
+            file_path = pathlib.Path(base) / domain
 
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if index is None:
+                    integration_dir = _read_integration_dir(file_path)
+                else:
+                    integration_dir = index.read_integration_dir(file_path)
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    "Error parsing manifest.json file at %s: %s",
+                    file_path / "manifest.json",
+                    err,
                 )
                 continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            if integration_dir is None:
+                continue
+
+            manifest, top_level_files = integration_dir
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -766,9 +798,11 @@ class Integration:
             self._all_dependencies = set()
 
         self._platforms_to_preload = hass.data[DATA_PRELOAD_PLATFORMS]
+        self._preloaded_platforms: set[str] = set()
         self._component_future: asyncio.Future[ComponentProtocol] | None = None
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
+        self._import_times = hass.data[DATA_IMPORT_TIMES]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
@@ -1070,6 +1104,7 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1086,12 +1121,35 @@ class Integration:
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
         if preload_platforms:
-            for platform_name in self.platforms_exists(self._platforms_to_preload):
+            for platform_name in self.platforms_exists(
+                self._get_platforms_to_preload()
+            ):
                 with suppress(ImportError):
                     self.get_platform(platform_name)
+                    self._preloaded_platforms.add(platform_name)
 
+        self._import_times[domain] = time.perf_counter() - start
         return cache[domain]
 
+    def _get_platforms_to_preload(self) -> list[str]:
+        """Return the platforms to preload.
+
+        This method is thread-safe as it only checks membership of the
+        integrations which are set up or are going to be set up.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .setup import DATA_SETUP_DONE
+
+        components = self.hass.config.components
+        to_be_loaded = self.hass.data.get(DATA_SETUP_DONE, {})
+        return [
+            platform_name
+            for platform_name in self._platforms_to_preload
+            if platform_name not in LAZY_PRELOAD_PLATFORMS
+            or platform_name in components
+            or platform_name in to_be_loaded
+        ]
+
     def _load_platforms(self, platform_names: Iterable[str]) -> dict[str, ModuleType]:
         """Load platforms for an integration."""
         return {
@@ -1101,6 +1159,7 @@ class Integration:
 
     async def async_get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
+        self._preloaded_platforms.discard(platform_name)
         # Fast path for a single platform when it is already cached.
         # This is the common case.
         if platform := self._cache.get(f"{self.domain}.{platform_name}"):
@@ -1121,6 +1180,7 @@ class Integration:
         import_futures: list[tuple[str, asyncio.Future[ModuleType]]] = []
 
         for platform_name in platform_names:
+            self._preloaded_platforms.discard(platform_name)
             if platform := self._get_platform_cached_or_raise(platform_name):
                 platforms[platform_name] = platform
                 continue
@@ -1227,10 +1287,12 @@ class Integration:
 
     def get_platform_cached(self, platform_name: str) -> ModuleType | None:
         """Return a platform for an integration from cache."""
+        self._preloaded_platforms.discard(platform_name)
         return self._cache.get(f"{self.domain}.{platform_name}")  # type: ignore[return-value]
 
     def get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
+        self._preloaded_platforms.discard(platform_name)
         if platform := self._get_platform_cached_or_raise(platform_name):
             return platform
         return self._load_platform(platform_name)
@@ -1322,6 +1384,145 @@ def _version_blocked(
     return True
 
 
+def _read_integration_dir(
+    file_path: pathlib.Path,
+) -> tuple[Manifest, set[str] | None] | None:
+    """Read the manifest and list the files of an integration directory.
+
+    Returns None if the directory has no manifest.
+    """
+    manifest_path = file_path / "manifest.json"
+    if not manifest_path.is_file():
+        return None
+    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+    # Avoid the listdir for virtual integrations
+    # as they cannot have any platforms
+    if manifest.get("integration_type") == "virtual":
+        return manifest, None
+    return manifest, set(os.listdir(file_path))
+
+
+class _ManifestIndexEntry(TypedDict):
+    """An integration directory in the manifest index."""
+
+    # The modification times of the integration directory and its manifest
+    mtimes: list[int]
+    manifest: Manifest
+    files: list[str] | None
+
+
+class _ManifestIndexData(TypedDict):
+    """The manifest index as it is stored."""
+
+    ha_version: str
+    integrations: dict[str, _ManifestIndexEntry]
+    # The modification time and the directories of custom_components paths
+    custom_components: dict[str, tuple[int, list[str]]]
+
+
+class ManifestIndex:
+    """Index of the manifests and files of integration directories.
+
+    Reading the manifests of all integrations and listing their files
+    takes many reads on every start, which is slow on slow storage. The
+    index is stored and loaded with one read instead. Entries are valid
+    as long as the modification times of the integration directory and
+    its manifest did not change, and only for the Home Assistant version
+    they were read with. A built-in integration may be changed in place,
+    like in a development checkout.
+
+    The index is read from the executor, the entries are added with a
+    single assignment so concurrent reads are safe.
+    """
+
+    def __init__(
+        self, store: Store[_ManifestIndexData], data: _ManifestIndexData | None
+    ) -> None:
+        """Initialize the index."""
+        self._store = store
+        self._integrations: dict[str, _ManifestIndexEntry] = {}
+        self._custom_components: dict[str, tuple[int, list[str]]] = {}
+        self._changed = data is None or data["ha_version"] != __version__
+        if data is None or self._changed:
+            return
+        self._custom_components = data["custom_components"]
+        self._integrations = data["integrations"]
+
+    def read_integration_dir(
+        self, file_path: pathlib.Path
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and the files of an integration directory.
+
+        Must be called from the executor.
+        """
+        path = str(file_path)
+        try:
+            mtimes = [
+                file_path.stat().st_mtime_ns,
+                (file_path / "manifest.json").stat().st_mtime_ns,
+            ]
+        except OSError:
+            return None
+        if (entry := self._integrations.get(path)) is None or entry["mtimes"] != mtimes:
+            if (integration_dir := _read_integration_dir(file_path)) is None:
+                return None
+            manifest, files = integration_dir
+            entry = self._integrations[path] = {
+                "mtimes": mtimes,
+                "manifest": manifest.copy(),
+                "files": None if files is None else sorted(files),
+            }
+            self._changed = True
+        entry_files = entry["files"]
+        return (
+            entry["manifest"].copy(),
+            None if entry_files is None else set(entry_files),
+        )
+
+    def list_custom_components(self, path: str) -> list[str]:
+        """Return the directories of a custom_components path.
+
+        Must be called from the executor.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        if (cached := self._custom_components.get(path)) is not None and cached[
+            0
+        ] == mtime:
+            return cached[1]
+        dirs = [entry.name for entry in pathlib.Path(path).iterdir() if entry.is_dir()]
+        self._custom_components[path] = (mtime, dirs)
+        self._changed = True
+        return dirs
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the index if integration directories were read."""
+        if self._changed:
+            self._changed = False
+            self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> _ManifestIndexData:
+        """Return the data of the index to store."""
+        # Copy as integration directories may be read meanwhile
+        return {
+            "ha_version": __version__,
+            "integrations": self._integrations.copy(),
+            "custom_components": self._custom_components.copy(),
+        }
+
+
+async def _async_load_manifest_index(hass: HomeAssistant) -> None:
+    """Load the manifest index."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[_ManifestIndexData](
+        hass, MANIFEST_INDEX_VERSION, MANIFEST_INDEX_KEY, private=True
+    )
+    hass.data[DATA_MANIFEST_INDEX] = ManifestIndex(store, await store.async_load())
+
+
 def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
 ) -> dict[str, Integration]:
@@ -1338,6 +1539,23 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+@callback
+def async_get_unused_preloaded_platforms(hass: HomeAssistant) -> dict[str, list[str]]:
+    """Return the preloaded platforms of each integration which were not used."""
+    return {
+        domain: sorted(int_or_fut._preloaded_platforms)  # noqa: SLF001
+        for domain, int_or_fut in hass.data[DATA_INTEGRATIONS].items()
+        if type(int_or_fut) is Integration
+        and int_or_fut._preloaded_platforms  # noqa: SLF001
+    }
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return the time it took to import the component of each integration."""
+    return hass.data[DATA_IMPORT_TIMES]
+
+
 @callback
 def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration which is already loaded.
@@ -1418,6 +1636,8 @@ async def async_get_integrations(
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, needed
         )
+        if (index := hass.data.get(DATA_MANIFEST_INDEX)) is not None:
+            index.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -6,17 +6,23 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
 import logging
+import os
 from timeit import default_timer as timer
+import tracemalloc
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import template
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -116,6 +122,75 @@ async def fire_events_with_filter(hass: core.HomeAssistant) -> float:
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_filter_10k_listeners(hass: core.HomeAssistant) -> float:
+    """Fire 10k events to 10k listeners that each filter on entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    listener_count = events_to_fire = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listener_count):
+        entity_id = f"light.kitchen{idx}"
+
+        @core.callback
+        def event_filter(event_data, entity_id=entity_id):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_name, {"entity_id": f"light.kitchen{idx}"})
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_with_event_data_match_10k_listeners(
+    hass: core.HomeAssistant,
+) -> float:
+    """Fire 10k events to 10k listeners that each match on entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    listener_count = events_to_fire = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listener_count):
+        hass.bus.async_listen(
+            event_name,
+            listener,
+            event_data_match={"entity_id": f"light.kitchen{idx}"},
+        )
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_name, {"entity_id": f"light.kitchen{idx}"})
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass: core.HomeAssistant) -> float:
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +383,270 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_memory(hass: core.HomeAssistant) -> float:
+    """Report the memory used per entity by 12k sensor states."""
+    entity_count = 12000
+    device_classes = ("temperature", "humidity", "battery", "power")
+
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    start = timer()
+
+    for idx in range(entity_count):
+        device_class = device_classes[idx % len(device_classes)]
+        hass.states.async_set(
+            f"sensor.{device_class}_{idx}",
+            str(idx % 100),
+            {
+                "state_class": "measurement",
+                "unit_of_measurement": "%",
+                "device_class": device_class,
+            },
+        )
+
+    runtime = timer() - start
+    states_memory = tracemalloc.get_traced_memory()[0]
+
+    for state in hass.states.async_all():
+        state.json_fragment  # noqa: B018
+        state.as_compressed_state_json  # noqa: B018
+
+    serialized_memory = tracemalloc.get_traced_memory()[0]
+    hass.states.async_evict_serialized_caches()
+    evicted_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    distinct_attributes = len(
+        {id(state.attributes) for state in hass.states.async_all()}
+    )
+    print(
+        f"Bytes per entity: {(states_memory - start_memory) // entity_count} "
+        f"after set, {(serialized_memory - start_memory) // entity_count} "
+        f"after serialization, {(evicted_memory - start_memory) // entity_count} "
+        f"after evicting serialized caches; "
+        f"{distinct_attributes} distinct attribute mappings"
+    )
+
+    return runtime
+
+
+@benchmark
+async def partitioned_states_history(hass: core.HomeAssistant) -> float:
+    """Compare a flat and a monthly partitioned states table on PostgreSQL.
+
+    The database is set with BENCHMARK_POSTGRESQL_URL and the number of
+    states with BENCHMARK_STATES_ROWS, 100 million by default.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine, text
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.partitions import (
+        create_partition_sql,
+        month_partitions,
+    )
+
+    rows = int(os.environ.get("BENCHMARK_STATES_ROWS", 10**8))
+    entities = 1000
+    end = dt_util.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=2 * 365)
+    step = (end - start).total_seconds() / rows
+    columns = (
+        "state_id bigint NOT NULL, metadata_id integer, state varchar(255), "
+        "last_updated_ts double precision NOT NULL"
+    )
+    engine = create_engine(os.environ["BENCHMARK_POSTGRESQL_URL"])
+
+    def _query(table: str) -> float:
+        query_start = timer()
+        with engine.connect() as conn:
+            conn.execute(
+                text(
+                    f"SELECT state, last_updated_ts FROM {table} "  # noqa: S608
+                    "WHERE metadata_id = 1 AND last_updated_ts >= :start "
+                    "AND last_updated_ts < :end ORDER BY last_updated_ts"
+                ),
+                {
+                    "start": (end - timedelta(days=365)).timestamp(),
+                    "end": end.timestamp(),
+                },
+            ).all()
+        return timer() - query_start
+
+    def _purge_month(statement: str) -> float:
+        purge_start = timer()
+        with engine.begin() as conn:
+            conn.execute(text(statement))
+        return timer() - purge_start
+
+    def _run() -> float:
+        partitions = month_partitions("bench_states_partitioned", start, end)
+        with engine.begin() as conn:
+            for statement in (
+                "DROP TABLE IF EXISTS bench_states_flat",
+                "DROP TABLE IF EXISTS bench_states_partitioned",
+                f"CREATE TABLE bench_states_flat ({columns})",
+                f"CREATE TABLE bench_states_partitioned ({columns}) "
+                "PARTITION BY RANGE (last_updated_ts)",
+                *(
+                    create_partition_sql("bench_states_partitioned", partition)
+                    for partition in partitions
+                ),
+            ):
+                conn.execute(text(statement))
+            for table in ("bench_states_flat", "bench_states_partitioned"):
+                print(f"Inserting {rows} states into {table}")
+                conn.execute(
+                    text(
+                        f"INSERT INTO {table} SELECT g, g % :entities, "  # noqa: S608
+                        "(g % 100)::text, :start + g * :step "
+                        "FROM generate_series(1, :rows) g"
+                    ),
+                    {
+                        "entities": entities,
+                        "start": start.timestamp(),
+                        "step": step,
+                        "rows": rows,
+                    },
+                )
+                conn.execute(
+                    text(
+                        f"CREATE INDEX ix_{table}_metadata_id_last_updated_ts "
+                        f"ON {table} (metadata_id, last_updated_ts)"
+                    )
+                )
+                conn.execute(text(f"ANALYZE {table}"))
+
+        flat_query = _query("bench_states_flat")
+        partitioned_query = _query("bench_states_partitioned")
+        oldest = partitions[0]
+        flat_purge = _purge_month(
+            "DELETE FROM bench_states_flat "  # noqa: S608
+            f"WHERE last_updated_ts < {oldest.end_ts!r}"
+        )
+        partitioned_purge = _purge_month(f"DROP TABLE {oldest.name}")
+        print(
+            f"One year of history for one entity: {flat_query:.3f}s flat, "
+            f"{partitioned_query:.3f}s partitioned; "
+            f"purging the oldest month: {flat_purge:.3f}s flat, "
+            f"{partitioned_purge:.3f}s partitioned"
+        )
+        return flat_query + partitioned_query
+
+    try:
+        return await hass.async_add_executor_job(_run)
+    finally:
+        engine.dispose()
+
+
+@benchmark
+async def template_render_fast_path(hass: core.HomeAssistant) -> float:
+    """Render simple templates with the fast path and with Jinja."""
+    template_strings = (
+        "{{ states('sensor.temperature') | float * 2 }}",
+        "{{ is_state('light.kitchen', 'on') and is_state('light.hall', 'on') }}",
+        "{{ state_attr('light.kitchen', 'brightness') | int(0) > 100 }}",
+        "{{ states.sensor.temperature.state | float(0) + 1.5 }}",
+    )
+    renders = 10**5
+    hass.states.async_set("sensor.temperature", "21.5")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 128})
+    hass.states.async_set("light.hall", "off")
+
+    def _render(fast_path: bool) -> float:
+        templates = [
+            template.Template(template_string, hass)
+            for template_string in template_strings
+        ]
+        for tpl in templates:
+            tpl.async_render()
+            if not fast_path:
+                tpl._fast_path = None  # noqa: SLF001
+        start = timer()
+        for _ in range(renders):
+            for tpl in templates:
+                tpl.async_render()
+        return timer() - start
+
+    fast_path = _render(True)
+    jinja = _render(False)
+    print(
+        f"Rendered {len(template_strings)} templates {renders} times: "
+        f"{fast_path:.3f}s with the fast path, {jinja:.3f}s with Jinja"
+    )
+    return fast_path
+
+
+@benchmark
+async def subscribe_entities_clients(hass: core.HomeAssistant) -> float:
+    """Send state diffs of 100 entities to 50 subscribed connections."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.commands import (
+        _forward_entity_changes,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.entity_diffs import (
+        async_subscribe_entity_diffs,
+    )
+
+    clients = 50
+    entity_ids = [f"sensor.power_{idx}" for idx in range(100)]
+    rounds = 100
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0")
+
+    def _fire_rounds() -> None:
+        for value in range(1, rounds + 1):
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(value))
+            hass.timer_wheel.async_fire_due(hass.loop.time(), fire_all=True)
+
+    sent: list[object] = []
+    unsubs = [
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_entity_changes,
+                sent.append,
+                set(entity_ids),
+                None,
+                user,
+                str(message_id).encode(),
+            ),
+        )
+        for message_id in range(clients)
+    ]
+    start = timer()
+    _fire_rounds()
+    per_connection = timer() - start
+    per_connection_messages = len(sent)
+    for unsub in unsubs:
+        unsub()
+
+    sent.clear()
+    unsubs = [
+        async_subscribe_entity_diffs(
+            hass, user, set(entity_ids), None, sent.append, str(message_id).encode()
+        )
+        for message_id in range(clients)
+    ]
+    start = timer()
+    _fire_rounds()
+    shared = timer() - start
+    for unsub in unsubs:
+        unsub()
+
+    print(
+        f"{clients} connections, {rounds} rounds of {len(entity_ids)} changes: "
+        f"{per_connection:.3f}s and {per_connection_messages} messages per "
+        f"connection, {shared:.3f}s and {len(sent)} messages shared and batched"
+    )
+    return shared
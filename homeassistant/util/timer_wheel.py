@@ -0,0 +1,238 @@
+"""Hierarchical timing wheel for the timers of the event loop.
+
+Every timer scheduled with loop.call_at adds a handle to the heap of the
+event loop. The timer wheel puts timers into slots instead, which each
+have a single handle. The slots of the lowest level are ticks, all the
+timers of a tick fire together when it ends. The slots of the higher
+levels cover a longer time, their timers are moved to the lower levels
+when the slot starts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from itertools import count
+import math
+from typing import Any
+
+from .async_ import get_scheduled_timer_handles
+
+# The length of a tick, timers fire at most this much later than requested
+TICK = 0.05
+# The number of slots of a level which make up one slot of the next level
+SLOTS_PER_LEVEL = 64
+LEVELS = 4
+
+_SLOT_LENGTHS = tuple(TICK * SLOTS_PER_LEVEL**level for level in range(LEVELS))
+
+
+@dataclass(slots=True, frozen=True)
+class TimerWheelStats:
+    """Statistics of a timer wheel."""
+
+    timers: int
+    handles: int
+    scheduled: int
+    fired: int
+    ticks: int
+    cascaded: int
+
+
+@dataclass(slots=True)
+class TimerWheelSlot:
+    """A slot of a level of a timer wheel."""
+
+    level: int
+    index: int
+    handle: asyncio.TimerHandle | None = field(default=None, repr=False)
+    timers: set[TimerWheelHandle] = field(default_factory=set)
+
+
+class TimerWheelHandle:
+    """A timer scheduled on a timer wheel."""
+
+    __slots__ = ("_active", "_args", "_callback", "_seq", "_slot", "_wheel", "when")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+        seq: int,
+    ) -> None:
+        """Initialize the timer."""
+        self._wheel = wheel
+        self.when = when
+        self._callback = callback
+        self._args = args
+        self._seq = seq
+        self._slot: TimerWheelSlot | None = None
+        self._active = True
+
+    def __repr__(self) -> str:
+        """Return the representation of the callback, like asyncio does."""
+        args = ", ".join(repr(arg) for arg in self._args)
+        return f"{self._callback!r}({args})"
+
+    def cancel(self) -> None:
+        """Cancel the timer, does nothing if it fired already."""
+        self._wheel._async_cancel(self)  # noqa: SLF001
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled or fired."""
+        return not self._active
+
+
+def _timer_order(timer: TimerWheelHandle) -> tuple[float, int]:
+    """Return the order timers fire in."""
+    return (timer.when, timer._seq)  # noqa: SLF001
+
+
+class TimerWheel:
+    """Schedule callbacks in the slots of a hierarchical timing wheel."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._levels: list[dict[int, TimerWheelSlot]] = [{} for _ in range(LEVELS)]
+        self._seq = count()
+        self._timers = 0
+        self._scheduled = 0
+        self._fired = 0
+        self._ticks = 0
+        self._cascaded = 0
+
+    def async_call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Call a callback at or up to a tick after a time of the event loop."""
+        timer = TimerWheelHandle(self, when, callback, args, next(self._seq))
+        self._timers += 1
+        self._scheduled += 1
+        self._add(timer, when - self._loop.time())
+        return timer
+
+    def async_call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Call a callback after a delay of up to a tick longer."""
+        return self.async_call_at(self._loop.time() + delay, callback, *args)
+
+    def async_fire_due(self, loop_time: float, fire_all: bool = False) -> None:
+        """Fire the timers due at a time of the event loop, or all of them.
+
+        The timers fire right away instead of when their slot ends. This is
+        used by tests which pretend the time has moved on.
+        """
+        due = [
+            timer
+            for slots in self._levels
+            for slot in slots.values()
+            for timer in slot.timers
+            if fire_all or timer.when <= loop_time
+        ]
+        for timer in due:
+            self._remove(timer)
+        self._fire(due)
+
+    def async_stats(self) -> TimerWheelStats:
+        """Return the statistics of the timer wheel."""
+        return TimerWheelStats(
+            timers=self._timers,
+            handles=sum(len(slots) for slots in self._levels),
+            scheduled=self._scheduled,
+            fired=self._fired,
+            ticks=self._ticks,
+            cascaded=self._cascaded,
+        )
+
+    def _add(self, timer: TimerWheelHandle, delay: float) -> None:
+        """Add a timer to the slot of the level matching its delay.
+
+        A tick ends at or after the timers it holds; a slot of a higher
+        level starts before them and at least a slot length from now.
+        """
+        level = 0
+        while level < LEVELS - 1 and delay >= _SLOT_LENGTHS[level + 1]:
+            level += 1
+        length = _SLOT_LENGTHS[level]
+        if level:
+            index = math.floor(timer.when / length)
+        else:
+            index = math.ceil(timer.when / length)
+        slots = self._levels[level]
+        if (slot := slots.get(index)) is None:
+            slot = slots[index] = TimerWheelSlot(level, index)
+            slot.handle = self._loop.call_at(index * length, self._async_run_slot, slot)
+        slot.timers.add(timer)
+        timer._slot = slot  # noqa: SLF001
+
+    def _remove(self, timer: TimerWheelHandle) -> None:
+        """Remove a timer from its slot, the last one cancels the slot."""
+        if (slot := timer._slot) is None:  # noqa: SLF001
+            return
+        timer._slot = None  # noqa: SLF001
+        slot.timers.discard(timer)
+        if slot.timers or self._levels[slot.level].get(slot.index) is not slot:
+            return
+        del self._levels[slot.level][slot.index]
+        if slot.handle is not None:
+            slot.handle.cancel()
+
+    def _async_cancel(self, timer: TimerWheelHandle) -> None:
+        """Cancel a timer."""
+        if not timer._active:  # noqa: SLF001
+            return
+        timer._active = False  # noqa: SLF001
+        self._timers -= 1
+        self._remove(timer)
+
+    def _async_run_slot(self, slot: TimerWheelSlot) -> None:
+        """Fire the timers of a tick or move the timers of a slot down."""
+        if self._levels[slot.level].get(slot.index) is not slot:
+            return
+        del self._levels[slot.level][slot.index]
+        if not slot.level:
+            self._ticks += 1
+            self._fire(slot.timers)
+            return
+        self._cascaded += len(slot.timers)
+        now = self._loop.time()
+        for timer in slot.timers:
+            self._add(timer, timer.when - now)
+
+    def _fire(self, timers: Iterable[TimerWheelHandle]) -> None:
+        """Fire timers in the order they are due."""
+        for timer in sorted(timers, key=_timer_order):
+            # A timer fired before may have cancelled this one
+            if not timer._active:  # noqa: SLF001
+                continue
+            timer._active = False  # noqa: SLF001
+            timer._slot = None  # noqa: SLF001
+            self._timers -= 1
+            self._fired += 1
+            try:
+                timer._callback(*timer._args)  # noqa: SLF001
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:  # noqa: BLE001
+                self._loop.call_exception_handler(
+                    {"message": f"Exception in callback {timer!r}", "exception": exc}
+                )
+
+
+def get_scheduled_timers(
+    loop: asyncio.AbstractEventLoop,
+) -> list[asyncio.TimerHandle | TimerWheelHandle]:
+    """Return the scheduled TimerHandles, with timer wheel slots expanded."""
+    timers: list[asyncio.TimerHandle | TimerWheelHandle] = []
+    for handle in get_scheduled_timer_handles(loop):
+        args = handle._args  # noqa: SLF001
+        if not args or not isinstance(slot := args[0], TimerWheelSlot):
+            timers.append(handle)
+        elif not handle.cancelled():
+            timers.extend(slot.timers)
+    return timers
@@ -108,6 +108,7 @@ from homeassistant.util.json import (
     json_loads_object,
 )
 from homeassistant.util.signal_type import SignalType
+from homeassistant.util.timer_wheel import TimerWheelSlot
 from homeassistant.util.unit_system import METRIC_SYSTEM
 from homeassistant.util.yaml import load_yaml_dict, loader as yaml_loader
 
@@ -518,29 +519,39 @@ def _async_fire_time_changed(
     hass: HomeAssistant, utc_datetime: datetime | None, fire_all: bool
 ) -> None:
     timestamp = utc_datetime.timestamp()
-    for task in list(get_scheduled_timer_handles(hass.loop)):
-        if not isinstance(task, asyncio.TimerHandle):
-            continue
-        if task.cancelled():
-            continue
-
-        mock_seconds_into_future = timestamp - time.time()
-        future_seconds = task.when() - (hass.loop.time() + _MONOTONIC_RESOLUTION)
-
-        if fire_all or mock_seconds_into_future >= future_seconds:
-            with (
-                patch(
-                    "homeassistant.helpers.event.time_tracker_utcnow",
-                    return_value=utc_datetime,
-                ),
-                patch(
-                    "homeassistant.helpers.event.time_tracker_timestamp",
-                    return_value=timestamp,
-                ),
-            ):
+    with (
+        patch(
+            "homeassistant.helpers.event.time_tracker_utcnow",
+            return_value=utc_datetime,
+        ),
+        patch(
+            "homeassistant.helpers.event.time_tracker_timestamp",
+            return_value=timestamp,
+        ),
+    ):
+        for task in list(get_scheduled_timer_handles(hass.loop)):
+            if not isinstance(task, asyncio.TimerHandle):
+                continue
+            if task.cancelled():
+                continue
+            # The timers of the timer wheel are fired below, only those due
+            # now and not the ones they schedule
+            if task._args and isinstance(task._args[0], TimerWheelSlot):
+                continue
+
+            mock_seconds_into_future = timestamp - time.time()
+            future_seconds = task.when() - (hass.loop.time() + _MONOTONIC_RESOLUTION)
+
+            if fire_all or mock_seconds_into_future >= future_seconds:
                 task._run()
                 task.cancel()
 
+        # Timers of the timer wheel fire when due instead of when their tick ends
+        hass.timer_wheel.async_fire_due(
+            hass.loop.time() + _MONOTONIC_RESOLUTION + timestamp - time.time(),
+            fire_all,
+        )
+
 
 fire_time_changed = threadsafe_callback_factory(async_fire_time_changed)
 
@@ -1,13 +1,16 @@
 """Test the Energy websocket API."""
 
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.energy import data, is_configured
-from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    statistics_during_period,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -1159,3 +1162,152 @@ async def test_fossil_energy_consumption_check_missing_hour(
         hour3.isoformat(),
         hour4.isoformat(),
     ]
+
+
+@pytest.mark.freeze_time("2021-11-02 00:00:00+00:00")
+async def test_dashboard_data(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fetching the energy dashboard statistics and caching them."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-30 23:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    period4 = dt_util.as_utc(dt_util.parse_datetime("2021-10-31 23:00:00"))
+    end = dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00"))
+
+    energy_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        energy_metadata,
+        (
+            {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+            {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+            {"start": period3, "last_reset": None, "state": 2, "sum": 4},
+            {"start": period4, "last_reset": None, "state": 3, "sum": 5},
+        ),
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Fossil percentage",
+            "source": "test",
+            "statistic_id": "test:fossil_percentage",
+            "unit_of_measurement": "%",
+        },
+        (
+            {"start": period1, "last_reset": None, "mean": 10},
+            {"start": period2, "last_reset": None, "mean": 30},
+            {"start": period3, "last_reset": None, "mean": 60},
+            {"start": period4, "last_reset": None, "mean": 90},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "energy/save_prefs",
+            "energy_sources": [
+                {
+                    "type": "grid",
+                    "flow_from": [
+                        {
+                            "stat_energy_from": "test:total_energy_import",
+                            "stat_cost": None,
+                            "entity_energy_price": None,
+                            "number_energy_price": None,
+                        }
+                    ],
+                    "flow_to": [],
+                    "cost_adjustment_day": 0,
+                },
+                {"type": "solar", "stat_energy_from": "test:solar_production"},
+            ],
+        }
+    )
+    assert (await client.receive_json())["success"]
+
+    request = {
+        "type": "energy/dashboard_data",
+        "start_time": period1.isoformat(),
+        "end_time": end.isoformat(),
+        "period": "month",
+        "co2_statistic_id": "test:fossil_percentage",
+    }
+    expected = {
+        "statistics": {
+            "test:total_energy_import": [
+                {
+                    "start": int(period1.timestamp() * 1000),
+                    "end": int(period3.timestamp() * 1000),
+                    "change": 3.0,
+                },
+                {
+                    "start": int(period3.timestamp() * 1000),
+                    "end": int(end.timestamp() * 1000),
+                    "change": 2.0,
+                },
+            ]
+        },
+        "fossil_energy_consumption": {
+            period1.isoformat(): pytest.approx(2 * 0.1 + 1 * 0.3),
+            period3.isoformat(): pytest.approx(1 * 0.6 + 1 * 0.9),
+        },
+    }
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == expected
+
+    # Completed periods are served from the cache
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period",
+        wraps=statistics_during_period,
+    ) as statistics_during_period_mock:
+        await client.send_json_auto_id(request)
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == expected
+    assert statistics_during_period_mock.call_count == 0
+
+    # Importing statistics clears the cache
+    async_add_external_statistics(
+        hass,
+        energy_metadata,
+        ({"start": period4, "last_reset": None, "state": 3, "sum": 7},),
+    )
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    # The statistics of all queries are fetched in one executor job
+    with patch.object(
+        instance,
+        "async_add_read_executor_job",
+        wraps=instance.async_add_read_executor_job,
+    ) as executor_job_mock:
+        await client.send_json_auto_id(request)
+        response = await client.receive_json()
+    assert executor_job_mock.call_count == 1
+    assert response["success"]
+    assert response["result"]["statistics"]["test:total_energy_import"][1] == {
+        "start": int(period3.timestamp() * 1000),
+        "end": int(end.timestamp() * 1000),
+        "change": 4.0,
+    }
+    assert response["result"]["fossil_energy_consumption"] == {
+        period1.isoformat(): pytest.approx(2 * 0.1 + 1 * 0.3),
+        period3.isoformat(): pytest.approx(1 * 0.6 + 3 * 0.9),
+    }
@@ -173,6 +173,57 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states with max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    with freeze_time(now) as freezer:
+        for state in ("5", "1", "3", "9", "2", "4"):
+            freezer.tick(timedelta(seconds=1))
+            hass.states.async_set("sensor.power", state)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.power"],
+            "include_start_time_state": False,
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.power"]] == [
+        "5",
+        "1",
+        "9",
+        "4",
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -744,6 +795,48 @@ async def test_history_stream_significant_domain_historical_only(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_stream_historical_only_in_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the stream sends a long period in daily chunks, oldest first."""
+    now = dt_util.utcnow()
+    three_days_ago = now - timedelta(days=3, hours=12)
+
+    await async_setup_component(hass, "history", {})
+    with freeze_time(three_days_ago):
+        hass.states.async_set("sensor.test", "1")
+    with freeze_time(now - timedelta(hours=1)):
+        hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "start_time": (now - timedelta(days=4)).isoformat(),
+            "end_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "include_start_time_state": False,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    async with asyncio.timeout(3):
+        response = await client.receive_json()
+    assert response["success"]
+
+    async with asyncio.timeout(3):
+        response = await client.receive_json()
+    assert [state["s"] for state in response["event"]["states"]["sensor.test"]] == ["1"]
+    assert response["event"]["end_time"] == three_days_ago.timestamp()
+
+    async with asyncio.timeout(3):
+        response = await client.receive_json()
+    assert [state["s"] for state in response["event"]["states"]["sensor.test"]] == ["2"]
+
+
 async def test_history_stream_bad_start_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
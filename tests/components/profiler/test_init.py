@@ -312,6 +312,7 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
     assert "_dummy_test_lru_stats" in caplog.text
     assert "CacheInfo" in caplog.text
     assert "sqlalchemy_test" in caplog.text
+    assert "Cache stats for compiled templates" in caplog.text
 
 
 async def test_log_object_sources(
@@ -443,6 +443,45 @@ async def test_get_significant_states(hass: HomeAssistant) -> None:
     assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+async def test_get_significant_states_max_points(hass: HomeAssistant) -> None:
+    """Test the states are downsampled to the first, lowest, highest and last."""
+    entity_id = "sensor.power"
+    start = dt_util.utcnow() - timedelta(minutes=10)
+
+    with freeze_time(start) as freezer:
+        for state in ("5", "1", "3", "9", "2", "4", "unavailable"):
+            freezer.tick(timedelta(seconds=1))
+            hass.states.async_set(entity_id, state)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        start,
+        start + timedelta(hours=1),
+        entity_ids=[entity_id],
+        include_start_time_state=False,
+        significant_changes_only=False,
+        max_points=8,
+    )
+    assert [state.state for state in hist[entity_id]] == [
+        "5",
+        "1",
+        "9",
+        "4",
+        "unavailable",
+    ]
+
+    hist = history.get_significant_states(
+        hass,
+        start,
+        start + timedelta(hours=1),
+        entity_ids=[entity_id],
+        include_start_time_state=False,
+        significant_changes_only=False,
+    )
+    assert len(hist[entity_id]) == 7
+
+
 async def test_get_significant_states_minimal_response(
     hass: HomeAssistant,
 ) -> None:
@@ -13,7 +13,9 @@ from unittest.mock import Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm.session import Session
 from sqlalchemy.pool import QueuePool
 
 from homeassistant.components import recorder
@@ -34,6 +36,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -71,7 +74,15 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     MATCH_ALL,
 )
-from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    Context,
+    CoreState,
+    Event,
+    HomeAssistant,
+    State,
+    StateWrite,
+    callback,
+)
 from homeassistant.helpers import (
     entity_registry as er,
     issue_registry as ir,
@@ -395,20 +406,20 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    states_manager = get_instance(hass).states_manager
+    insert_pending = states_manager.insert_pending
+    failed = False
+
+    def _fail_first_insert(session: Session) -> None:
+        nonlocal failed
+        if not failed:
+            failed = True
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        insert_pending(session)
 
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
-        ),
+        patch.object(states_manager, "insert_pending", side_effect=_fail_first_insert),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
@@ -416,6 +427,10 @@ async def test_saving_state_with_exception(
     assert "Error executing query" in caplog.text
     assert "Error saving events" not in caplog.text
 
+    # The state is saved by the retry
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).filter(States.state == "fail").count() == 1
+
     caplog.clear()
     hass.states.async_set(entity_id, state, attributes)
     await async_wait_recording_done(hass)
@@ -428,6 +443,47 @@ async def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+async def test_saving_events_with_exception_after_states_inserted(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    setup_recorder: None,
+) -> None:
+    """Test states inserted before a failed statement are committed once."""
+    instance = get_instance(hass)
+    insert_pending_events = instance._insert_pending_events
+    failed = False
+
+    def _fail_first_insert(session: Session) -> None:
+        nonlocal failed
+        if not failed:
+            failed = True
+            raise OperationalError("insert the event", "fake params", "forced to fail")
+        insert_pending_events(session)
+
+    with (
+        patch("time.sleep"),
+        patch.object(
+            instance, "_insert_pending_events", side_effect=_fail_first_insert
+        ),
+    ):
+        hass.states.async_set("test.recorder", "on", {})
+        hass.bus.async_fire("custom_event", {"some": "data"})
+        await async_wait_recording_done(hass)
+
+    assert failed
+    assert "Error executing query" in caplog.text
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).filter(States.state == "on").count() == 1
+        assert (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "custom_event")
+            .count()
+            == 1
+        )
+
+
 async def test_saving_state_with_sqlalchemy_exception(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -471,6 +527,41 @@ async def test_saving_state_with_sqlalchemy_exception(
     assert "SQLAlchemyError error processing task" not in caplog.text
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 0}])
+async def test_saving_state_batch_with_sqlalchemy_exception(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    setup_recorder: None,
+) -> None:
+    """Test an SQLAlchemyError only drops the state of a batch it happened for."""
+    instance = get_instance(hass)
+    process_state_changed_event = instance._process_state_changed_event_into_session
+
+    def _fail_for_one_state(event: Event) -> None:
+        if event.data["entity_id"] == "test.fail":
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        process_state_changed_event(event)
+
+    with patch.object(
+        instance,
+        "_process_state_changed_event_into_session",
+        side_effect=_fail_for_one_state,
+    ):
+        hass.states.async_set_many(
+            [
+                StateWrite("test.first", "first"),
+                StateWrite("test.fail", "fail"),
+                StateWrite("test.last", "last"),
+            ]
+        )
+        await async_wait_recording_done(hass)
+
+    assert "SQLAlchemyError error processing task" in caplog.text
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert {state.state for state in session.query(States)} == {"first", "last"}
+
+
 async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -1474,6 +1565,66 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_saving_sets_old_state_chain(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk_insert_states: bool,
+) -> None:
+    """Test old states are linked when an entity changes often in one commit."""
+    instance = await async_setup_recorder_instance(hass)
+    instance._bulk_insert_states = bulk_insert_states
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.one", "s2", {"attr": 2})
+    hass.states.async_set("test.two", "s3", {})
+    hass.states.async_set("test.one", "s4", {"attr": 1})
+    hass.states.async_remove("test.one")
+    hass.bus.async_fire("custom_event", {"some": "data"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 5
+        states_by_state = {state.state: state for state in states}
+        assert {state.entity_id for state in states} == {"test.one", "test.two"}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state[None].old_state_id == states_by_state["s4"].state_id
+        attributes_id = states_by_state["s1"].attributes_id
+        assert states_by_state["s4"].attributes_id == attributes_id
+        assert states_by_state["s2"].attributes_id != attributes_id
+
+        events = list(
+            session.query(Events.event_id, EventTypes.event_type, EventData.shared_data)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .filter(EventTypes.event_type == "custom_event")
+        )
+        assert len(events) == 1
+        assert events[0].shared_data == '{"some":"data"}'
+
+    # The next commit links to the states inserted in bulk before
+    hass.states.async_set("test.two", "s5", {})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        old_state_id = (
+            session.query(States.old_state_id).filter(States.state == "s5").scalar()
+        )
+        assert old_state_id == states_by_state["s3"].state_id
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -1684,6 +1835,31 @@ class CannotSerializeMe:
     """A class that the JSONEncoder cannot serialize."""
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_executor_job(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test read only queries run concurrently on read only connections.
+
+    This test is specific for SQLite.
+    """
+    barrier = threading.Barrier(2, timeout=10)
+
+    def _query() -> tuple[str, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            query_only = session.execute(text("PRAGMA query_only")).scalar()
+        # Both jobs must be running at the same time to pass the barrier
+        barrier.wait()
+        return threading.current_thread().name, query_only
+
+    results = await asyncio.gather(
+        recorder_mock.async_add_read_executor_job(_query),
+        recorder_mock.async_add_read_executor_job(_query),
+    )
+    assert [name.startswith(DB_READER_PREFIX) for name, _ in results] == [True, True]
+    assert [query_only for _, query_only in results] == [1, 1]
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 @pytest.mark.parametrize("persistent_database", [True])
@@ -2368,7 +2544,10 @@ async def test_connect_args_priority(hass: HomeAssistant, config_url) -> None:
 
     with (
         patch("sqlalchemy.engine.url.URL._get_entrypoint", MockEntrypoint),
-        patch("sqlalchemy.engine.create.util.get_cls_kwargs", return_value=["echo"]),
+        patch(
+            "sqlalchemy.engine.create.util.get_cls_kwargs",
+            return_value=["echo", "pool_size"],
+        ),
     ):
         await async_setup_component(
             hass,
@@ -0,0 +1,40 @@
+"""Test partitioning the states table."""
+
+from datetime import datetime
+
+from homeassistant.components.recorder.partitions import (
+    create_partition_sql,
+    month_partitions,
+)
+from homeassistant.util import dt as dt_util
+
+
+def test_month_partitions() -> None:
+    """Test the monthly partitions cover the range across a year boundary."""
+    partitions = month_partitions(
+        "states",
+        datetime(2024, 11, 15, 12, tzinfo=dt_util.UTC),
+        datetime(2025, 1, 3, tzinfo=dt_util.UTC),
+    )
+    assert [partition.name for partition in partitions] == [
+        "states_p202411",
+        "states_p202412",
+        "states_p202501",
+    ]
+    assert partitions[0].start == datetime(2024, 11, 1, tzinfo=dt_util.UTC)
+    assert partitions[1].end == datetime(2025, 1, 1, tzinfo=dt_util.UTC)
+    assert partitions[1].end == partitions[2].start
+    assert partitions[2].end == datetime(2025, 2, 1, tzinfo=dt_util.UTC)
+
+
+def test_create_partition_sql() -> None:
+    """Test the partition bounds are the month timestamps."""
+    (partition,) = month_partitions(
+        "states",
+        datetime(2025, 1, 1, tzinfo=dt_util.UTC),
+        datetime(2025, 1, 31, tzinfo=dt_util.UTC),
+    )
+    assert create_partition_sql("states", partition) == (
+        "CREATE TABLE IF NOT EXISTS states_p202501 PARTITION OF states "
+        "FOR VALUES FROM (1735689600.0) TO (1738368000.0)"
+    )
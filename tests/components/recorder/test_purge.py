@@ -13,7 +13,10 @@ from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
 from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
-from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.const import (
+    EVENT_RECORDER_PURGE_PROGRESS,
+    SupportedDialect,
+)
 from homeassistant.components.recorder.db_schema import (
     Events,
     EventTypes,
@@ -25,7 +28,12 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    MIN_PURGE_BATCH_SIZE,
+    PURGE_TARGET_BATCH_LATENCY,
+    PurgeScheduler,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -45,6 +53,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_capture_events
 from tests.typing import RecorderInstanceContextManager
 
 TEST_EVENT_TYPES = (
@@ -313,6 +322,66 @@ async def test_purge_old_states_encounters_operational_error(
     assert "Error executing purge" in caplog.text
 
 
+async def test_purge_old_states_reports_progress(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging old states in range batches reports the progress."""
+    progress_events = async_capture_events(hass, EVENT_RECORDER_PURGE_PROGRESS)
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with patch.object(recorder_mock, "max_bind_vars", 3):
+        while not purge_old_data(recorder_mock, purge_before, repack=False):
+            pass
+    await hass.async_block_till_done()
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 2
+        state_map_by_state = {state.state: state for state in states}
+        dontpurgeme_5 = state_map_by_state["dontpurgeme_5"]
+        dontpurgeme_4 = state_map_by_state["dontpurgeme_4"]
+        assert dontpurgeme_5.old_state_id == dontpurgeme_4.state_id
+        assert dontpurgeme_4.old_state_id is None
+
+    assert len(progress_events) == 1
+    assert progress_events[0].data == {
+        "finished": True,
+        "slices": 1,
+        "states_purged": 4,
+        "events_purged": 0,
+        "batch_size": 3,
+    }
+
+
+def test_purge_scheduler_adapts_batch_size() -> None:
+    """Test the purge batch size follows the delete latency."""
+    scheduler = PurgeScheduler()
+    scheduler.start_slice()
+    assert scheduler.batch_size(1000) == 1000
+
+    scheduler.record_batch(PURGE_TARGET_BATCH_LATENCY * 2)
+    assert scheduler.batch_size(1000) == 500
+    scheduler.record_batch(PURGE_TARGET_BATCH_LATENCY)
+    assert scheduler.batch_size(1000) == 500
+    scheduler.record_batch(0)
+    assert scheduler.batch_size(1000) == 750
+    scheduler.record_batch(0)
+    assert scheduler.batch_size(1000) == 1000
+
+    for _ in range(10):
+        scheduler.record_batch(PURGE_TARGET_BATCH_LATENCY * 2)
+    assert scheduler.batch_size(1000) == MIN_PURGE_BATCH_SIZE
+    assert not scheduler.budget_exhausted
+
+    with patch(
+        "homeassistant.components.recorder.purge.PURGE_SLICE_TIME_BUDGET", 0
+    ):
+        scheduler.start_slice()
+    scheduler.record_batch(0)
+    assert scheduler.budget_exhausted
+
+
 async def test_purge_old_events(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old events."""
     await _add_test_events(hass)
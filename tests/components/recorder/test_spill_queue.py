@@ -0,0 +1,137 @@
+"""Test the recorder spill queue."""
+
+from pathlib import Path
+
+from homeassistant.components.recorder.spill_queue import SpillQueue
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, State
+from homeassistant.helpers.json import json_bytes
+
+
+def _event(index: int) -> Event:
+    """Return a state changed event for the spill queue."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": "sensor.test",
+            "old_state": None,
+            "new_state": State("sensor.test", str(index), {"unit": "W"}),
+        },
+        time_fired_timestamp=1700000000.0 + index,
+        context=Context(user_id="abc"),
+    )
+
+
+def _as_bytes(event: Event) -> bytes:
+    """Return the event as comparable JSON."""
+    return json_bytes(
+        {
+            "event": event.as_dict(),
+            "context": [event.context.user_id, event.context.parent_id],
+        }
+    )
+
+
+def test_spill_queue_round_trip(tmp_path: Path) -> None:
+    """Test events are read back in order across segments."""
+    spill_queue = SpillQueue(str(tmp_path / "spill"), segment_size=1024)
+    assert spill_queue.put(_event(0)) is False
+    assert spill_queue.activate() is False
+    assert spill_queue.load() is False
+    assert spill_queue.activate() is True
+
+    events = [_event(index) for index in range(20)]
+    for event in events:
+        assert spill_queue.put(event) is True
+    assert spill_queue.pending == 20
+    assert spill_queue.size_bytes > 0
+    assert spill_queue.deactivate_if_empty() is False
+
+    read: list[Event] = []
+    while len(read) < 20:
+        read.extend(spill_queue.get_many(7, 1))
+    assert [_as_bytes(event) for event in read] == [
+        _as_bytes(event) for event in events
+    ]
+    assert isinstance(read[0].data["new_state"], State)
+    assert spill_queue.pending == 0
+    assert spill_queue.size_bytes == 0
+    assert spill_queue.deactivate_if_empty() is True
+    assert spill_queue.put(_event(21)) is False
+
+    spill_queue.close()
+    assert list((tmp_path / "spill").iterdir()) == []
+
+
+def test_spill_queue_recovers_unread_events(tmp_path: Path) -> None:
+    """Test events left on disk are recovered once by the next run."""
+    directory = str(tmp_path / "spill")
+    spill_queue = SpillQueue(directory, segment_size=1024)
+    spill_queue.load()
+    spill_queue.activate()
+    events = [_event(index) for index in range(10)]
+    for event in events:
+        spill_queue.put(event)
+    read: list[Event] = []
+    while len(read) < 4:
+        read.extend(spill_queue.get_many(4 - len(read), 1))
+    spill_queue.close()
+
+    spill_queue = SpillQueue(directory, segment_size=1024)
+    assert spill_queue.load() is True
+    assert spill_queue.active is True
+    assert spill_queue.pending == 6
+    recovered = spill_queue.get_many(100, 0)
+    assert [_as_bytes(event) for event in recovered] == [
+        _as_bytes(event) for event in events[4:]
+    ]
+    assert spill_queue.deactivate_if_empty() is True
+    spill_queue.close()
+
+
+def test_spill_queue_spills_after_recovered_events(tmp_path: Path) -> None:
+    """Test events spilled after a restart are recorded after the recovered ones."""
+    directory = str(tmp_path / "spill")
+    spill_queue = SpillQueue(directory, segment_size=1024)
+    spill_queue.load()
+    spill_queue.activate()
+    events = [_event(index) for index in range(10)]
+    for event in events[:5]:
+        spill_queue.put(event)
+    spill_queue.close()
+
+    spill_queue = SpillQueue(directory, segment_size=1024)
+    assert spill_queue.load() is True
+    for event in events[5:]:
+        assert spill_queue.put(event) is True
+    assert spill_queue.pending == 10
+
+    read: list[Event] = []
+    while len(read) < 10:
+        read.extend(spill_queue.get_many(10 - len(read), 1))
+    assert [_as_bytes(event) for event in read] == [
+        _as_bytes(event) for event in events
+    ]
+    assert spill_queue.deactivate_if_empty() is True
+    spill_queue.close()
+    assert list((tmp_path / "spill").iterdir()) == []
+
+
+def test_spill_queue_close_keeps_queued_events(tmp_path: Path) -> None:
+    """Test events queued for the writer are kept on disk when closing."""
+    directory = str(tmp_path / "spill")
+    spill_queue = SpillQueue(directory, segment_size=1024)
+    spill_queue.load()
+    spill_queue.activate()
+    events = [_event(index) for index in range(20)]
+    for event in events:
+        spill_queue.put(event)
+    spill_queue.close()
+
+    spill_queue = SpillQueue(directory, segment_size=1024)
+    assert spill_queue.load() is True
+    assert spill_queue.pending == 20
+    assert [_as_bytes(event) for event in spill_queue.get_many(100, 0)] == [
+        _as_bytes(event) for event in events
+    ]
+    spill_queue.close()
@@ -9,7 +9,10 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDay,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1293,6 +1296,97 @@ async def test_daily_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test days, weeks and months are read from the rollups."""
+    instance = recorder.get_instance(hass)
+    await async_wait_recording_done(hass)
+    assert instance.statistics_rollups_time_zone == dt_util.get_default_time_zone()
+
+    zero = dt_util.utcnow()
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    external_statistics = [
+        {
+            "start": period1 + timedelta(hours=hour),
+            "last_reset": None,
+            "max": hour + 10,
+            "mean": hour + 5,
+            "min": hour,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(0, 24 * 40, 7)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _statistics_per_period() -> dict[str, list[dict[str, Any]]]:
+        return {
+            period: statistics_during_period(
+                hass, zero, statistic_ids={"test:total_energy_import"}, period=period
+            )["test:total_energy_import"]
+            for period in ("day", "week", "month")
+        }
+
+    def _assert_statistics_equal(
+        stats: dict[str, list[dict[str, Any]]],
+        expected_stats: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        for period, rows in stats.items():
+            for row, expected_row in zip(rows, expected_stats[period], strict=True):
+                assert row == pytest.approx(expected_row)
+
+    # Reduce the hourly statistics without the rollups
+    with patch.object(instance, "statistics_rollups_time_zone", None):
+        expected_stats = _statistics_per_period()
+    with patch.object(statistics, "_reduce_statistics", side_effect=AssertionError):
+        _assert_statistics_equal(_statistics_per_period(), expected_stats)
+
+    # A rollup which does not match the hourly statistics is repaired
+    with session_scope(hass=hass) as session:
+        rollup = (
+            session.query(StatisticsDay).order_by(StatisticsDay.start_ts.desc()).first()
+        )
+        rollup.sum = -1
+    assert await instance.async_add_executor_job(
+        statistics.check_statistics_rollups, instance
+    )
+    assert "Repaired 1 statistics rollups" in caplog.text
+    _assert_statistics_equal(_statistics_per_period(), expected_stats)
+
+    # The rollups must be rebuilt when the time zone changes
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    with patch.object(instance, "statistics_rollups_time_zone", None):
+        expected_stats = _statistics_per_period()
+    assert not await instance.async_add_executor_job(
+        statistics.check_statistics_rollups, instance
+    )
+    start_ts = await instance.async_add_executor_job(
+        statistics.rebuild_statistics_rollups, instance, None
+    )
+    while start_ts is not None:
+        start_ts = await instance.async_add_executor_job(
+            statistics.rebuild_statistics_rollups, instance, start_ts
+        )
+    assert await instance.async_add_executor_job(
+        statistics.check_statistics_rollups, instance
+    )
+    instance.statistics_rollups_time_zone = dt_util.get_default_time_zone()
+    _assert_statistics_equal(_statistics_per_period(), expected_stats)
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 async def test_weekly_statistics_mean(
@@ -36,6 +36,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import STATES_BUFFER
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -306,6 +307,73 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.freeze_time("2021-09-01 05:00")
+async def test_compile_hourly_statistics_from_buffered_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test statistics are compiled from the buffered states after the first run."""
+    zero = dt_util.utcnow()
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": None,
+        "state_class": "measurement",
+        "unit_of_measurement": "%",
+    }
+    hass.states.async_set("sensor.test1", "10", attributes)
+    await async_wait_recording_done(hass)
+
+    # The first run selects the states and starts the buffer, the period
+    # before the recorder started is already marked as compiled
+    do_adhoc_statistics(hass, start=zero - timedelta(minutes=10))
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(zero + timedelta(minutes=1))
+    hass.states.async_set("sensor.test1", "20", attributes)
+    freezer.move_to(zero + timedelta(minutes=4))
+    hass.states.async_set("sensor.test1", "30", attributes)
+    hass.states.async_set("sensor.test1", "30", {**attributes, "any": "attr"})
+    freezer.move_to(zero + timedelta(minutes=6))
+    hass.states.async_set("sensor.test1", "40", attributes)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_states_mock:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    assert get_states_mock.call_count == 0
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": zero.timestamp(),
+                "end": (zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(20.0),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+
+    # Removed sensors are dropped from the buffer
+    hass.states.async_remove("sensor.test1")
+    await async_wait_recording_done(hass)
+    assert (
+        hass.data[STATES_BUFFER].get_states(
+            zero + timedelta(minutes=5), zero + timedelta(minutes=10)
+        )
+        == {}
+    )
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
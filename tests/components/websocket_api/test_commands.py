@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -17,7 +18,15 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
-from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.const import (
+    FEATURE_BATCH_ENTITY_DIFFS,
+    FEATURE_COALESCE_MESSAGES,
+    URL,
+)
+from homeassistant.components.websocket_api.entity_diffs import (
+    DATA_ENTITY_DIFF_SUBSCRIPTIONS,
+    ENTITY_DIFF_FLUSH_INTERVAL,
+)
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
@@ -27,6 +36,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +44,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1266,6 +1277,68 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_batch_entity_diffs(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test subscriptions to the same entities share batched state diffs."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hall", "off")
+    hass.states.async_set("light.other", "off")
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_BATCH_ENTITY_DIFFS: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {
+                "id": msg_id,
+                "type": "subscribe_entities",
+                "entity_ids": ["light.kitchen", "light.hall"],
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert set(msg["event"]["a"]) == {"light.kitchen", "light.hall"}
+    assert len(hass.data[DATA_ENTITY_DIFF_SUBSCRIPTIONS]) == 1
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.hall", "on")
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ENTITY_DIFF_FLUSH_INTERVAL)
+    )
+
+    for msg_id in (7, 8):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+        assert msg["event"] == {
+            "c": {
+                "light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}},
+                "light.hall": {"+": {"c": ANY, "lc": ANY, "s": "on"}},
+            }
+        }
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {"id": msg_id + 10, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+    assert not hass.data[DATA_ENTITY_DIFF_SUBSCRIPTIONS]
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
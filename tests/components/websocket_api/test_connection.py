@@ -2,7 +2,7 @@
 
 import logging
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from aiohttp.test_utils import make_mocked_request
 import pytest
@@ -132,3 +132,24 @@ async def test_binary_handler_registration() -> None:
     # Verify we reuse an unsubscribed prefix
     prefix, unsub = connection.async_register_binary_handler(None)
     assert prefix == 15
+
+
+async def test_wait_send_queue_drained() -> None:
+    """Test waiting for the send queue to drain."""
+    connection = websocket_api.ActiveConnection(
+        None, Mock(data={websocket_api.DOMAIN: None}), None, None, Mock()
+    )
+    # Without a writer there is nothing to wait for
+    await connection.async_wait_send_queue_drained()
+
+    wait_drained = AsyncMock()
+    connection = websocket_api.ActiveConnection(
+        None,
+        Mock(data={websocket_api.DOMAIN: None}),
+        None,
+        None,
+        Mock(),
+        wait_drained,
+    )
+    await connection.async_wait_send_queue_drained()
+    wait_drained.assert_awaited_once()
@@ -7,9 +7,11 @@ from homeassistant.components.websocket_api.messages import (
     _state_diff_event,
     cached_event_message,
     message_to_json_bytes,
+    state_diff_batch_messages,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -299,3 +301,48 @@ async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+async def test_state_diff_batch_messages() -> None:
+    """Test batched state diffs are merged until an entity repeats."""
+    context = Context()
+    bowl_off = State("light.bowl", "off", context=context)
+    bowl_on = State("light.bowl", "on", context=context)
+    kitchen_on = State("light.kitchen", "on", context=context)
+    events = [
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "light.bowl", "old_state": bowl_off, "new_state": bowl_on},
+        ),
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "light.kitchen", "old_state": None, "new_state": kitchen_on},
+        ),
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "light.hall", "old_state": kitchen_on, "new_state": None},
+        ),
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "light.bowl", "old_state": bowl_on, "new_state": None},
+        ),
+    ]
+
+    messages = [json_loads(msg) for msg in state_diff_batch_messages(b"5", events)]
+
+    assert messages == [
+        {
+            "id": 5,
+            "type": "event",
+            "event": {
+                "c": {
+                    "light.bowl": {
+                        "+": {"s": "on", "lc": bowl_on.last_changed_timestamp}
+                    }
+                },
+                "a": {"light.kitchen": kitchen_on.as_compressed_state},
+                "r": ["light.hall"],
+            },
+        },
+        {"id": 5, "type": "event", "event": {"r": ["light.bowl"]}},
+    ]
@@ -93,8 +93,9 @@ from homeassistant.helpers.translation import _TranslationsCacheData
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util, location as location_util
-from homeassistant.util.async_ import create_eager_task, get_scheduled_timer_handles
+from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
+from homeassistant.util.timer_wheel import get_scheduled_timers
 
 from .ignore_uncaught_exceptions import IGNORE_UNCAUGHT_EXCEPTIONS
 from .syrupy import HomeAssistantSnapshotExtension, override_syrupy_finish
@@ -390,7 +391,7 @@ def verify_cleanup(
     if tasks:
         event_loop.run_until_complete(asyncio.wait(tasks))
 
-    for handle in get_scheduled_timer_handles(event_loop):
+    for handle in get_scheduled_timers(event_loop):
         if not handle.cancelled():
             with long_repr_strings():
                 if expected_lingering_timers:
@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -2622,6 +2623,53 @@ async def test_get_hassjob_type(hass: HomeAssistant) -> None:
     assert ent_1.get_hassjob_type("update_callback") is HassJobType.Callback
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the state of many entities at once."""
+    batches = []
+
+    @callback
+    def listener(event):
+        pass
+
+    @callback
+    def batch_listener(events):
+        batches.append(events)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener, batch_listener=batch_listener)
+
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.entity_id = f"test.any{idx}"
+        ent.hass = hass
+        ent._attr_state = "on"
+        entities.append(ent)
+    entities[2]._attr_state = "x" * 256
+
+    entity.async_write_ha_states(hass, entities)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test.any0").state == "on"
+    assert hass.states.get("test.any1").state == "on"
+    # Invalid states make the batch fall back to writing one by one
+    assert hass.states.get("test.any2").state == STATE_UNKNOWN
+    assert batches == []
+
+    entities[2]._attr_state = "on"
+    for ent in entities:
+        ent._attr_extra_state_attributes = {"updated": True}
+    entity.async_write_ha_states(hass, entities)
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "test.any0",
+        "test.any1",
+        "test.any2",
+    ]
+    assert hass.states.get("test.any1").attributes == {"updated": True}
+
+
 async def test_async_write_ha_state_thread_safety(hass: HomeAssistant) -> None:
     """Test async_write_ha_state thread safety."""
     hass.config.debug = True
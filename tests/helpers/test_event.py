@@ -53,6 +53,7 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.template import Template, result_as_boolean
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
+from homeassistant.util.timer_wheel import get_scheduled_timers
 
 from tests.common import async_fire_time_changed, async_fire_time_changed_exact
 
@@ -3183,6 +3184,147 @@ async def test_async_track_template_result_multiple_templates(
     ]
 
 
+async def test_async_track_template_result_dependency_order(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates depending on another tracked template render after it."""
+    hass.states.async_set("sensor.source", "1")
+    total_runs = []
+    double_runs = []
+
+    @ha.callback
+    def total_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        total_runs.append(updates.pop().result)
+
+    @ha.callback
+    def double_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        double_runs.append(result := updates.pop().result)
+        hass.states.async_set("sensor.double", str(result))
+
+    # The total is tracked first but depends on the double
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template(
+                    "{{ states('sensor.double') }} {{ states('sensor.source') }}", hass
+                ),
+                None,
+            )
+        ],
+        total_listener,
+        entity_id="sensor.total",
+    )
+    double_info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template("{{ states('sensor.source') | int(0) * 2 }}", hass), None
+            )
+        ],
+        double_listener,
+        entity_id="sensor.double",
+    )
+    double_info.async_refresh()
+    await hass.async_block_till_done()
+    assert double_runs == [2]
+    assert total_runs == ["2 1"]
+
+    hass.states.async_set("sensor.source", "2")
+    await hass.async_block_till_done()
+    assert double_runs == [2, 4]
+    # Rendered once after the double
+    assert total_runs == ["2 1", "4 2"]
+
+    hass.states.async_set_many(
+        [ha.StateWrite("sensor.source", "3"), ha.StateWrite("sensor.source", "4")]
+    )
+    await hass.async_block_till_done()
+    # Rendered once for all state changes dispatched together
+    assert double_runs == [2, 4, 8]
+    assert total_runs == ["2 1", "4 2", "8 4"]
+
+
+async def test_async_track_template_result_dependency_loop(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates depending on each other render once per loop iteration."""
+    runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(result := updates.pop().result)
+        if result < 3:
+            hass.states.async_set("sensor.counter", str(result))
+
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template("{{ states('sensor.counter') | int(0) + 1 }}", hass), None
+            )
+        ],
+        refresh_listener,
+        entity_id="sensor.counter",
+    )
+    hass.states.async_set("sensor.counter", "0")
+    await hass.async_block_till_done()
+    assert runs == [1]
+
+    await hass.async_block_till_done()
+    assert runs == [1, 2]
+
+    await hass.async_block_till_done()
+    assert runs == [1, 2, 3]
+
+
+async def test_async_track_template_result_triggering_event(
+    hass: HomeAssistant,
+) -> None:
+    """Test the action gets the event which changed a result of the batch."""
+    hass.states.async_set("sensor.a", "1")
+    hass.states.async_set("sensor.b", "1")
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append((event and event.data["entity_id"], updates))
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(Template("{{ states('sensor.a') }}", hass), None),
+            TrackTemplate(
+                Template("{{ states('sensor.b') | int(0) > 5 }}", hass), None
+            ),
+        ],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    info.async_refresh()
+    refresh_runs.clear()
+
+    hass.states.async_set_many(
+        [ha.StateWrite("sensor.a", "2"), ha.StateWrite("sensor.b", "2")]
+    )
+    await hass.async_block_till_done()
+    assert len(refresh_runs) == 1
+    assert refresh_runs[0][0] == "sensor.a"
+    assert [update.result for update in refresh_runs[0][1]] == [2]
+
+
 async def test_async_track_template_result_multiple_templates_mixing_domain(
     hass: HomeAssistant,
 ) -> None:
@@ -3593,7 +3735,7 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     """Test tracking time interval name.
 
     This test is to ensure that when a name is passed to async_track_time_interval,
-    that the name can be found in the TimerHandle when stringified.
+    that the name can be found in the timer when stringified.
     """
     specific_runs = []
     unique_string = "xZ13"
@@ -3604,11 +3746,12 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
         timedelta(seconds=10),
         name=unique_string,
     )
-    scheduled = getattr(hass.loop, "_scheduled")
+    scheduled = get_scheduled_timers(hass.loop)
     assert any(handle for handle in scheduled if unique_string in str(handle))
     unsub()
 
-    assert all(handle for handle in scheduled if unique_string not in str(handle))
+    scheduled = get_scheduled_timers(hass.loop)
+    assert not any(handle for handle in scheduled if unique_string in str(handle))
     await hass.async_block_till_done()
 
 
@@ -3887,6 +4030,57 @@ async def test_async_track_time_change(
     assert len(none_runs) == 3
 
 
+async def test_async_track_utc_time_change_shared(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test listeners of patterns matching the same times share a timer."""
+    runs: list[str] = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+    timers = hass.timer_wheel.async_stats().timers
+
+    unsub_first = async_track_utc_time_change(
+        hass, callback(lambda x: runs.append("first")), second=[0, 30]
+    )
+    assert hass.timer_wheel.async_stats().timers == timers + 1
+    second_action = callback(lambda x: runs.append("second"))
+    unsub_second = async_track_utc_time_change(hass, second_action, second="/30")
+    assert hass.timer_wheel.async_stats().timers == timers + 1
+    unsub_second_again = async_track_utc_time_change(
+        hass, second_action, second=[0, 30]
+    )
+    unsub_local = async_track_utc_time_change(
+        hass, callback(lambda x: runs.append("local")), second="/30", local=True
+    )
+    assert hass.timer_wheel.async_stats().timers == timers + 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert sorted(runs) == ["first", "local", "second", "second"]
+
+    unsub_first()
+    unsub_first()
+    unsub_second_again()
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 30, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert sorted(runs) == ["first", "local", "local", "second", "second", "second"]
+
+    unsub_second()
+    assert hass.timer_wheel.async_stats().timers == timers + 1
+    unsub_local()
+    assert hass.timer_wheel.async_stats().timers == timers
+
+
 async def test_periodic_task_minute(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
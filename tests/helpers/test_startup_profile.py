@@ -0,0 +1,186 @@
+"""Tests for the startup profile helper."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import startup_profile
+
+
+def _mock_integration(domain: str, dependencies: set[str]) -> Mock:
+    """Return a mock integration which imports in the executor."""
+    return Mock(
+        domain=domain,
+        pkg_path=f"homeassistant.components.not_imported_{domain}",
+        import_executor=True,
+        all_dependencies_resolved=True,
+        all_dependencies=dependencies,
+        requirements=[],
+        async_get_component=AsyncMock(),
+    )
+
+
+async def test_save_startup_profile(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the import and setup times are saved."""
+    loader.async_get_import_timings(hass)["slow"] = 1.23456
+    with (
+        patch.object(
+            startup_profile, "async_get_setup_timings", return_value={"slow": 2.5}
+        ),
+        patch.object(
+            loader,
+            "async_get_unused_preloaded_platforms",
+            return_value={"slow": ["diagnostics"]},
+        ),
+        patch.object(
+            startup_profile.get_internal_store_manager(hass),
+            "async_get_load_timings",
+            return_value={"core.entity_registry": 0.123456},
+        ),
+    ):
+        await startup_profile.async_save_startup_profile(hass, 12.34567)
+
+    data = hass_storage[startup_profile.STORAGE_KEY]["data"]
+    assert data["startup_time"] == 12.346
+    assert data["import_times"]["slow"] == 1.2346
+    assert data["setup_times"] == {"slow": 2.5}
+    assert data["unused_preloaded_platforms"] == {"slow": ["diagnostics"]}
+    assert data["storage_load_times"] == {"core.entity_registry": 0.1235}
+
+
+async def test_pre_import_integrations(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations slow to import are imported, dependencies first."""
+    hass_storage[startup_profile.STORAGE_KEY] = {
+        "version": startup_profile.STORAGE_VERSION,
+        "data": {
+            "startup_time": 10.0,
+            "import_times": {"fast": 0.001, "parent": 0.1, "child": 0.5, "other": 0.2},
+            "setup_times": {},
+            "unused_preloaded_platforms": {},
+            "storage_load_times": {},
+        },
+    }
+    integrations = {
+        "child": _mock_integration("child", {"parent"}),
+        "parent": _mock_integration("parent", set()),
+        "other": _mock_integration("other", set()),
+        "fast": _mock_integration("fast", set()),
+        "unknown": _mock_integration("unknown", set()),
+    }
+    integrations["other"].import_executor = False
+
+    order: list[str] = []
+    for domain, integration in integrations.items():
+        integration.async_get_component.side_effect = (
+            lambda domain=domain: order.append(domain)
+        )
+    integrations["parent"].async_get_component.side_effect = ImportError
+
+    await startup_profile.async_pre_import_integrations(hass, integrations, set())
+
+    assert order == ["child"]
+    integrations["parent"].async_get_component.assert_awaited_once()
+    for domain in ("other", "fast", "unknown"):
+        integrations[domain].async_get_component.assert_not_called()
+
+
+async def test_pre_import_without_profile(hass: HomeAssistant) -> None:
+    """Test nothing is imported on the first start."""
+    integration = _mock_integration("slow", set())
+
+    with patch.object(
+        startup_profile, "get_pre_import_order"
+    ) as mock_get_pre_import_order:
+        await startup_profile.async_pre_import_integrations(
+            hass, {"slow": integration}, set()
+        )
+
+    mock_get_pre_import_order.assert_not_called()
+    integration.async_get_component.assert_not_called()
+
+
+def test_get_pre_import_order() -> None:
+    """Test the order integrations are imported in."""
+    profile: startup_profile.StartupProfile = {
+        "startup_time": 10.0,
+        "import_times": {
+            "a": 0.1,
+            "b": 0.3,
+            "c": 0.2,
+            "d": 0.4,
+            "requirements": 0.5,
+            "with_requirements": 0.5,
+            "missing_dependency": 0.5,
+            "stage_1": 0.5,
+        },
+        "setup_times": {},
+        "unused_preloaded_platforms": {},
+        "storage_load_times": {},
+    }
+    integrations = {
+        "d": _mock_integration("d", {"a", "b", "c"}),
+        "c": _mock_integration("c", {"a"}),
+        "b": _mock_integration("b", set()),
+        "a": _mock_integration("a", set()),
+        "requirements": _mock_integration("requirements", set()),
+        "with_requirements": _mock_integration("with_requirements", {"requirements"}),
+        "missing_dependency": _mock_integration("missing_dependency", {"missing"}),
+        "stage_1": _mock_integration("stage_1", set()),
+    }
+    integrations["requirements"].requirements = ["package==1.0"]
+
+    assert [
+        integration.domain
+        for integration in startup_profile.get_pre_import_order(
+            profile, integrations, {"stage_1"}
+        )
+    ] == ["b", "a", "c", "d"]
+
+
+def test_startup_report(tmp_path: Path) -> None:
+    """Test the report of the last startup."""
+    assert startup_profile.startup_report(str(tmp_path)) == (
+        "No startup profile found, start Home Assistant first"
+    )
+
+    storage_dir = tmp_path / ".storage"
+    storage_dir.mkdir()
+    (storage_dir / startup_profile.STORAGE_KEY).write_text(
+        json.dumps(
+            {
+                "version": startup_profile.STORAGE_VERSION,
+                "key": startup_profile.STORAGE_KEY,
+                "data": {
+                    "startup_time": 42.123,
+                    "import_times": {"http": 0.5, "zha": 1.25},
+                    "setup_times": {"http": 0.25, "zha": 3.0, "automation": 0.1},
+                    "unused_preloaded_platforms": {
+                        "zha": ["diagnostics", "logbook"],
+                        "http": ["config_flow"],
+                    },
+                    "storage_load_times": {"core.entity_registry": 0.5, "http": 0.01},
+                },
+            }
+        )
+    )
+
+    assert startup_profile.startup_report(str(tmp_path)).splitlines() == [
+        "Startup took 42.12s",
+        "Integration    Import     Setup",
+        "zha            1.250s    3.000s",
+        "http           0.500s    0.250s",
+        "automation     0.000s    0.100s",
+        "Preloaded platforms which were not used:",
+        "http         config_flow",
+        "zha          diagnostics, logbook",
+        "Storage files loaded:",
+        "core.entity_registry    0.500s",
+        "http                    0.010s",
+    ]
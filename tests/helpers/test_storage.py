@@ -667,6 +667,192 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+def _read_file(path: str) -> str:
+    """Read a file."""
+    with open(path, encoding="utf-8") as fdesc:
+        return fdesc.read()
+
+
+def _write_file(path: str, text: str) -> None:
+    """Write a file."""
+    with open(path, "w", encoding="utf-8") as fdesc:
+        fdesc.write(text)
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends changes and replays them on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = {"items": [{"id": str(idx), "name": "item"} for idx in range(20)]}
+        await store.async_save(data)
+
+        snapshot = await hass.async_add_executor_job(_read_file, store.path)
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        journal_id = json.loads(snapshot)["journal"]
+        assert json.loads(journal) == {"journal": journal_id}
+
+        data["items"][5]["name"] = "renamed"
+        del data["items"][10]
+        data["new"] = True
+        await store.async_save(data)
+        # Saving the same data again does not add to the journal
+        await store.async_save(data)
+
+        assert await hass.async_add_executor_job(_read_file, store.path) == snapshot
+        lines = (
+            await hass.async_add_executor_job(_read_file, store.journal_path)
+        ).splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1]) == [
+            [
+                "d",
+                {
+                    "data": [
+                        "d",
+                        {
+                            "items": ["l", 5, 11, data["items"][5:10]],
+                            "new": ["=", True],
+                        },
+                        [],
+                    ]
+                },
+                [],
+            ]
+        ]
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted when it grew too large and when stopping."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"value": "x" * 100})
+        await store.async_save({"value": "y" * 100})
+        journal_size = os.path.getsize(store.journal_path)
+
+        # The journal grew to more than half of the size of the file
+        await store.async_save({"value": "z" * 100})
+        assert os.path.getsize(store.journal_path) < journal_size
+        assert json.loads(await hass.async_add_executor_job(_read_file, store.path))[
+            "data"
+        ] == {"value": "z" * 100}
+
+        await store.async_save({"value": "x" * 100})
+        hass.set_state(CoreState.stopping)
+        store.async_delay_save(lambda: {"value": "stopped"}, 1)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert json.loads(await hass.async_add_executor_job(_read_file, store.path))[
+            "data"
+        ] == {"value": "stopped"}
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        assert len(journal.splitlines()) == 1
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted on the final write without a pending save."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"value": "x" * 100})
+        await store.async_save({"value": "y"})
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        assert len(journal.splitlines()) == 2
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert json.loads(await hass.async_add_executor_job(_read_file, store.path))[
+            "data"
+        ] == {"value": "y"}
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        assert len(journal.splitlines()) == 1
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_appended_after_load(tmpdir: py.path.local) -> None:
+    """Test saves after loading append to the journal of the loaded file."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": [1, 2, 3], "name": "x" * 100})
+        await store.async_save({"items": [1, 2, 4], "name": "x" * 100})
+        snapshot = await hass.async_add_executor_job(_read_file, store.path)
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = await store2.async_load()
+        assert data == {"items": [1, 2, 4], "name": "x" * 100}
+        # Changing the loaded data does not change what is compared to
+        data["items"].append(5)
+        # Values of another type are changes even if they compare equal
+        await store2.async_save({"items": [1, 2, 4.0], "name": "x" * 100})
+
+        assert await hass.async_add_executor_job(_read_file, store.path) == snapshot
+        lines = (
+            await hass.async_add_executor_job(_read_file, store.journal_path)
+        ).splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[2]) == [
+            ["d", {"data": ["d", {"items": ["l", 2, 3, [4.0]]}, []]}, []]
+        ]
+
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = await store3.async_load()
+        assert data == {"items": [1, 2, 4.0], "name": "x" * 100}
+        assert type(data["items"][2]) is float
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_stale_or_incomplete(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test stale journals and incomplete changes are not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"a": 1, "b": 1})
+        await store.async_save({"a": 2, "b": 1})
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+
+        # Writing the last change was interrupted
+        await hass.async_add_executor_job(
+            _write_file, store.journal_path, journal + '[["d",{"data":["d",{"b":'
+        )
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"a": 2, "b": 1}
+        assert "Ignoring incomplete change in the journal" in caplog.text
+
+        # The journal of another file is not replayed
+        journal_id = json.loads(journal.splitlines()[0])["journal"]
+        await hass.async_add_executor_job(
+            _write_file, store.journal_path, journal.replace(journal_id, "0" * 26)
+        )
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store3.async_load() == {"a": 1, "b": 1}
+
+        await store3.async_remove()
+        assert not os.path.exists(store.path)
+        assert not os.path.exists(store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1046,6 +1232,46 @@ async def test_store_manager_caching(
         await hass.async_stop(force=True)
 
 
+async def test_store_manager_load_while_preloading(tmpdir: py.path.local) -> None:
+    """Test a store waits for its file if it is being preloaded."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        tmp_storage.join("integration1").write_binary(
+            json_bytes({"data": {"integration1": "integration1"}, "version": 1})
+        )
+        tmp_storage.join("empty").write_binary(b"")
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        preload_task = hass.async_create_task(
+            store_manager.async_preload(["integration1", "empty"])
+        )
+        assert not preload_task.done()
+
+        integration1 = storage.Store(hass, 1, "integration1")
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json", side_effect=OSError
+        ):
+            assert await integration1.async_load() == {"integration1": "integration1"}
+        await preload_task
+
+        assert store_manager.async_fetch("empty") is None
+        # Stores loaded by Home Assistant itself are timed as well
+        assert store_manager.async_get_load_timings().keys() >= {
+            "integration1",
+            "empty",
+        }
+
+        await hass.async_stop(force=True)
+
+
 async def test_store_manager_sub_dirs(tmpdir: py.path.local) -> None:
     """Test store manager ignores subdirs."""
     loop = asyncio.get_running_loop()
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from lru import LRU
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -5166,27 +5167,110 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared by templates with the same source."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    template.COMPILED_TEMPLATE_LRU.clear()
+    hits, misses = template.COMPILED_TEMPLATE_LRU.get_stats()
+
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.COMPILED_TEMPLATE_LRU.get_stats() == (hits, misses + 1)
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.COMPILED_TEMPLATE_LRU.get_stats() == (hits + 1, misses + 1)
+    assert tpl2._compiled_code is tpl._compiled_code
 
+    # The compiled template outlives the templates using it
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert ("normal", template_string) in template.COMPILED_TEMPLATE_LRU
+
+    # Each environment type has its own compiled templates
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    limited_env.compile(template_string)
+    assert ("limited", template_string) in template.COMPILED_TEMPLATE_LRU
+
+    with patch.object(template, "COMPILED_TEMPLATE_LRU", LRU(1)):
+        template.Template("{{ 1 }}", hass).ensure_valid()
+        template.Template("{{ 2 }}", hass).ensure_valid()
+        assert list(template.COMPILED_TEMPLATE_LRU.keys()) == [("normal", "{{ 2 }}")]
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states('sensor.temperature') | float * 2 }}",
+        "{{ is_state('light.kitchen', 'on') and is_state('light.hall', 'on') }}",
+        "{{ state_attr('light.kitchen', 'brightness') + 1 }}",
+        "{{ states.sensor.temperature.state | int(0) > 20 }}",
+        "{{ states.light.kitchen.attributes.brightness / 255 * 100 }}",
+        "{{ 'on' if is_state('light.kitchen', 'on') else 'off' }}",
+        "{{ states('sensor.temperature') ~ ' °C' }}",
+        "{{ 1 < states('sensor.temperature') | float < 30 }}",
+        "{{ [1, 2, states('sensor.temperature') | float | round] }}",
+        "{{ not is_state('light.hall', 'on') }}",
+        "{{ value | float(0) * -1 }}",
+        "{{ states.light | count }}",
+    ],
+)
+async def test_fast_path(hass: HomeAssistant, template_string: str) -> None:
+    """Test simple templates render the same with the fast path as with Jinja."""
+    hass.states.async_set("sensor.temperature", "21.5")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 128})
+    hass.states.async_set("light.hall", "off")
+
+    tpl = template.Template(template_string, hass)
+    info = tpl.async_render_to_info({"value": "3"})
+    assert tpl._fast_path is not None
+
+    template.FAST_PATH_TEMPLATE_LRU.clear()
+    with patch.object(template, "compile_fast_path", return_value=None):
+        jinja_tpl = template.Template(template_string, hass)
+        jinja_info = jinja_tpl.async_render_to_info({"value": "3"})
+    template.FAST_PATH_TEMPLATE_LRU.clear()
+    assert jinja_tpl._fast_path is None
+
+    assert info.result() == jinja_info.result()
+    assert type(info.result()) is type(jinja_info.result())
+    assert info.entities == jinja_info.entities
+    assert info.domains == jinja_info.domains
+    assert info.domains_lifecycle == jinja_info.domains_lifecycle
+    assert info.all_states == jinja_info.all_states
+
+
+async def test_fast_path_fallback(hass: HomeAssistant) -> None:
+    """Test templates the fast path does not handle are rendered with Jinja."""
+    tpl = template.Template("{% if true %}1{% endif %}", hass)
+    assert tpl.async_render() == 1
+    assert tpl._fast_path is None
+
+    tpl = template.Template("{{ 1 }} {{ 2 }}", hass)
+    assert tpl.async_render() == "1 2"
+    assert tpl._fast_path is None
+
+    # Filters using the Jinja context and undefined variables
+    # are left to Jinja when rendering
+    tpl = template.Template("{{ [1, 2] | map('string') | list }}", hass)
+    assert tpl.async_render() == ["1", "2"]
+    assert tpl._fast_path is None
+
+    tpl = template.Template("{{ missing | default(5) }}", hass)
+    assert tpl.async_render() == 5
+    assert tpl._fast_path is None
+
+    # The sandbox still applies
+    tpl = template.Template("{{ [].append(1) }}", hass)
+    with pytest.raises(TemplateError):
+        tpl.async_render()
+
+    tpl = template.Template("{{ states('sensor.missing') | float }}", hass)
+    with pytest.raises(TemplateError, match="float got invalid input 'unknown'"):
+        tpl.async_render()
+    assert tpl._fast_path is not None
 
 
 def test_is_template_string() -> None:
@@ -5307,6 +5391,63 @@ async def test_lifecycle(hass: HomeAssistant) -> None:
     assert info.filter_lifecycle("sensor.removed") is True
 
 
+async def test_render_to_info_iterated_states(hass: HomeAssistant) -> None:
+    """Test collecting what is read from the states iterated over."""
+    hass.states.async_set("sensor.battery", "50", {"device_class": "battery"})
+    hass.states.async_set("sensor.power", "10", {"device_class": "power"})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+
+    def _changed(info: template.RenderInfo, entity_id: str, *args: Any) -> bool:
+        old_state = hass.states.get(entity_id)
+        hass.states.async_set(entity_id, *args)
+        return info.filter_state_change(old_state, hass.states.get(entity_id))
+
+    info = template.Template(
+        "{{ states.sensor | selectattr('attributes.device_class', 'eq', 'battery')"
+        " | map(attribute='entity_id') | list }}",
+        hass,
+    ).async_render_to_info()
+    assert_result_info(info, ["sensor.battery"], [], ["sensor"])
+    assert info.iterated_properties == {"sensor": set()}
+    assert info.iterated_attributes == {"sensor": {"device_class"}}
+    assert not _changed(info, "sensor.power", "20", {"device_class": "power"})
+    assert _changed(info, "sensor.power", "20", {"device_class": "battery"})
+
+    info = template.Template(
+        "{% for light in states.light %}{{ light.state }}{% endfor %}", hass
+    ).async_render_to_info()
+    assert info.iterated_properties == {"light": {"state"}}
+    assert not _changed(info, "light.kitchen", "on", {"brightness": 50})
+    assert _changed(info, "light.kitchen", "off", {"brightness": 50})
+
+    info = template.Template(
+        "{{ states | map(attribute='attributes') | list | to_json }}", hass
+    ).async_render_to_info()
+    assert info.all_states is True
+    assert not info.iterated_attributes
+    assert _changed(info, "light.kitchen", "off", {"brightness": 100})
+
+    info = template.Template(
+        "{{ states.light | map(attribute='last_changed_timestamp') | list }}", hass
+    ).async_render_to_info()
+    assert _changed(info, "light.kitchen", "off", {"brightness": 50})
+
+    info = template.Template(
+        "{% for light in states.light %}{{ light.attributes.copy() }}{% endfor %}",
+        hass,
+    ).async_render_to_info()
+    assert info.iterated_properties == {"light": {"attributes"}}
+    assert not info.iterated_attributes
+    assert _changed(info, "light.kitchen", "off", {"brightness": 20})
+
+    info = template.Template(
+        "{{ states.light | selectattr('state', 'eq', 'off') | list | count }}"
+        " {{ states('light.kitchen') }}",
+        hass,
+    ).async_render_to_info()
+    assert _changed(info, "light.kitchen", "off", {"brightness": 20})
+
+
 async def test_template_timeout(hass: HomeAssistant) -> None:
     """Test to see if a template will timeout."""
     for i in range(2):
@@ -528,6 +528,27 @@ async def test_stop_refresh_on_ha_stop(
     assert crd.data == 2
 
 
+async def test_spread_refresh_on_ha_start(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test the refresh interval is spread when Home Assistant is starting."""
+    hass.set_state(CoreState.starting)
+    with patch("homeassistant.helpers.update_coordinator.random", return_value=0.5):
+        crd.async_add_listener(Mock())
+
+    update_interval = crd.update_interval
+
+    async_fire_time_changed(hass, utcnow() + update_interval * 0.4)
+    await hass.async_block_till_done()
+    assert crd.data is None
+
+    async_fire_time_changed(hass, utcnow() + update_interval * 0.6)
+    await hass.async_block_till_done()
+    assert crd.data == 1
+
+    await crd.async_shutdown()
+
+
 @pytest.mark.parametrize(
     "err_msg",
     [
@@ -1165,6 +1165,99 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_event_data_match_listener(hass: HomeAssistant) -> None:
+    """Test we can prefilter events with an indexed event data match."""
+    calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen(
+        "test",
+        listener,
+        event_data_match={"domain": "light", "service": "turn_on"},
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test", {"domain": "switch", "service": "turn_on"})
+    hass.bus.async_fire("test", {"domain": "light", "service": "turn_off"})
+    hass.bus.async_fire("test", {"domain": "light"})
+    hass.bus.async_fire("test", {"domain": ["light"], "service": "turn_on"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"domain": "light", "service": "turn_on"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"domain": "light", "service": "turn_on"}
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    hass.bus.async_fire("test", {"domain": "light", "service": "turn_on"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+
+async def test_eventbus_event_data_match_with_filter(hass: HomeAssistant) -> None:
+    """Test event_filter runs after the event data match."""
+    calls = []
+    filtered = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        filtered.append(event_data)
+        return event_data["allow"]
+
+    unsub = hass.bus.async_listen(
+        "test",
+        listener,
+        event_filter=mock_filter,
+        event_data_match={"entity_id": "light.kitchen"},
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.other", "allow": True})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "allow": False})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "allow": True})
+    await hass.async_block_till_done()
+
+    assert len(filtered) == 2
+    assert len(calls) == 1
+
+    unsub()
+
+
+async def test_eventbus_event_data_match_invalid(hass: HomeAssistant) -> None:
+    """Test invalid event data matches are rejected."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError, match="must be hashable"):
+        hass.bus.async_listen(
+            "test", listener, event_data_match={"entity_id": ["light.kitchen"]}
+        )
+
+    with pytest.raises(HomeAssistantError, match="not supported"):
+        hass.bus.async_listen(
+            MATCH_ALL, listener, event_data_match={"entity_id": "light.kitchen"}
+        )
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1653,194 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states at once fires individual and batched events."""
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "on")
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batches: list[list[ha.Event]] = []
+    batch_single_events: list[ha.Event] = []
+
+    @ha.callback
+    def single_listener(event: ha.Event) -> None:
+        batch_single_events.append(event)
+
+    @ha.callback
+    def batch_listener(events: list[ha.Event]) -> None:
+        # Every state of the batch is committed before any listener runs
+        assert hass.states.get("light.new").state == "on"
+        batches.append(events)
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, single_listener, batch_listener=batch_listener
+    )
+
+    hass.states.async_set_many(
+        [
+            ha.StateWrite("light.bowl", "on", {"brightness": 100}),
+            ha.StateWrite("light.kitchen", "on"),
+            ha.StateWrite("Light.New", "on"),
+            ha.StateWrite("light.bowl", "off", {"brightness": 100}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in state_changed_events] == [
+        "light.bowl",
+        "light.new",
+        "light.bowl",
+    ]
+    assert batch_single_events == []
+    # The state reported event of the kitchen light splits the batch
+    assert len(batches) == 2
+    assert batches[0] + batches[1] == state_changed_events
+
+    bowl_events = [state_changed_events[0], state_changed_events[2]]
+    assert bowl_events[1].data["old_state"] is bowl_events[0].data["new_state"]
+    assert hass.states.get("light.bowl").state == "off"
+    # Attributes are shared when they did not change
+    assert (
+        hass.states.get("light.bowl").attributes
+        is bowl_events[0].data["old_state"].attributes
+    )
+
+    # Single writes still reach the single listener
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(batch_single_events) == 1
+    assert len(batches) == 2
+
+
+async def test_statemachine_async_set_many_reported(hass: HomeAssistant) -> None:
+    """Test setting many states at once fires state reported events."""
+    hass.states.async_set("light.bowl", "on")
+    state_reported_events = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        state_reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, listener, event_data_match={"entity_id": "light.bowl"}
+    )
+    hass.states.async_set_many([ha.StateWrite("light.bowl", "on", timestamp=1234)])
+    await hass.async_block_till_done()
+
+    assert len(state_reported_events) == 1
+    assert hass.states.get("light.bowl").last_reported_timestamp == 1234
+
+
+async def test_statemachine_async_set_many_order(hass: HomeAssistant) -> None:
+    """Test setting many states at once fires the events in order."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.kitchen", "on")
+    events: list[ha.Event] = []
+    batches: list[list[ha.Event]] = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        events.append(event)
+
+    @ha.callback
+    def batch_listener(batch: list[ha.Event]) -> None:
+        batches.append(batch)
+
+    @ha.callback
+    def event_filter(event_data: dict[str, Any]) -> bool:
+        return True
+
+    for event_type in (EVENT_STATE_CHANGED, EVENT_STATE_REPORTED):
+        hass.bus.async_listen(event_type, listener, event_filter)
+        hass.bus.async_listen(
+            event_type, listener, event_filter, batch_listener=batch_listener
+        )
+    hass.states.async_set_many(
+        [
+            ha.StateWrite("light.bowl", "off"),
+            ha.StateWrite("light.kitchen", "on"),
+            ha.StateWrite("light.bowl", "on"),
+            ha.StateWrite("light.kitchen", "off"),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    expected = [
+        (EVENT_STATE_CHANGED, "light.bowl"),
+        (EVENT_STATE_REPORTED, "light.kitchen"),
+        (EVENT_STATE_CHANGED, "light.bowl"),
+        (EVENT_STATE_CHANGED, "light.kitchen"),
+    ]
+    assert [(event.event_type, event.data["entity_id"]) for event in events] == (
+        expected
+    )
+    assert [
+        [(event.event_type, event.data["entity_id"]) for event in batch]
+        for batch in batches
+    ] == [expected[:1], expected[1:2], expected[2:]]
+
+
+async def test_statemachine_async_set_many_invalid(hass: HomeAssistant) -> None:
+    """Test an invalid state leaves the state machine untouched."""
+    hass.states.async_set("light.bowl", "off")
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ha.StateWrite("light.bowl", "on"),
+                ha.StateWrite("light.kitchen", "x" * 256),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "off"
+    assert hass.states.get("light.kitchen") is None
+    assert len(state_changed_events) == 0
+
+
+async def test_statemachine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test states with equal attributes share one attribute mapping."""
+    attrs = {"unit_of_measurement": "%", "device_class": "battery"}
+    hass.states.async_set("sensor.one", "50", attrs)
+    hass.states.async_set("sensor.two", "60", dict(attrs))
+    hass.states.async_set("sensor.three", "70", {**attrs, "supported_features": 1})
+    hass.states.async_set("sensor.four", "70", {**attrs, "supported_features": True})
+    hass.states.async_set("sensor.five", "80", {**attrs, "options": ["a"]})
+    hass.states.async_set("sensor.six", "80", {**attrs, "options": ["a"]})
+
+    one = hass.states.get("sensor.one")
+    assert one.attributes is hass.states.get("sensor.two").attributes
+    assert isinstance(one.attributes, ReadOnlyDict)
+
+    # Equal values of different types are not shared
+    three = hass.states.get("sensor.three")
+    four = hass.states.get("sensor.four")
+    assert three.attributes is not four.attributes
+    assert four.attributes["supported_features"] is True
+
+    # Attributes with non scalar values are not interned
+    five = hass.states.get("sensor.five")
+    six = hass.states.get("sensor.six")
+    assert five.attributes == six.attributes
+    assert five.attributes is not six.attributes
+
+
+async def test_statemachine_evict_serialized_caches(hass: HomeAssistant) -> None:
+    """Test the serialized forms of states can be evicted and rebuilt."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    as_dict_json = state.as_dict_json
+    compressed_state_json = state.as_compressed_state_json
+    assert "as_dict_json" in state._cache
+
+    hass.states.async_evict_serialized_caches()
+
+    assert "as_dict_json" not in state._cache
+    assert "as_compressed_state_json" not in state._cache
+    assert state.as_dict_json == as_dict_json
+    assert state.as_compressed_state_json == compressed_state_json
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
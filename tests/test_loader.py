@@ -14,12 +14,19 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
+from homeassistant.setup import async_set_domains_to_be_loaded
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_get_persistent_notifications,
+    flush_store,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -249,6 +256,16 @@ async def test_async_get_component(hass: HomeAssistant) -> None:
     assert integration.get_platform("light") == hue_light
 
 
+async def test_async_get_import_timings(hass: HomeAssistant) -> None:
+    """Test the time it took to import a component is recorded."""
+    assert "hue" not in loader.async_get_import_timings(hass)
+
+    integration = await loader.async_get_integration(hass, "hue")
+    await integration.async_get_component()
+
+    assert loader.async_get_import_timings(hass)["hue"] >= 0
+
+
 async def test_get_integration_exceptions(hass: HomeAssistant) -> None:
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "hue")
@@ -1070,6 +1087,88 @@ async def test_get_custom_components_recovery_mode(hass: HomeAssistant) -> None:
     assert await loader.async_get_custom_components(hass) == {}
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_manifest_index_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the manifests of the integrations read are saved in the index."""
+    await loader.async_get_integration(hass, "hue")
+    await loader.async_get_integration(hass, "test_package")
+    await flush_store(hass.data[loader.DATA_MANIFEST_INDEX]._store)
+
+    data = hass_storage[loader.MANIFEST_INDEX_KEY]["data"]
+    assert data["ha_version"] == __version__
+    hue_path = pathlib.Path(hue.__file__).parent
+    hue_entry = data["integrations"][str(hue_path)]
+    assert hue_entry["mtimes"] == [
+        hue_path.stat().st_mtime_ns,
+        (hue_path / "manifest.json").stat().st_mtime_ns,
+    ]
+    assert hue_entry["manifest"]["name"] == "Philips Hue"
+    assert "light.py" in hue_entry["files"]
+    custom_path = pathlib.Path(hass.config.path("custom_components", "test_package"))
+    custom_entry = data["integrations"][str(custom_path)]
+    assert custom_entry["mtimes"] == [
+        custom_path.stat().st_mtime_ns,
+        (custom_path / "manifest.json").stat().st_mtime_ns,
+    ]
+    assert "test_package" in next(iter(data["custom_components"].values()))[1]
+
+
+@pytest.mark.parametrize(
+    ("ha_version", "mtimes", "hue_name", "custom_name"),
+    [
+        (__version__, True, "Cached Hue", "Cached Test Package"),
+        ("2024.1.0", True, "Philips Hue", "Test Package"),
+        (__version__, False, "Philips Hue", "Test Package"),
+    ],
+)
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_manifest_index_loaded(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    ha_version: str,
+    mtimes: bool,
+    hue_name: str,
+    custom_name: str,
+) -> None:
+    """Test manifests are read from the index while they are current."""
+    hue_path = pathlib.Path(hue.__file__).parent
+    custom_path = pathlib.Path(hass.config.path("custom_components", "test_package"))
+    custom_manifest = json_loads((custom_path / "manifest.json").read_text())
+    hass_storage[loader.MANIFEST_INDEX_KEY] = {
+        "version": loader.MANIFEST_INDEX_VERSION,
+        "data": {
+            "ha_version": ha_version,
+            "integrations": {
+                str(hue_path): {
+                    "mtimes": [
+                        hue_path.stat().st_mtime_ns if mtimes else 0,
+                        (hue_path / "manifest.json").stat().st_mtime_ns,
+                    ],
+                    "manifest": {"domain": "hue", "name": "Cached Hue"},
+                    "files": ["__init__.py"],
+                },
+                str(custom_path): {
+                    "mtimes": [
+                        custom_path.stat().st_mtime_ns if mtimes else 0,
+                        (custom_path / "manifest.json").stat().st_mtime_ns,
+                    ],
+                    "manifest": {**custom_manifest, "name": "Cached Test Package"},
+                    "files": ["__init__.py"],
+                },
+            },
+            "custom_components": {},
+        },
+    }
+
+    hue_integration = await loader.async_get_integration(hass, "hue")
+    custom_integration = await loader.async_get_integration(hass, "test_package")
+
+    assert hue_integration.name == hue_name
+    assert custom_integration.name == custom_name
+
+
 async def test_custom_integration_missing_version(hass: HomeAssistant) -> None:
     """Test trying to load a custom integration without a version twice does not deadlock."""
     with pytest.raises(loader.IntegrationNotFound):
@@ -1362,8 +1461,14 @@ async def test_async_get_component_preloads_config_and_config_flow(
     ):
         await executor_import_integration.async_get_component()
 
-    assert len(platform_exists_calls[0]) == len(loader.BASE_PRELOAD_PLATFORMS)
-    assert mock_import.call_count == 1 + len(loader.BASE_PRELOAD_PLATFORMS)
+    # Platforms processed by integrations which are not loaded are skipped
+    preloaded_platforms = [
+        platform
+        for platform in loader.BASE_PRELOAD_PLATFORMS
+        if platform not in loader.LAZY_PRELOAD_PLATFORMS
+    ]
+    assert platform_exists_calls[0] == preloaded_platforms
+    assert mock_import.call_count == 1 + len(preloaded_platforms)
     assert (
         mock_import.call_args_list[0][0][0]
         == "homeassistant.components.executor_import"
@@ -1376,11 +1481,45 @@ async def test_async_get_component_preloads_config_and_config_flow(
         "homeassistant.components.executor_import.config_flow",
         *(
             f"homeassistant.components.executor_import.{platform}"
-            for platform in loader.BASE_PRELOAD_PLATFORMS
+            for platform in preloaded_platforms
         ),
     }
 
 
+async def test_async_get_component_preloads_platforms_of_loaded_integrations(
+    hass: HomeAssistant,
+) -> None:
+    """Verify platforms are preloaded if the integration processing them is loaded."""
+    integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+    hass.data[loader.DATA_INTEGRATIONS]["executor_import"] = integration
+    hass.config.components.add("diagnostics")
+    async_set_domains_to_be_loaded(hass, {"logbook"})
+
+    with (
+        patch("homeassistant.loader.importlib.import_module"),
+        patch.object(
+            integration, "platforms_exists", side_effect=lambda platforms: platforms
+        ) as mock_platforms_exists,
+    ):
+        await integration.async_get_component()
+
+    preloaded = mock_platforms_exists.call_args[0][0]
+    assert "config_flow" in preloaded
+    assert "diagnostics" in preloaded
+    assert "logbook" in preloaded
+    assert "recorder" not in preloaded
+    assert loader.async_get_unused_preloaded_platforms(hass) == {
+        "executor_import": sorted(preloaded)
+    }
+
+    integration.get_platform_cached("diagnostics")
+    assert "diagnostics" not in (
+        loader.async_get_unused_preloaded_platforms(hass)["executor_import"]
+    )
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
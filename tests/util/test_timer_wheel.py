@@ -0,0 +1,143 @@
+"""Test the timer wheel."""
+
+import asyncio
+
+import pytest
+
+from homeassistant.util.async_ import get_scheduled_timer_handles
+from homeassistant.util.timer_wheel import (
+    SLOTS_PER_LEVEL,
+    TICK,
+    TimerWheel,
+    TimerWheelHandle,
+    TimerWheelSlot,
+    TimerWheelStats,
+    get_scheduled_timers,
+)
+
+
+def _active_timers(
+    loop: asyncio.AbstractEventLoop,
+) -> set[asyncio.TimerHandle | TimerWheelHandle]:
+    """Return the timers which are not cancelled."""
+    return {timer for timer in get_scheduled_timers(loop) if not timer.cancelled()}
+
+
+async def test_timers_fire_together_in_a_tick() -> None:
+    """Test timers due in the same tick share a handle and fire in order."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+    done = loop.create_future()
+
+    tick_end = (int(loop.time() / TICK) + 2) * TICK
+    wheel.async_call_at(tick_end - TICK / 2, calls.append, "second")
+    wheel.async_call_at(tick_end - TICK * 3 / 4, calls.append, "first")
+    wheel.async_call_at(tick_end - TICK / 4, done.set_result, None)
+
+    assert wheel.async_stats() == TimerWheelStats(
+        timers=3, handles=1, scheduled=3, fired=0, ticks=0, cascaded=0
+    )
+    await done
+    assert loop.time() >= tick_end - TICK / 4
+    assert calls == ["first", "second"]
+    assert wheel.async_stats() == TimerWheelStats(
+        timers=0, handles=0, scheduled=3, fired=3, ticks=1, cascaded=0
+    )
+
+
+async def test_cancel() -> None:
+    """Test cancelling timers."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+
+    timer = wheel.async_call_later(0, calls.append, "cancelled")
+    timer2 = wheel.async_call_later(0, calls.append, "fired")
+    timer.cancel()
+    assert timer.cancelled()
+    assert not timer2.cancelled()
+    assert wheel.async_stats().timers == 1
+
+    await asyncio.sleep(TICK * 2)
+    assert calls == ["fired"]
+    assert timer2.cancelled()
+    # Cancelling a timer which fired does nothing
+    timer2.cancel()
+
+    # Cancelling the last timer of a slot cancels its handle
+    timer = wheel.async_call_later(100, calls.append, "cancelled")
+    assert wheel.async_stats().handles == 1
+    timer.cancel()
+    assert wheel.async_stats() == TimerWheelStats(
+        timers=0, handles=0, scheduled=3, fired=1, ticks=1, cascaded=0
+    )
+    assert _active_timers(loop) == set()
+
+
+async def test_timer_cancelled_by_timer_in_same_tick() -> None:
+    """Test a timer can cancel a later timer of the same tick."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+
+    now = loop.time()
+    wheel.async_call_at(now, lambda: timer.cancel())
+    timer = wheel.async_call_at(now, calls.append, "cancelled")
+
+    await asyncio.sleep(TICK * 2)
+    assert calls == []
+    assert wheel.async_stats().fired == 1
+
+
+async def test_later_timers_move_to_lower_levels() -> None:
+    """Test timers of higher levels are moved down when their slot starts."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[float] = []
+
+    delay = TICK * SLOTS_PER_LEVEL * 2
+    timer = wheel.async_call_later(delay, calls.append, delay)
+    timer2 = wheel.async_call_later(delay * SLOTS_PER_LEVEL, calls.append, delay)
+    assert wheel.async_stats().handles == 2
+    assert _active_timers(loop) == {timer, timer2}
+
+    # Run the handles early to pretend their slots started
+    for handle in list(get_scheduled_timer_handles(loop)):
+        if handle._args and isinstance(handle._args[0], TimerWheelSlot):
+            handle._run()
+            handle.cancel()
+    assert wheel.async_stats().cascaded == 2
+    assert wheel.async_stats().handles == 2
+    assert calls == []
+    assert _active_timers(loop) == {timer, timer2}
+
+    wheel.async_fire_due(loop.time() + delay)
+    assert calls == [delay]
+    assert timer.cancelled()
+    assert not timer2.cancelled()
+
+    wheel.async_fire_due(loop.time(), fire_all=True)
+    assert calls == [delay, delay]
+    assert wheel.async_stats() == TimerWheelStats(
+        timers=0, handles=0, scheduled=2, fired=2, ticks=0, cascaded=2
+    )
+
+
+async def test_exception_in_timer(caplog: pytest.LogCaptureFixture) -> None:
+    """Test an exception in a timer does not stop the other timers."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    calls: list[str] = []
+
+    def _raise() -> None:
+        raise ValueError("boom")
+
+    now = loop.time()
+    wheel.async_call_at(now, _raise)
+    wheel.async_call_at(now, calls.append, "fired")
+    wheel.async_fire_due(now)
+
+    assert calls == ["fired"]
+    assert "Exception in callback" in caplog.text
+    assert "boom" in caplog.text